@@ -1,9 +1,13 @@
+from .batch import Batch
+from .cache import Cache, HttpCache
 from .check import Check
+from .codec import Codec
 from .describe import *
 from .extract import *
 from .field import Field
 from .file import File
 from .header import Header
+from .index import Index
 from .inquiry import Inquiry
 from .metadata import Metadata
 from .package import Package
@@ -22,6 +26,7 @@ from .transform import *
 from .type import Type
 from .validate import *
 from . import checks
+from . import codecs
 from . import controls
 from . import dialects
 from . import errors
@@ -0,0 +1,180 @@
+from collections import OrderedDict
+from .helpers import cached_property
+from .parsers import JsonParser
+from .row import normalize_cells, create_cell_error_specs, create_errors
+from .row import BLANK_ROW_ERROR_SPEC
+
+
+class Batch(OrderedDict):
+    """Batch representation
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import Table`
+
+    This object is returned by `table.read_batches`. It's a column-oriented
+    counterpart of the Row: it maps every field name to a list of casted values
+    so the data can be passed to array-based tools without creating Row objects.
+
+    ```python
+    with Table("data/table.csv") as table:
+        for batch in table.read_batches(size=1000):
+            batch["id"] == [1, 2]
+    ```
+
+    Parameters:
+        data (any[][]): array of data arrays
+        schema (Schema): table schema
+        field_positions (int[]): table field positions
+        row_positions (int[]): row positions from 1
+        row_numbers (int[]): row numbers from 1
+
+    """
+
+    def __init__(self, data, *, schema, field_positions, row_positions, row_numbers):
+        assert len(data) == len(row_positions) == len(row_numbers)
+
+        # Set attributes
+        fields = schema.fields
+        self.__schema = schema
+        self.__field_positions = field_positions
+        self.__row_positions = row_positions
+        self.__row_numbers = row_numbers
+
+        # Normalize rows
+        # Errors are materialized on the first `batch.errors` access
+        # from the error specs (see `Row`)
+        row_specs = []
+        for cells in data:
+            row_specs.append(
+                normalize_cells(cells, fields=fields, field_positions=field_positions)
+            )
+
+        # Iterate columns
+        blank_rows = [True] * len(data)
+        field_number = 0
+        for field_position, field in zip(field_positions, fields):
+            field_number += 1
+
+            # Read column
+            sources = [cells[field_number - 1] for cells in data]
+            targets, column_notes = field.read_column(sources)
+            for index, source in enumerate(sources):
+                notes = column_notes[index]
+                type_note = notes.pop("type", None) if notes else None
+                if targets[index] is not None or type_note:
+                    blank_rows[index] = False
+
+                # Cell errors
+                if type_note or notes:
+                    row_specs[index].extend(
+                        create_cell_error_specs(
+                            source,
+                            type_note=type_note,
+                            notes=notes,
+                            field=field,
+                            field_number=field_number,
+                            field_position=field_position,
+                        )
+                    )
+
+            self[field.name] = targets
+
+        # Blank rows
+        self.__error_specs = []
+        for index, cells in enumerate(data):
+            specs = row_specs[index]
+            if blank_rows[index]:
+                specs = [BLANK_ROW_ERROR_SPEC]
+            if specs:
+                self.__error_specs.append((index, cells, specs))
+
+    @cached_property
+    def schema(self):
+        """
+        Returns:
+            Schema: table schema
+        """
+        return self.__schema
+
+    @cached_property
+    def field_positions(self):
+        """
+        Returns:
+            int[]: table field positions
+        """
+        return self.__field_positions
+
+    @cached_property
+    def row_positions(self):
+        """
+        Returns:
+            int[]: row positions from 1
+        """
+        return self.__row_positions
+
+    @cached_property
+    def row_numbers(self):
+        """
+        Returns:
+            int[]: row numbers from 1
+        """
+        return self.__row_numbers
+
+    @cached_property
+    def errors(self):
+        """
+        Returns:
+            Error[]: batch errors ordered by rows
+        """
+        result = []
+        for index, cells, specs in self.__error_specs:
+            result.extend(
+                create_errors(
+                    cells,
+                    specs,
+                    row_number=self.__row_numbers[index],
+                    row_position=self.__row_positions[index],
+                )
+            )
+        return result
+
+    @cached_property
+    def valid(self):
+        """
+        Returns:
+            bool: if batch valid
+        """
+        return not self.__error_specs
+
+    # Import/Export
+
+    def to_dict(self, *, json=False):
+        """
+        Parameters:
+            json (bool): make data types compatible with JSON format
+
+        Returns:
+            dict: a batch as a dictionary of columns
+        """
+        if json:
+            result = {}
+            for field in self.__schema.fields:
+                column = self[field.name]
+                if field.type not in JsonParser.native_types:
+                    column = [field.write_cell(cell)[0] for cell in column]
+                result[field.name] = column
+            return result
+        return dict(self)
+
+    def to_list(self, *, json=False):
+        """
+        Parameters:
+            json (bool): make data types compatible with JSON format
+
+        Returns:
+            list[]: a batch as a list of columns
+        """
+        if json:
+            return list(self.to_dict(json=True).values())
+        return list(self.values())
@@ -0,0 +1,287 @@
+import io
+import os
+import json
+import hashlib
+import tempfile
+import requests
+import urllib3
+from . import config
+
+
+class Cache:
+    """Cache representation
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import Cache`
+
+    It's a persistent key-value store keeping JSON-serializable values in
+    a directory (one file per key) as `table` uses it to cache the inferred
+    metadata of local files. A value is written atomically so the cache
+    can be shared by concurrent processes, and a broken value is a cache miss.
+
+    ```python
+    cache = Cache(".frictionless")
+    cache.set({"path": "table.csv"}, {"encoding": "utf-8"})
+    cache.get({"path": "table.csv"}) == {"encoding": "utf-8"}
+    ```
+
+    Parameters:
+        path (str): cache directory; it's created if it doesn't exist
+
+    """
+
+    def __init__(self, path):
+        self.__path = str(path)
+
+    @property
+    def path(self):
+        """
+        Returns:
+            str: cache directory
+        """
+        return self.__path
+
+    def get(self, key, default=None):
+        """Get a value by key
+
+        Parameters:
+            key (any): JSON-serializable key
+            default? (any): value to return if the key is not found
+
+        Returns:
+            any: value or default
+        """
+        try:
+            with open(self.__locate(key), encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return default
+
+    def set(self, key, value):
+        """Set a value by key
+
+        Parameters:
+            key (any): JSON-serializable key
+            value (any): JSON-serializable value
+        """
+        os.makedirs(self.__path, exist_ok=True)
+        descriptor, path = tempfile.mkstemp(dir=self.__path, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(value, file)
+            os.replace(path, self.__locate(key))
+        except Exception:
+            os.remove(path)
+            raise
+
+    # Private
+
+    def __locate(self, key):
+        source = json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+        name = hashlib.blake2b(source, digest_size=16).hexdigest()
+        return os.path.join(self.__path, f"{name}.json")
+
+
+class HttpCache:
+    """HTTP cache representation
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import HttpCache`
+
+    It's a disk cache of HTTP responses used by the shared HTTP session
+    if it's set by `system.set_http_cache`. A cached response is validated
+    by a conditional request (using its ETag or Last-Modified) so an unchanged
+    body isn't downloaded again. Only responses having one of these validators
+    are cached and the least recently used ones are evicted to keep the cache
+    under its size.
+
+    ```python
+    system.set_http_cache(HttpCache(".frictionless/http"))
+    ```
+
+    Parameters:
+        path (str): cache directory; it's created if it doesn't exist
+        size? (int): cache size in bytes
+
+    """
+
+    def __init__(self, path, *, size=config.DEFAULT_HTTP_CACHE_SIZE):
+        self.__path = str(path)
+        self.__size = size
+
+    @property
+    def path(self):
+        """
+        Returns:
+            str: cache directory
+        """
+        return self.__path
+
+    @property
+    def size(self):
+        """
+        Returns:
+            int: cache size in bytes
+        """
+        return self.__size
+
+    def get(self, url):
+        """Get a cached response by url
+
+        Parameters:
+            url (str): url
+
+        Returns:
+            dict?: response's `headers` and `path` to its body
+        """
+        path = self.__locate(url)
+        try:
+            with open(f"{path}.json", encoding="utf-8") as file:
+                entry = json.load(file)
+            os.utime(f"{path}.data")
+        except (OSError, ValueError):
+            return None
+        return {"headers": entry["headers"], "path": f"{path}.data"}
+
+    def set(self, url, headers, byte_stream):
+        """Cache a response
+
+        Parameters:
+            url (str): url
+            headers (dict): response headers
+            byte_stream (io.ByteStream): response body
+
+        Returns:
+            dict: response's `headers` and `path` to its body
+        """
+        os.makedirs(self.__path, exist_ok=True)
+        path = self.__locate(url)
+        size = 0
+        descriptor, temporary = tempfile.mkstemp(dir=self.__path, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                for chunk in iter(lambda: byte_stream.read(io.DEFAULT_BUFFER_SIZE), b""):
+                    file.write(chunk)
+                    size += len(chunk)
+            os.replace(temporary, f"{path}.data")
+        except Exception:
+            os.remove(temporary)
+            raise
+        headers = {
+            name: value
+            for name, value in headers.items()
+            if name.lower() not in HTTP_CACHE_IGNORED_HEADERS
+        }
+        headers["Content-Length"] = str(size)
+        descriptor, temporary = tempfile.mkstemp(dir=self.__path, suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump({"url": url, "headers": headers}, file)
+        os.replace(temporary, f"{path}.json")
+        self.__evict(keep=f"{path}.data")
+        return {"headers": headers, "path": f"{path}.data"}
+
+    # Private
+
+    def __locate(self, url):
+        name = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.__path, name)
+
+    def __evict(self, *, keep):
+        entries = []
+        for name in os.listdir(self.__path):
+            if name.endswith(".data"):
+                path = os.path.join(self.__path, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.__size:
+                break
+            if path == keep:
+                continue
+            for target in [f"{path[:-5]}.json", path]:
+                try:
+                    os.remove(target)
+                except OSError:
+                    pass
+            total -= size
+
+
+# Internal
+
+
+HTTP_CACHE_IGNORED_HEADERS = [
+    "accept-ranges",
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "transfer-encoding",
+]
+
+
+class HttpCacheAdapter(requests.adapters.HTTPAdapter):
+    """HTTP adapter serving GET requests from the HTTP cache
+
+    A cached body is stored decoded so it's served without "Content-Encoding"
+    and "Accept-Ranges". Range requests bypass the cache.
+    """
+
+    def __init__(self, cache, **options):
+        super().__init__(**options)
+        self.__cache = cache
+
+    def send(self, request, **options):
+        if request.method != "GET" or "Range" in request.headers:
+            return super().send(request, **options)
+        entry = self.__cache.get(request.url)
+        if entry:
+            headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+            if "ETag" in headers:
+                request.headers["If-None-Match"] = headers["ETag"]
+            if "Last-Modified" in headers:
+                request.headers["If-Modified-Since"] = headers["Last-Modified"]
+        response = super().send(request, **{**options, "stream": True})
+        if entry and response.status_code == 304:
+            response.close()
+            return self.__build_cached_response(request, entry)
+        validated = "ETag" in response.headers or "Last-Modified" in response.headers
+        if response.status_code != 200 or not validated:
+            return response
+        with response:
+            response.raw.decode_content = True
+            entry = self.__cache.set(request.url, response.headers, response.raw)
+        return self.__build_cached_response(request, entry)
+
+    # Private
+
+    def __build_cached_response(self, request, entry):
+        raw = urllib3.HTTPResponse(
+            body=open(entry["path"], "rb"),
+            headers=entry["headers"],
+            status=200,
+            reason="OK",
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+# Internal
+
+
+def read_file_fingerprint(path, *, volume):
+    """Read a fingerprint of a local file to find out if it's changed
+
+    It's the file's size, modification time and a hash of its first bytes
+    (the time resolution of some filesystems is too low to rely on it only).
+    """
+    stat = os.stat(path)
+    with open(path, "rb") as file:
+        digest = hashlib.blake2b(file.read(volume), digest_size=16).hexdigest()
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "digest": digest}
@@ -11,6 +11,10 @@ class Check(Metadata):
 
     It's an interface for writing Frictionless checks.
 
+    A check can be run on independent shards of a table (e.g. for parallel
+    validation) if it's `mergeable`. Stateless checks only need to set this
+    flag while stateful checks also implement `partial_state` and `merge`.
+
     Parameters:
         descriptor? (str|dict): schema descriptor
 
@@ -19,6 +23,8 @@ class Check(Metadata):
 
     """
 
+    mergeable = False
+
     def __init__(self, descriptor=None):
         super().__init__(descriptor)
 
@@ -30,15 +36,38 @@ class Check(Metadata):
         """
         return self.__table
 
+    @property
+    def partial(self):
+        """
+        Returns:
+            bool: whether the connected table is a shard of a bigger table
+        """
+        return self.__partial
+
+    @property
+    def scope(self):
+        """
+        Returns:
+            str[]?: error codes to be reported (all if not set)
+        """
+        return self.__scope
+
     # Validation
 
-    def connect(self, table):
+    def connect(self, table, *, partial=False, scope=None):
         """Connect to the given table
 
         Parameters:
             table (Table): data table
+            partial? (bool): whether the table is a shard of a bigger table;
+                a stateful check might need to track more data to provide
+                its `check.partial_state`
+            scope? (str[]): error codes to be reported; a check can skip
+                creating errors out of the scope as they will be discarded
         """
         self.__table = table
+        self.__partial = partial
+        self.__scope = scope
 
     def prepare(self):
         """Called before validation"""
@@ -93,6 +122,46 @@ class Check(Metadata):
         """
         yield from []
 
+    # Merge
+
+    def partial_state(self):
+        """Called on a shard after its rows are validated
+
+        Row positions and numbers within a shard are local for the shard.
+
+        Returns:
+            any: a picklable check's state
+        """
+        return None
+
+    def merge(self, state, *, row_errors, row_position, row_number):
+        """Called on the main check for every shard in the shards' order
+
+        The check yields the shard's row errors it considers valid and
+        errors found comparing the shard's state to the merged state.
+        As the shard's rows are not available at this point the state
+        has to include all the data needed to create the latter.
+
+        Parameters:
+            state (any): a state returned by `check.partial_state` for the shard
+            row_errors (Error[]): errors yielded by `check.validate_row` for the shard
+                with row positions and numbers already shifted
+            row_position (int): the shard's row position offset
+            row_number (int): the shard's row number offset
+
+        Yields:
+            Error: found errors
+        """
+        yield from row_errors
+
+    def finalize(self):
+        """Called on the main check after all the shards are merged
+
+        Yields:
+            Error: found errors
+        """
+        yield from []
+
     # Metadata
 
     metadata_strict = True
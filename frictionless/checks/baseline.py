@@ -1,4 +1,5 @@
 from ..check import Check
+from ..index import Index
 from .. import errors
 
 
@@ -14,6 +15,7 @@ class BaselineCheck(Check):
 
     """
 
+    mergeable = True
     possible_Errors = [  # type: ignore
         # table
         errors.DialectError,
@@ -36,6 +38,19 @@ class BaselineCheck(Check):
         errors.ForeignKeyError,
     ]
 
+    def prepare(self):
+        schema = self.table.schema
+        self.__memory = {
+            "unique": {},
+            "primary": Index(size=self.table.index_size, hashed=self.table.index_hashed),
+        }
+        self.__rows = None
+        if self.partial:
+            if schema.primary_key or any(
+                f.constraints.get("unique") for f in schema.fields
+            ):
+                self.__rows = {}
+
     # Validate
 
     def validate_schema(self, schema):
@@ -47,7 +62,77 @@ class BaselineCheck(Check):
         yield from header.errors
 
     def validate_row(self, row):
-        yield from row.errors
+        yield from row.iter_errors(scope=self.scope)
+        if self.__rows is not None:
+            self.__rows[row.row_position] = (row.row_number, list(map(str, row.values())))
+
+    # Merge
+
+    def partial_state(self):
+        state = self.table.partial_state()
+        state["rows"] = {}
+        for keys in [*state["unique"].values(), state["primary"]]:
+            for first, last in keys.values():
+                state["rows"][first] = self.__rows[first]
+        return state
+
+    def merge(self, state, *, row_errors, row_position, row_number):
+        matches = state["matches"]
+        for error in row_errors:
+            match = None
+            position = error["rowPosition"] - row_position
+            if error.code == "unique-error":
+                match = matches["unique"][error["fieldName"]].get(position)
+            elif error.code == "primary-key-error":
+                match = matches["primary"].get(position)
+            if match:
+                note = "the same as in the row at position %s" % (match + row_position)
+                error["note"] = note
+                error["message"] = error.template.format(**error)
+            yield error
+
+        # Unique Error
+        for field_name, keys in state["unique"].items():
+            if field_name not in self.__memory["unique"]:
+                index = Index(size=self.table.index_size, hashed=self.table.index_hashed)
+                self.__memory["unique"][field_name] = index
+            memory = self.__memory["unique"][field_name]
+            field_number = self.table.schema.field_names.index(field_name) + 1
+            field_position = self.table.header.field_positions[field_number - 1]
+            for cell, (first, last) in keys.items():
+                match = memory.get(cell)
+                if match:
+                    number, cells = state["rows"][first]
+                    yield errors.UniqueError(
+                        note="the same as in the row at position %s" % match,
+                        cells=cells,
+                        row_number=number + row_number,
+                        row_position=first + row_position,
+                        cell=str(cell),
+                        field_name=field_name,
+                        field_number=field_number,
+                        field_position=field_position,
+                    )
+                memory[cell] = last + row_position
+
+        # Primary Key Error
+        memory = self.__memory["primary"]
+        for key, (first, last) in state["primary"].items():
+            match = memory.get(key)
+            if match:
+                number, cells = state["rows"][first]
+                yield errors.PrimaryKeyError(
+                    note="the same as in the row at position %s" % match,
+                    cells=cells,
+                    row_number=number + row_number,
+                    row_position=first + row_position,
+                )
+            memory[key] = last + row_position
+
+    def finalize(self):
+        for index in [*self.__memory["unique"].values(), self.__memory["primary"]]:
+            index.close()
+        yield from []
 
     # Metadata
 
@@ -21,6 +21,7 @@ class ChecksumCheck(Check):
 
     """
 
+    mergeable = True
     possible_Errors = [  # type: ignore
         errors.ChecksumError,
     ]
@@ -17,10 +17,14 @@ class DuplicateRowCheck(Check):
 
     """
 
+    mergeable = True
     possible_Errors = [errors.DuplicateRowError]  # type: ignore
 
     def prepare(self):
         self.__memory = {}
+        self.__memory_first = {}
+        self.__matches = {}
+        self.__rows = {}
 
     def validate_row(self, row):
         text = ",".join(map(str, row.values()))
@@ -29,8 +33,39 @@ class DuplicateRowCheck(Check):
         if match:
             note = 'the same as row at position "%s"' % match
             yield errors.DuplicateRowError.from_row(row, note=note)
+            self.__memory_first.setdefault(hash, match)
+            self.__matches[row.row_position] = match
+        elif self.partial:
+            self.__rows[row.row_position] = (row.row_number, list(map(str, row.values())))
         self.__memory[hash] = row.row_position
 
+    # Merge
+
+    def partial_state(self):
+        first = {}
+        for hash, last in self.__memory.items():
+            position = self.__memory_first.get(hash, last)
+            first[hash] = (position, *self.__rows[position])
+        return {"memory": self.__memory, "first": first, "matches": self.__matches}
+
+    def merge(self, state, *, row_errors, row_position, row_number):
+        for error in row_errors:
+            match = state["matches"][error["rowPosition"] - row_position]
+            error["note"] = 'the same as row at position "%s"' % (match + row_position)
+            error["message"] = error.template.format(**error)
+            yield error
+        for hash, last in state["memory"].items():
+            match = self.__memory.get(hash)
+            if match:
+                position, number, cells = state["first"][hash]
+                yield errors.DuplicateRowError(
+                    note='the same as row at position "%s"' % match,
+                    cells=cells,
+                    row_number=number + row_number,
+                    row_position=position + row_position,
+                )
+            self.__memory[hash] = last + row_position
+
     # Metadata
 
     metadata_profile = {  # type: ignore
@@ -58,6 +93,7 @@ class DeviatedValueCheck(Check):
 
     """
 
+    mergeable = True
     possible_Errors = [errors.DeviatedValueError]  # type: ignore
 
     def prepare(self):
@@ -112,6 +148,17 @@ class DeviatedValueCheck(Check):
                 dtl = dtl % (cell, row_position, self.__field_name, minimum, maximum)
                 yield errors.DeviatedValueError(note=dtl)
 
+    # Merge
+
+    def partial_state(self):
+        return {"cells": self.__cells, "rowPositions": self.__row_positions}
+
+    def merge(self, state, *, row_errors, row_position, row_number):
+        yield from row_errors
+        self.__cells.extend(state["cells"])
+        for position in state["rowPositions"]:
+            self.__row_positions.append(position + row_position)
+
     # Metadata
 
     metadata_profile = {  # type: ignore
@@ -138,6 +185,7 @@ class TruncatedValueCheck(Check):
 
     """
 
+    mergeable = True
     possible_Errors = [errors.TruncatedValueError]  # type: ignore
 
     def validate_row(self, row):
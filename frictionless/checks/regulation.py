@@ -21,6 +21,7 @@ class BlacklistedValueCheck(Check):
 
     """
 
+    mergeable = True
     possible_Errors = [errors.BlacklistedValueError]  # type: ignore
 
     def prepare(self):
@@ -69,9 +70,11 @@ class SequentialValueCheck(Check):
 
     """
 
+    mergeable = True
     possible_Errors = [errors.SequentialValueError]  # type: ignore
 
     def prepare(self):
+        self.__first = None
         self.__cursor = None
         self.__exited = False
         self.__field_name = self.get("fieldName")
@@ -86,6 +89,13 @@ class SequentialValueCheck(Check):
     def validate_row(self, row):
         if not self.__exited:
             cell = row[self.__field_name]
+            if self.partial and self.__first is None:
+                error = errors.SequentialValueError.from_row(
+                    row,
+                    note="the value is not sequential",
+                    field_name=self.__field_name,
+                )
+                self.__first = [cell, error]
             try:
                 self.__cursor = self.__cursor or cell
                 assert self.__cursor == cell
@@ -98,6 +108,33 @@ class SequentialValueCheck(Check):
                     field_name=self.__field_name,
                 )
 
+    # Merge
+
+    def partial_state(self):
+        return {"first": self.__first, "cursor": self.__cursor, "exited": self.__exited}
+
+    def merge(self, state, *, row_errors, row_position, row_number):
+        if self.__exited or not state["first"]:
+            return
+
+        # Shard's first cell
+        cell, error = state["first"]
+        try:
+            cursor = self.__cursor or cell
+            assert cursor == cell
+        except Exception:
+            self.__exited = True
+            error["rowPosition"] += row_position
+            error["rowNumber"] += row_number
+            error["message"] = error.template.format(**error)
+            yield error
+            return
+
+        # Shard's errors
+        yield from row_errors
+        self.__cursor = state["cursor"]
+        self.__exited = state["exited"]
+
     # Metadata
 
     metadata_profile = {  # type: ignore
@@ -125,6 +162,7 @@ class RowConstraintCheck(Check):
 
     """
 
+    mergeable = True
     possible_Errors = [errors.RowConstraintError]  # type: ignore
 
     def prepare(self):
@@ -0,0 +1,157 @@
+import io
+import queue
+import threading
+from . import config
+
+
+class Codec:
+    """Codec representation
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import Codec`
+
+    It's an interface for decompressing a file's byte stream while loading.
+    A codec is created by the system based on the file's compression so
+    plugins can provide new codecs implementing `Plugin.create_codec`.
+
+    Parameters:
+        file (File): file
+
+    """
+
+    seeking = False
+
+    def __init__(self, file):
+        self.__file = file
+
+    @property
+    def file(self):
+        """
+        Returns:
+            file (File): file
+        """
+        return self.__file
+
+    # Read
+
+    def read_byte_stream(self, byte_stream):
+        """Read decompressed byte stream
+
+        If the control's `decompressionThread` is set the stream is
+        decompressed ahead of reading in a background thread.
+
+        Parameters:
+            byte_stream (io.ByteStream): compressed byte stream
+
+        Returns:
+            io.ByteStream: decompressed byte stream
+        """
+        byte_stream = self.read_byte_stream_decompress(byte_stream)
+        if self.file.control.decompression_thread:
+            byte_stream = io.BufferedReader(ByteStreamWithReadAhead(byte_stream))
+        return byte_stream
+
+    def read_byte_stream_decompress(self, byte_stream):
+        """Decompress byte stream
+
+        The resulting stream has to support rewinding (`seek(0)`).
+        If the codec sets the `seeking` attribute the compressed stream
+        will be seekable (e.g. a remote archive is spooled to disk).
+
+        Parameters:
+            byte_stream (io.ByteStream): compressed byte stream
+
+        Returns:
+            io.ByteStream: decompressed byte stream
+        """
+        raise NotImplementedError
+
+
+# Internal
+
+
+class ByteStreamWithReadAhead(io.RawIOBase):
+    """Byte stream reading its source ahead in a background thread
+
+    The chunks are put to a bounded queue so decompression overlaps parsing
+    (the standard library decompressors release the GIL). Only rewinding
+    is supported as seeking.
+    """
+
+    def __init__(self, byte_stream):
+        self.__byte_stream = byte_stream
+        self.__thread = None
+        self.__start()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self.__chunk:
+            if self.__finished:
+                return 0
+            chunk = self.__queue.get()
+            if isinstance(chunk, Exception):
+                self.__finished = True
+                raise chunk
+            if not chunk:
+                self.__finished = True
+            self.__chunk = memoryview(chunk)
+        count = min(len(buffer), len(self.__chunk))
+        buffer[:count] = self.__chunk[:count]
+        self.__chunk = self.__chunk[count:]
+        self.__position += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR and offset == 0:
+            return self.__position
+        if whence != io.SEEK_SET or offset != 0:
+            raise io.UnsupportedOperation("only rewinding is supported")
+        self.__stop()
+        self.__byte_stream.seek(0)
+        self.__start()
+        return 0
+
+    def tell(self):
+        return self.__position
+
+    def close(self):
+        if not self.closed:
+            self.__stop()
+            self.__byte_stream.close()
+        super().close()
+
+    # Private
+
+    def __start(self):
+        self.__queue = queue.Queue(maxsize=config.DEFAULT_READ_AHEAD_QUEUE_SIZE)
+        self.__chunk = memoryview(b"")
+        self.__position = 0
+        self.__finished = False
+        self.__stopped = False
+        self.__thread = threading.Thread(target=self.__read_ahead, daemon=True)
+        self.__thread.start()
+
+    def __stop(self):
+        self.__stopped = True
+        while self.__thread.is_alive():
+            try:
+                self.__queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self.__thread.join()
+
+    def __read_ahead(self):
+        try:
+            while not self.__stopped:
+                chunk = self.__byte_stream.read(config.DEFAULT_READ_AHEAD_SIZE)
+                self.__queue.put(chunk)
+                if not chunk:
+                    break
+        except Exception as exception:
+            self.__queue.put(exception)
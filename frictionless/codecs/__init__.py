@@ -0,0 +1,4 @@
+from .bz2 import Bz2Codec
+from .gz import GzipCodec
+from .xz import XzCodec
+from .zip import ZipCodec
@@ -0,0 +1,19 @@
+import bz2
+from ..codec import Codec
+
+
+class Bz2Codec(Codec):
+    """Bzip2 codec implementation.
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import codecs`
+
+    A multi-stream file is read as one stream.
+
+    """
+
+    # Read
+
+    def read_byte_stream_decompress(self, byte_stream):
+        return bz2.open(byte_stream)
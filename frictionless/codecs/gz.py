@@ -0,0 +1,19 @@
+import gzip
+from ..codec import Codec
+
+
+class GzipCodec(Codec):
+    """Gzip codec implementation.
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import codecs`
+
+    A multi-member file is read as one stream.
+
+    """
+
+    # Read
+
+    def read_byte_stream_decompress(self, byte_stream):
+        return gzip.open(byte_stream)
@@ -0,0 +1,20 @@
+import lzma
+from ..codec import Codec
+
+
+class XzCodec(Codec):
+    """Xz codec implementation.
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import codecs`
+
+    Both xz and legacy lzma files are supported. A multi-stream file
+    is read as one stream.
+
+    """
+
+    # Read
+
+    def read_byte_stream_decompress(self, byte_stream):
+        return lzma.open(byte_stream)
@@ -0,0 +1,24 @@
+import zipfile
+from ..codec import Codec
+
+
+class ZipCodec(Codec):
+    """Zip codec implementation.
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import codecs`
+
+    The archive member is streamed from the archive without extracting it.
+
+    """
+
+    seeking = True
+
+    # Read
+
+    def read_byte_stream_decompress(self, byte_stream):
+        archive = zipfile.ZipFile(byte_stream)
+        name = self.file.compression_path or archive.namelist()[0]
+        self.file["compressionPath"] = name
+        return archive.open(name)
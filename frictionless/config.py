@@ -2,6 +2,7 @@ import io
 import os
 import json
 import gzip
+import lzma
 import zipfile
 
 
@@ -17,7 +18,7 @@ def read_asset(*paths):
 
 
 VERSION = read_asset("VERSION")
-COMPRESSION_FORMATS = ["zip", "gz"]
+COMPRESSION_FORMATS = ["zip", "gz", "bz2", "xz", "lzma", "zst"]
 REMOTE_SCHEMES = ["http", "https", "ftp", "ftps"]
 GEOJSON_PROFILE = json.loads(read_asset("profiles", "geojson.json"))
 INQUIRY_PROFILE = json.loads(read_asset("profiles", "inquiry.json"))
@@ -36,6 +37,9 @@ UNDEFINED = object()
 DEFAULT_SCHEME = "file"
 DEFAULT_FORMAT = "csv"
 DEFAULT_HASHING = "md5"
+DEFAULT_HASHING_QUEUE_SIZE = 64
+DEFAULT_READ_AHEAD_SIZE = 65536
+DEFAULT_READ_AHEAD_QUEUE_SIZE = 16
 DEFAULT_ENCODING = "utf-8"
 DEFAULT_COMPRESSION = "no"
 DEFAULT_COMPRESSION_PATH = ""
@@ -44,10 +48,15 @@ DEFAULT_HEADER_ROWS = [1]
 DEFAULT_HEADER_JOIN = " "
 DEFAULT_MISSING_VALUES = [""]
 DEFAULT_LIMIT_MEMORY = 1000
+DEFAULT_INDEX_SIZE = 1000000
 DEFAULT_INFER_VOLUME = 100
+DEFAULT_BATCH_SIZE = 1000
 DEFAULT_INFER_CONFIDENCE = 0.9
 DEFAULT_INFER_ENCODING_VOLUME = 10000
 DEFAULT_INFER_ENCODING_CONFIDENCE = 0.5
+DEFAULT_INFER_CACHE_VOLUME = 65536
+DEFAULT_INFER_SCAN_VOLUME = 10000
+DEFAULT_INFER_SAMPLING = "head"
 DEFAULT_RESOURCE_PROFILE = "data-resource"
 DEFAULT_PACKAGE_PROFILE = "data-package"
 DEFAULT_TRUE_VALUES = ["true", "True", "TRUE", "1"]
@@ -60,6 +69,15 @@ DEFAULT_GROUP_CHAR = ""
 DEFAULT_DECIMAL_CHAR = "."
 DEFAULT_SERVER_PORT = 8000
 DEFAULT_HTTP_TIMEOUT = 10
+DEFAULT_HTTP_SPOOL_SIZE = 10000000
+DEFAULT_HTTP_CHUNK_SIZE = 8000000
+DEFAULT_HTTP_WORKERS = 4
+DEFAULT_HTTP_RESUME_ATTEMPTS = 3
+DEFAULT_HTTP_POOL_CONNECTIONS = 10
+DEFAULT_HTTP_POOL_MAXSIZE = 10
+DEFAULT_HTTP_RETRIES = 3
+DEFAULT_HTTP_BACKOFF = 0.5
+DEFAULT_HTTP_CACHE_SIZE = 1000000000
 DEFAULT_HTTP_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_6) "
@@ -74,7 +92,7 @@ DEFAULT_HTTP_HEADERS = {
 
 # NOTE: Can be removed for Python3.8+
 COMPRESSION_EXCEPTIONS = (
-    (zipfile.BadZipFile, gzip.BadGzipFile)
+    (zipfile.BadZipFile, gzip.BadGzipFile, lzma.LZMAError)
     if hasattr(gzip, "BadGzipFile")
-    else (zipfile.BadZipFile)
+    else (zipfile.BadZipFile, lzma.LZMAError)
 )
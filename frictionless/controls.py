@@ -1,5 +1,5 @@
-import requests
 from .metadata import Metadata
+from .system import system
 from . import helpers
 from . import errors
 from . import config
@@ -15,14 +15,25 @@ class Control(Metadata):
     Parameters:
         descriptor? (str|dict): descriptor
         detectEncoding? (func):  a function to detect encoding `(sample) -> encoding`
+        hashing_thread? (bool): hash the bytes in a background thread
+        decompression_thread? (bool): decompress the bytes in a background thread
 
     Raises:
         FrictionlessException: raise any error that occurs during the process
 
     """
 
-    def __init__(self, descriptor=None, *, detect_encoding=None):
+    def __init__(
+        self,
+        descriptor=None,
+        *,
+        detect_encoding=None,
+        hashing_thread=None,
+        decompression_thread=None,
+    ):
         self.setinitial("detectEncoding", detect_encoding)
+        self.setinitial("hashingThread", hashing_thread)
+        self.setinitial("decompressionThread", decompression_thread)
         super().__init__(descriptor)
 
     @Metadata.property
@@ -33,10 +44,28 @@ class Control(Metadata):
         """
         return self.get("detectEncoding", helpers.detect_encoding)
 
+    @Metadata.property
+    def hashing_thread(self):
+        """
+        Returns:
+            bool: if hashing in a background thread
+        """
+        return self.get("hashingThread", False)
+
+    @Metadata.property
+    def decompression_thread(self):
+        """
+        Returns:
+            bool: if decompressing in a background thread
+        """
+        return self.get("decompressionThread", False)
+
     # Expand
 
     def expand(self):
-        pass
+        """Expand metadata"""
+        self.setdefault("hashingThread", self.hashing_thread)
+        self.setdefault("decompressionThread", self.decompression_thread)
 
     # Import/Export
 
@@ -54,7 +83,11 @@ class Control(Metadata):
     metadata_profile = {  # type: ignore
         "type": "object",
         "additionalProperties": False,
-        "properties": {"detectEncoding": {}},
+        "properties": {
+            "detectEncoding": {},
+            "hashingThread": {"type": "boolean"},
+            "decompressionThread": {"type": "boolean"},
+        },
     }
 
 
@@ -63,18 +96,56 @@ class LocalControl(Control):
 
     Parameters:
         descriptor? (str|dict): descriptor
+        mmap? (bool): memory-map the file instead of reading it
 
     Raises:
         FrictionlessException: raise any error that occurs during the process
 
     """
 
+    def __init__(
+        self,
+        descriptor=None,
+        *,
+        mmap=None,
+        detect_encoding=None,
+        hashing_thread=None,
+        decompression_thread=None,
+    ):
+        self.setinitial("mmap", mmap)
+        super().__init__(
+            descriptor,
+            detect_encoding=detect_encoding,
+            hashing_thread=hashing_thread,
+            decompression_thread=decompression_thread,
+        )
+
+    @Metadata.property
+    def mmap(self):
+        """
+        Returns:
+            bool: if memory-mapped
+        """
+        return self.get("mmap", False)
+
+    # Expand
+
+    def expand(self):
+        """Expand metadata"""
+        super().expand()
+        self.setdefault("mmap", self.mmap)
+
     # Metadata
 
     metadata_profile = {  # type: ignore
         "type": "object",
         "additionalProperties": False,
-        "properties": {"detectEncoding": {}},
+        "properties": {
+            "mmap": {"type": "boolean"},
+            "detectEncoding": {},
+            "hashingThread": {"type": "boolean"},
+            "decompressionThread": {"type": "boolean"},
+        },
     }
 
 
@@ -83,7 +154,7 @@ class RemoteControl(Control):
 
     Parameters:
         descriptor? (str|dict): descriptor
-        http_session? (requests.Session): user defined HTTP session
+        http_session? (requests.Session): user defined HTTP session (shared by default)
         http_preload? (bool): don't use HTTP streaming and preload all the data
         http_timeout? (int): user defined HTTP timeout in minutes
 
@@ -100,11 +171,18 @@ class RemoteControl(Control):
         http_preload=None,
         http_timeout=None,
         detect_encoding=None,
+        hashing_thread=None,
+        decompression_thread=None,
     ):
         self.setinitial("httpSession", http_session)
         self.setinitial("httpPreload", http_preload)
         self.setinitial("httpTimeout", http_timeout)
-        super().__init__(descriptor, detect_encoding=detect_encoding)
+        super().__init__(
+            descriptor,
+            detect_encoding=detect_encoding,
+            hashing_thread=hashing_thread,
+            decompression_thread=decompression_thread,
+        )
 
     @Metadata.property
     def http_session(self):
@@ -112,11 +190,7 @@ class RemoteControl(Control):
         Returns:
             requests.Session: HTTP session
         """
-        http_session = self.get("httpSession")
-        if not http_session:
-            http_session = requests.Session()
-            http_session.headers.update(config.DEFAULT_HTTP_HEADERS)
-        return http_session
+        return self.get("httpSession") or system.get_http_session()
 
     @Metadata.property
     def http_preload(self):
@@ -152,6 +226,8 @@ class RemoteControl(Control):
             "httpPreload": {"type": "boolean"},
             "httpTimeout": {"type": "number"},
             "detectEncoding": {},
+            "hashingThread": {"type": "boolean"},
+            "decompressionThread": {"type": "boolean"},
         },
     }
 
@@ -172,7 +248,11 @@ class StreamControl(Control):
     metadata_profile = {  # type: ignore
         "type": "object",
         "additionalProperties": False,
-        "properties": {"detectEncoding": {}},
+        "properties": {
+            "detectEncoding": {},
+            "hashingThread": {"type": "boolean"},
+            "decompressionThread": {"type": "boolean"},
+        },
     }
 
 
@@ -192,5 +272,9 @@ class TextControl(Control):
     metadata_profile = {  # type: ignore
         "type": "object",
         "additionalProperties": False,
-        "properties": {"detectEncoding": {}},
+        "properties": {
+            "detectEncoding": {},
+            "hashingThread": {"type": "boolean"},
+            "decompressionThread": {"type": "boolean"},
+        },
     }
@@ -1,7 +1,15 @@
 from ..package import Package
 
 
-def describe_package(source, *, basepath=None, trusted=False, expand=False):
+def describe_package(
+    source,
+    *,
+    basepath=None,
+    trusted=False,
+    expand=False,
+    workers=None,
+    infer_cache=None,
+):
     """Describe the given source as a package
 
     API      | Usage
@@ -13,6 +21,8 @@ def describe_package(source, *, basepath=None, trusted=False, expand=False):
         basepath? (str): package basepath
         expand? (bool): if `True` it will expand the metadata
         trusted? (bool): if `True` it will allow unsafe paths
+        workers? (int): number of resources to describe concurrently
+        infer_cache? (str|Cache): directory to cache the inferred metadata in
 
     Returns:
         Package: data package
@@ -21,7 +31,7 @@ def describe_package(source, *, basepath=None, trusted=False, expand=False):
 
     # Infer package
     package = Package(basepath=basepath, trusted=trusted)
-    package.infer(source)
+    package.infer(source, workers=workers, infer_cache=infer_cache)
 
     # Expand package
     if expand:
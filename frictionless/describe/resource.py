@@ -24,6 +24,8 @@ def describe_resource(
     infer_volume=config.DEFAULT_INFER_VOLUME,
     infer_confidence=config.DEFAULT_INFER_CONFIDENCE,
     infer_missing_values=config.DEFAULT_MISSING_VALUES,
+    infer_sampling=config.DEFAULT_INFER_SAMPLING,
+    infer_cache=None,
     # Description
     expand=False,
 ):
@@ -45,7 +47,8 @@ def describe_resource(
         format? (str): File source's format (csv, xls, ...).
             If not set, it'll be inferred from `source`.
 
-        encoding? (str): An algorithm to hash data.
+        hashing? (str|str[]): An algorithm to hash data.
+            If it's a list all the algorithms are computed in one pass.
             It defaults to 'md5'.
 
         encoding? (str): Source encoding.
@@ -91,6 +94,14 @@ def describe_resource(
             For more information, please check "Describing  Data" guide.
             It defaults to `['']`
 
+        infer_sampling? (str): A strategy to get the sample to infer the schema from.
+            It's `head`, `scan` or `seek` (see the Table documentation).
+            It defaults to `head`
+
+        infer_cache? (str|Cache): A directory to cache the inferred metadata in.
+            The encoding, dialect and schema of an unchanged local file are
+            not detected again (see the Cache documentation).
+
         expand? (bool): if `True` it will expand the metadata
 
     Returns:
@@ -118,6 +129,8 @@ def describe_resource(
         infer_volume=infer_volume,
         infer_confidence=infer_confidence,
         infer_missing_values=infer_missing_values,
+        infer_sampling=infer_sampling,
+        infer_cache=infer_cache,
     )
 
     # Create resource
@@ -143,8 +156,9 @@ def describe_resource(
 
     # Stats resource
     resource.update(table.stats)
-    if resource["hashing"] != config.DEFAULT_HASHING:
-        resource["hash"] = ":".join([resource["hashing"], resource["hash"]])
+    hashing = helpers.parse_hashing(resource["hashing"])[0]
+    if hashing != config.DEFAULT_HASHING:
+        resource["hash"] = ":".join([hashing, resource["hash"]])
 
     # Expand resource
     if expand:
@@ -47,7 +47,8 @@ def extract_table(
         format? (str): File source's format (csv, xls, ...).
             If not set, it'll be inferred from `source`.
 
-        encoding? (str): An algorithm to hash data.
+        hashing? (str|str[]): An algorithm to hash data.
+            If it's a list all the algorithms are computed in one pass.
             It defaults to 'md5'.
 
         encoding? (str): Source encoding.
@@ -214,20 +214,43 @@ class Field(Metadata):
             (any, OrderedDict): processed cell and dict of notes
 
         """
-        notes = None
-        if cell in self.missing_values:
-            cell = None
-        if cell is not None:
-            cell = self.__type.read_cell(cell)
-            if cell is None:
-                notes = notes or OrderedDict()
-                notes["type"] = f'type is "{self.type}/{self.format}"'
-        if not notes and self.read_cell_checks:
-            for name, check in self.read_cell_checks.items():
-                if not check(cell):
-                    notes = notes or OrderedDict()
-                    notes[name] = f'constraint "{name}" is "{self.constraints[name]}"'
-        return cell, notes
+        return self.read_cell_compiled(cell)
+
+    @Metadata.property(write=False)
+    def read_cell_compiled(self):
+        """Read cell compiled (cast)
+
+        The reader is created once for the current field's state. It has
+        the missing values, the type's cast function, and the constraint checks
+        pre-bound so no metadata is accessed while reading cells.
+
+        Returns:
+            func: a function `(cell) -> (cell, notes)` as `field.read_cell`
+
+        """
+        cast = self.__type.read_cell
+        type_note = f'type is "{self.type}/{self.format}"'
+        checks = []
+        for name, check in self.read_cell_checks.items():
+            note = f'constraint "{name}" is "{self.constraints[name]}"'
+            checks.append((name, check, note))
+        cast_column = self.__type.read_column
+        return FieldReader(cast, cast_column, type_note, self.missing_values, checks)
+
+    def read_column(self, cells):
+        """Read column (cast)
+
+        It's a column-oriented version of `field.read_cell` converting
+        all the non-missing cells in one call to the field's type.
+
+        Parameters:
+            cells (any[]): column cells
+
+        Returns:
+            (any[], OrderedDict[]): processed cells and list of dicts of notes
+
+        """
+        return self.read_cell_compiled.read_column(cells)
 
     def read_cell_cast(self, cell):
         """Read cell low-level (cast)
@@ -409,3 +432,86 @@ def check_enum(constraint, cell):
 
 
 COMPILED_RE = type(re.compile(""))
+
+
+class FieldReader:
+    """Field compiled reader
+
+    It's a callable class (not a closure) so a field having
+    its compiled reader cached can be pickled e.g. for a process pool.
+    The cell and column reading share the missing values and checks.
+    """
+
+    __slots__ = [
+        "cast",
+        "cast_column",
+        "type_note",
+        "missing_strings",
+        "missing_others",
+        "checks",
+    ]
+
+    def __init__(self, cast, cast_column, type_note, missing_values, checks):
+        self.cast = cast
+        self.cast_column = cast_column
+        self.type_note = type_note
+        self.missing_strings = frozenset(filter(IS_STRING, missing_values))
+        self.missing_others = list(filter(IS_NOT_STRING, missing_values))
+        self.checks = checks
+
+    def __call__(self, cell):
+        # It's inlined as it's called for every cell
+        notes = None
+        if isinstance(cell, str):
+            if cell in self.missing_strings:
+                cell = None
+        elif self.missing_others and cell in self.missing_others:
+            cell = None
+        if cell is not None:
+            cell = self.cast(cell)
+            if cell is None:
+                notes = OrderedDict()
+                notes["type"] = self.type_note
+                return cell, notes
+        for name, check, note in self.checks:
+            if not check(cell):
+                notes = notes or OrderedDict()
+                notes[name] = note
+        return cell, notes
+
+    def read_column(self, cells):
+        targets = [None] * len(cells)
+        notes = [None] * len(cells)
+        indexes = []
+        for index, cell in enumerate(cells):
+            if cell is not None and not self.is_missing(cell):
+                indexes.append(index)
+        values, mask = self.cast_column([cells[index] for index in indexes])
+        for index, value, failed in zip(indexes, values, mask):
+            if failed:
+                notes[index] = OrderedDict()
+                notes[index]["type"] = self.type_note
+                continue
+            targets[index] = value
+        if self.checks:
+            for index, cell in enumerate(targets):
+                if not notes[index]:
+                    notes[index] = self.check(cell)
+        return targets, notes
+
+    def is_missing(self, cell):
+        if isinstance(cell, str):
+            return cell in self.missing_strings
+        return bool(self.missing_others) and cell in self.missing_others
+
+    def check(self, cell):
+        notes = None
+        for name, check, note in self.checks:
+            if not check(cell):
+                notes = notes or OrderedDict()
+                notes[name] = note
+        return notes
+
+
+IS_STRING = lambda value: isinstance(value, str)
+IS_NOT_STRING = lambda value: not isinstance(value, str)
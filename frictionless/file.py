@@ -32,7 +32,7 @@ class File(Metadata):
         source (any): file source
         scheme? (str): file scheme
         format? (str): file format
-        hashing? (str): file hashing
+        hashing? (str|str[]): file hashing (several algorithms in one pass)
         encoding? (str): file encoding
         compression? (str): file compression
         compression_path? (str): file compression path
@@ -143,7 +143,7 @@ class File(Metadata):
     def hashing(self):
         """
         Returns:
-            str?: file hashing
+            str|str[]?: file hashing
         """
         return self.get("hashing", config.DEFAULT_HASHING)
 
@@ -338,7 +338,7 @@ class File(Metadata):
             "source": {},
             "scheme": {"type": "string"},
             "format": {"type": "string"},
-            "hashing": {"type": "string"},
+            "hashing": {"type": ["string", "array"], "items": {"type": "string"}},
             "encoding": {"type": "string"},
             "compression": {"type": "string"},
             "compressionPath": {"type": "string"},
@@ -351,6 +351,7 @@ class File(Metadata):
                 "required": ["hash", "bytes", "rows"],
                 "properties": {
                     "hash": {"type": "string"},
+                    "hashes": {"type": "object"},
                     "bytes": {"type": "number"},
                     "rows": {"type": "number"},
                 },
@@ -24,7 +24,11 @@ class Header(list):
         fields = schema.fields
         self.__schema = schema
         self.__field_positions = field_positions
-        self.__errors = []
+        self.__error_specs = []
+
+        # Error specs
+        # Errors are materialized on the first `header.errors` access
+        # so we store only an error class and the error options here
 
         # Extra header
         if len(fields) < len(cells):
@@ -32,16 +36,14 @@ class Header(list):
             start = max(field_positions[: len(fields)]) + 1
             del cells[len(fields) :]
             for field_position, cell in enumerate(iterator, start=start):
-                self.__errors.append(
-                    errors.ExtraHeaderError(
-                        note="",
-                        cells=cells,
-                        cell="",
-                        field_name="",
-                        field_number=len(fields) + field_position - start,
-                        field_position=field_position,
-                    )
-                )
+                options = {
+                    "note": "",
+                    "cell": "",
+                    "field_name": "",
+                    "field_number": len(fields) + field_position - start,
+                    "field_position": field_position,
+                }
+                self.__error_specs.append((errors.ExtraHeaderError, options))
 
         # Missing header
         if len(fields) > len(cells):
@@ -49,17 +51,15 @@ class Header(list):
             iterator = zip_longest(field_positions[len(cells) :], fields[len(cells) :])
             for field_number, (field_position, field) in enumerate(iterator, start=start):
                 if field is not None:
-                    self.__errors.append(
-                        errors.MissingHeaderError(
-                            note="",
-                            cells=list(map(str, cells)),
-                            cell="",
-                            field_name=field.name,
-                            field_number=field_number,
-                            field_position=field_position
-                            or max(field_positions) + field_number - start + 1,
-                        )
-                    )
+                    options = {
+                        "note": "",
+                        "cell": "",
+                        "field_name": field.name,
+                        "field_number": field_number,
+                        "field_position": field_position
+                        or max(field_positions) + field_number - start + 1,
+                    }
+                    self.__error_specs.append((errors.MissingHeaderError, options))
 
         # Iterate items
         field_number = 0
@@ -68,16 +68,14 @@ class Header(list):
 
             # Blank Header
             if not cell:
-                self.__errors.append(
-                    errors.BlankHeaderError(
-                        note="",
-                        cells=list(map(str, cells)),
-                        cell="",
-                        field_name=field.name,
-                        field_number=field_number,
-                        field_position=field_position,
-                    )
-                )
+                options = {
+                    "note": "",
+                    "cell": "",
+                    "field_name": field.name,
+                    "field_number": field_number,
+                    "field_position": field_position,
+                }
+                self.__error_specs.append((errors.BlankHeaderError, options))
 
             # Duplicated Header
             if cell:
@@ -91,30 +89,26 @@ class Header(list):
                     cell = None
                     note = 'at position "%s"'
                     note = note % ", ".join(map(str, duplicate_field_positions))
-                    self.__errors.append(
-                        errors.DuplicateHeaderError(
-                            note=note,
-                            cells=list(map(str, cells)),
-                            cell=str(cells[field_number - 1]),
-                            field_name=field.name,
-                            field_number=field_number,
-                            field_position=field_position,
-                        )
-                    )
+                    options = {
+                        "note": note,
+                        "cell": str(cells[field_number - 1]),
+                        "field_name": field.name,
+                        "field_number": field_number,
+                        "field_position": field_position,
+                    }
+                    self.__error_specs.append((errors.DuplicateHeaderError, options))
 
             # Non-matching Header
             if cell:
                 if field.name != cell:
-                    self.__errors.append(
-                        errors.NonMatchingHeaderError(
-                            note="",
-                            cells=list(map(str, cells)),
-                            cell=str(cell),
-                            field_name=field.name,
-                            field_number=field_number,
-                            field_position=field_position,
-                        )
-                    )
+                    options = {
+                        "note": "",
+                        "cell": str(cell),
+                        "field_name": field.name,
+                        "field_number": field_number,
+                        "field_position": field_position,
+                    }
+                    self.__error_specs.append((errors.NonMatchingHeaderError, options))
 
         # Save header
         super().__init__(cells)
@@ -141,7 +135,8 @@ class Header(list):
         Returns:
             Error[]: header errors
         """
-        return self.__errors
+        cells = list(map(str, self))
+        return [Error(cells=cells, **options) for Error, options in self.__error_specs]
 
     @cached_property
     def valid(self):
@@ -149,7 +144,7 @@ class Header(list):
         Returns:
             bool: if header valid
         """
-        return not self.__errors
+        return not self.__error_specs
 
     # Import/Export
 
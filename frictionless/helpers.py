@@ -1,11 +1,13 @@
 import re
 import os
 import atexit
+import codecs
 import shutil
 import zipfile
 import chardet
 import tempfile
 import datetime
+import functools
 import stringcase
 from copy import deepcopy
 from pprint import pformat
@@ -185,8 +187,28 @@ def parse_resource_hash(hash):
     return parts
 
 
+def parse_hashing(hashing):
+    if not hashing:
+        return []
+    if isinstance(hashing, str):
+        return [hashing]
+    return list(hashing)
+
+
 def detect_encoding(sample):
-    result = chardet.detect(sample)
+    # BOM
+    for bom, encoding in ENCODING_BOMS:
+        if sample.startswith(bom):
+            return encoding
+    # UTF-8 (an incomplete char at the end of the sample is ignored)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample)
+        return config.DEFAULT_ENCODING
+    except UnicodeDecodeError:
+        pass
+    # Detector
+    detect = import_encoding_detector() or chardet.detect
+    result = detect(sample)
     confidence = result["confidence"] or 0
     encoding = result["encoding"] or config.DEFAULT_ENCODING
     if confidence < config.DEFAULT_INFER_ENCODING_CONFIDENCE:
@@ -196,6 +218,23 @@ def detect_encoding(sample):
     return encoding
 
 
+@functools.lru_cache(maxsize=None)
+def import_encoding_detector():
+    try:
+        return import_module("cchardet").detect
+    except ImportError:
+        return None
+
+
+ENCODING_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
 def detect_source_type(source):
     source_type = "table"
     if isinstance(source, dict):
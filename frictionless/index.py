@@ -0,0 +1,287 @@
+import os
+import pickle
+import hashlib
+import sqlite3
+import weakref
+import tempfile
+from decimal import Decimal
+from . import config
+
+
+class Index:
+    """Index representation
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless import Index`
+
+    It's a key index mapping keys (e.g. unique cells or primary keys) to row
+    positions as `table` uses it to find unique and primary key errors.
+    The keys are kept in memory until their number exceeds the size. Then the
+    keys are written to a temporary SQLite database on disk so the memory usage
+    is bounded for tables of any length.
+
+    By default, the index becomes hashed at this point: only 64-bit digests of
+    the keys are kept in memory (up to 8 times the size) and a key is looked up
+    on disk only if its digest is found to verify that it's not a collision.
+    A not hashed index keeps the most recently written keys in memory instead.
+
+    ```python
+    index = Index(size=1000)
+    index[("id", 1)] = 2
+    index.get(("id", 1)) == 2
+    ```
+
+    Parameters:
+        size? (int): maximum number of keys to keep in memory
+        hashed? (bool): whether to keep only digests of the keys in memory;
+            by default the index becomes hashed once it exceeds the size
+
+    """
+
+    def __init__(self, *, size=config.DEFAULT_INDEX_SIZE, hashed=None):
+        self.__size = size
+        self.__hashed = hashed
+        self.__memory = {}
+        self.__digests = None
+        self.__pending = {}
+        self.__database = None
+        self.__saturated = False
+        self.__path = None
+        self.__pid = None
+        self.__finalizer = None
+        if hashed:
+            self.__digests = set()
+
+    def __getstate__(self):
+        # A spilled index is shared by its database path as it can be big
+        # (e.g. a foreign key lookup sent to a process pool); it's read-only
+        # for other processes and removed only by the index that created it
+        if self.__database is None and self.__digests is None:
+            return {"size": self.__size, "hashed": self.__hashed, "memory": self.__memory}
+        for key, value in self.__memory.items():
+            self.__pending[encode_key(key)] = (key, value)
+        self.__flush()
+        return {"size": self.__size, "hashed": self.__hashed, "path": self.__path}
+
+    def __setstate__(self, state):
+        self.__init__(size=state["size"], hashed=state["hashed"])
+        if "memory" in state:
+            self.__memory = state["memory"]
+            return
+        self.__digests = set()
+        self.__saturated = True
+        self.__path = state["path"]
+        self.__database = connect_database(self.__path, readonly=True)
+        self.__pid = os.getpid()
+
+    def __setitem__(self, key, value):
+        if self.__digests is not None:
+            return self.__write(key, value)
+        self.__memory[key] = value
+        if len(self.__memory) > self.__size:
+            if self.__hashed is False:
+                return self.__spill()
+            self.__digests = set()
+            for key, value in self.__memory.items():
+                self.__write(key, value)
+            self.__memory = {}
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __len__(self):
+        if self.__pending:
+            self.__flush()
+        if self.__database is None:
+            return len(self.__memory)
+        return sum(1 for _ in self.items())
+
+    @property
+    def size(self):
+        """
+        Returns:
+            int: maximum number of keys to keep in memory
+        """
+        return self.__size
+
+    @property
+    def hashed(self):
+        """
+        Returns:
+            bool: whether only digests of the keys are kept in memory
+        """
+        return self.__digests is not None
+
+    @property
+    def spilled(self):
+        """
+        Returns:
+            bool: whether some keys are spilled to disk
+        """
+        return self.__database is not None
+
+    def get(self, key, default=None):
+        """Get a value by key
+
+        Parameters:
+            key (any): hashable key
+            default? (any): value to return if the key is not found
+
+        Returns:
+            any: value or default
+        """
+        if self.__digests is not None:
+            source = encode_key(key)
+            if not self.__saturated:
+                if digest_key(source) not in self.__digests:
+                    return default
+            value = self.__pending.get(source, (None, None))[1]
+            if value is None and self.__database is not None:
+                value = self.__read(source)
+            return default if value is None else value
+        value = self.__memory.get(key)
+        if value is None and self.__database is not None:
+            value = self.__read(encode_key(key))
+        return default if value is None else value
+
+    def items(self):
+        """Iterate over the index's items
+
+        Yields:
+            (any, any): key and value pairs
+        """
+        if self.__pending:
+            self.__flush()
+        yield from self.__memory.items()
+        if self.__database is not None:
+            query = "SELECT source, value FROM keys"
+            for source, value in self.__connect().execute(query):
+                key = pickle.loads(source)
+                if key not in self.__memory:
+                    yield key, value
+
+    def close(self):
+        """Close the index removing spilled keys"""
+        self.__memory = {}
+        self.__pending = {}
+        if self.__digests is not None:
+            self.__digests = set()
+            self.__saturated = False
+        if self.__finalizer is not None:
+            self.__finalizer()
+            self.__finalizer = None
+        elif self.__database is not None:
+            self.__database.close()
+        self.__database = None
+        self.__path = None
+
+    # Private
+
+    def __connect(self):
+        # A connection can't be used by a forked process
+        if self.__pid != os.getpid():
+            self.__database = connect_database(self.__path, readonly=True)
+            self.__pid = os.getpid()
+        return self.__database
+
+    def __read(self, source):
+        query = "SELECT value FROM keys WHERE key = ?"
+        record = self.__connect().execute(query, (source,)).fetchone()
+        return record[0] if record else None
+
+    def __write(self, key, value):
+        source = encode_key(key)
+        self.__pending[source] = (key, value)
+        if not self.__saturated:
+            self.__digests.add(digest_key(source))
+            # Digests are not kept anymore so every lookup goes to disk
+            if len(self.__digests) > self.__size * INDEX_DIGESTS_PER_KEY:
+                self.__digests = set()
+                self.__saturated = True
+        if len(self.__pending) >= min(self.__size, INDEX_BATCH_SIZE):
+            self.__flush()
+
+    def __spill(self):
+        for key, value in self.__memory.items():
+            self.__pending[encode_key(key)] = (key, value)
+        self.__memory = {}
+        self.__flush()
+
+    def __flush(self):
+        if self.__database is None:
+            descriptor, self.__path = tempfile.mkstemp(suffix=".sqlite")
+            os.close(descriptor)
+            self.__database = connect_database(self.__path)
+            self.__pid = os.getpid()
+            self.__finalizer = weakref.finalize(
+                self, remove_database, self.__database, self.__path, self.__pid
+            )
+        records = []
+        for source, (key, value) in self.__pending.items():
+            records.append((source, pickle.dumps(key), value))
+        query = "INSERT OR REPLACE INTO keys VALUES (?, ?, ?)"
+        self.__database.executemany(query, records)
+        self.__database.commit()
+        self.__pending = {}
+
+
+# Internal
+
+
+def connect_database(path, *, readonly=False):
+    # An index can be closed by the garbage collector in another thread
+    if readonly:
+        uri = f"file:{path}?mode=ro"
+        return sqlite3.connect(uri, uri=True, check_same_thread=False)
+    database = sqlite3.connect(path, check_same_thread=False)
+    database.execute("PRAGMA journal_mode = OFF")
+    database.execute("PRAGMA synchronous = OFF")
+    database.execute(
+        "CREATE TABLE keys (key BLOB PRIMARY KEY, source BLOB, value) WITHOUT ROWID"
+    )
+    return database
+
+
+def remove_database(database, path, pid):
+    database.close()
+    if os.getpid() == pid:
+        os.remove(path)
+
+
+def encode_key(key):
+    """Encode a key to bytes so the keys equal as values are equal as bytes"""
+    if isinstance(key, tuple):
+        key = tuple(map(normalize_cell, key))
+    else:
+        key = normalize_cell(key)
+    return pickle.dumps(key, protocol=4)
+
+
+def digest_key(source):
+    """Create a 64-bit digest of an encoded key"""
+    return int.from_bytes(hashlib.blake2b(source, digest_size=8).digest(), "big")
+
+
+def normalize_cell(cell):
+    # Numbers are equal across types and precisions e.g. 1 == 1.0 == Decimal("1.00")
+    if isinstance(cell, (bool, int)):
+        return int(cell)
+    if isinstance(cell, float):
+        cell = Decimal(cell) if cell == cell else cell
+    if isinstance(cell, Decimal) and cell.is_finite():
+        if cell == cell.to_integral_value():
+            return int(cell)
+        return cell.normalize()
+    return cell
+
+
+# A digest takes about an order of magnitude less memory than a composite key
+INDEX_DIGESTS_PER_KEY = 8
+INDEX_BATCH_SIZE = 10000
@@ -1,11 +1,13 @@
 import io
-import gzip
 import codecs
 import shutil
+import queue
 import hashlib
-import zipfile
 import tempfile
+import threading
+from .system import system
 from . import exceptions
+from . import helpers
 from . import errors
 from . import config
 
@@ -28,6 +30,7 @@ class Loader:
         self.__file = file
         self.__byte_stream = None
         self.__text_stream = None
+        self.__stats_stream = None
 
     def __enter__(self):
         if self.closed:
@@ -69,6 +72,20 @@ class Loader:
             self.__text_stream = self.read_text_stream()
         return self.__text_stream
 
+    @property
+    def buffer(self):
+        """File buffer
+
+        It's available after opening the loader if the loader supports it
+        (e.g. a memory-mapped local file). It's a bytes-like object that can
+        be sliced and searched without copying the whole file or reading it
+        through the byte stream (so the stats are not updated).
+
+        Returns:
+            mmap?: file buffer
+        """
+        return None
+
     # Open/Close
 
     def open(self):
@@ -88,7 +105,19 @@ class Loader:
         """Close the loader as "filelike.close" does"""
         if self.__byte_stream:
             self.__byte_stream.close()
+        if self.__stats_stream:
+            self.__stats_stream.close()
         self.__byte_stream = None
+        self.__stats_stream = None
+
+    def flush(self):
+        """Flush the file stats as "filelike.flush" does
+
+        The hash is only computed when the byte stream is read to the end
+        so it's required to get the hash of a partially read stream.
+        """
+        if self.__stats_stream:
+            self.__stats_stream.flush()
 
     @property
     def closed(self):
@@ -138,11 +167,13 @@ class Loader:
         """
         if not self.file.stats:
             return byte_stream
-        return ByteStreamWithStatsHandling(
+        self.__stats_stream = ByteStreamWithStatsHandling(
             byte_stream,
             hashing=self.file.hashing,
             stats=self.file.stats if not self.file.stats["hash"] else {},
+            thread=self.file.control.hashing_thread,
         )
+        return self.__stats_stream
 
     def read_byte_stream_decompress(self, byte_stream):
         """Decompress byte stream
@@ -153,37 +184,26 @@ class Loader:
         Returns:
             io.ByteStream: file byte stream
         """
-        if self.file.compression == "zip":
+        if self.file.compression == "no":
+            return byte_stream
+        codec = system.create_codec(self.file)
+        if codec.seeking:
             # Remote
-            if self.remote:
+            # The archive is only spooled to disk if its stream can't seek
+            if self.remote and not byte_stream.seekable():
                 self.remote = False
-                target = tempfile.NamedTemporaryFile()
+                target = tempfile.TemporaryFile()
                 shutil.copyfileobj(byte_stream, target)
                 target.seek(0)
                 byte_stream = target
             # Stats
+            # The archive is read to the end to get its hash and bytes count
             else:
                 bytes = True
                 while bytes:
                     bytes = byte_stream.read1(io.DEFAULT_BUFFER_SIZE)
                 byte_stream.seek(0)
-            # Unzip
-            with zipfile.ZipFile(byte_stream) as archive:
-                name = self.file.compression_path or archive.namelist()[0]
-                with archive.open(name) as file:
-                    target = tempfile.NamedTemporaryFile()
-                    shutil.copyfileobj(file, target)
-                    target.seek(0)
-                byte_stream = target
-                self.file["compressionPath"] = name
-            return byte_stream
-        if self.file.compression == "gz":
-            byte_stream = gzip.open(byte_stream)
-            return byte_stream
-        if self.file.compression == "no":
-            return byte_stream
-        note = f'compression "{self.file.compression}" is not supported'
-        raise exceptions.FrictionlessException(errors.CompressionError(note=note))
+        return codec.read_byte_stream(byte_stream)
 
     def read_text_stream(self):
         """Read text stream
@@ -242,30 +262,150 @@ class Loader:
 # Internal
 
 
-# NOTE: implement __iter__
-# NOTE: review read/read1 usage
 # NOTE: Try buffering byte sample especially for remote
 class ByteStreamWithStatsHandling:
-    def __init__(self, byte_stream, *, hashing, stats):
-        try:
-            self.__hasher = hashlib.new(hashing) if hashing else None
-        except Exception as exception:
-            error = errors.HashingError(note=str(exception))
-            raise exceptions.FrictionlessException(error)
+    """Byte stream updating the file stats on reading
+
+    The bytes are counted on every read while the hash is only finalized
+    when the stream is read to the end or flushed. Rewinding the stream
+    (e.g. after reading an encoding sample) restarts the stats and reading
+    after the end (e.g. unzipping an archive) doesn't update them.
+
+    If the thread is enabled the chunks are hashed by a background thread
+    fed by a bounded queue so hashing overlaps parsing (the hashers
+    release the GIL for big enough chunks).
+    """
+
+    def __init__(self, byte_stream, *, hashing, stats, thread=False):
+        self.__hasher = StatsHasher(hashing)
         self.__byte_stream = byte_stream
-        self.__stats = stats or {}
+        self.__stats = stats
+        self.__bytes = 0
+        self.__finished = False
+        self.__queue = None
+        if thread and hashing:
+            self.__queue = queue.Queue(maxsize=config.DEFAULT_HASHING_QUEUE_SIZE)
+            threading.Thread(target=self.__hash_queue, daemon=True).start()
 
     def __getattr__(self, name):
         return getattr(self.__byte_stream, name)
 
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
     @property
     def closed(self):
         return self.__byte_stream.closed
 
+    def close(self):
+        self.flush()
+        self.__stop_thread()
+        self.__byte_stream.close()
+
+    def flush(self):
+        if self.__queue:
+            self.__queue.join()
+        self.__hasher.write_stats(self.__stats)
+
+    def read(self, size=None):
+        chunk = self.__byte_stream.read(size)
+        return self.__update(chunk, size)
+
     def read1(self, size=None):
         chunk = self.__byte_stream.read1(size)
-        self.__stats["bytes"] += len(chunk)
-        if self.__hasher:
-            self.__hasher.update(chunk)
-            self.__stats["hash"] = self.__hasher.hexdigest()
+        return self.__update(chunk, size)
+
+    def readline(self, size=None):
+        chunk = self.__byte_stream.readline(size)
+        return self.__update(chunk, size)
+
+    def readinto(self, buffer):
+        if hasattr(self.__byte_stream, "readinto"):
+            count = self.__byte_stream.readinto(buffer)
+        else:
+            chunk = self.__byte_stream.read(len(buffer))
+            count = len(chunk)
+            buffer[:count] = chunk
+        self.__update(memoryview(buffer)[:count], len(buffer))
+        return count
+
+    def seek(self, offset, *args):
+        position = self.__byte_stream.seek(offset, *args)
+        if offset == 0 and args in [(), (io.SEEK_SET,)] and not self.__finished:
+            if self.__queue:
+                self.__queue.join()
+            self.__hasher.reset()
+            self.__bytes = 0
+            self.__stats["bytes"] = self.__bytes
+        return position
+
+    # Private
+
+    def __update(self, chunk, size):
+        if self.__finished:
+            return chunk
+        if chunk:
+            self.__bytes += len(chunk)
+            self.__stats["bytes"] = self.__bytes
+            if self.__queue:
+                self.__queue.put(bytes(chunk))
+            else:
+                self.__hasher.update(chunk)
+        elif size != 0:
+            self.__finished = True
+            self.flush()
+            self.__stop_thread()
         return chunk
+
+    def __hash_queue(self):
+        hasher = self.__hasher
+        chunks = self.__queue
+        while True:
+            chunk = chunks.get()
+            if chunk is not None:
+                hasher.update(chunk)
+            chunks.task_done()
+            if chunk is None:
+                break
+
+    def __stop_thread(self):
+        if self.__queue:
+            self.__queue.put(None)
+            self.__queue = None
+
+
+class StatsHasher:
+    """Hasher computing one or many hash sums in one pass
+
+    The first algorithm's sum is written to the "hash" stat. If the hashing
+    is a list all the sums are also written to the "hashes" stat.
+    """
+
+    def __init__(self, hashing):
+        self.__hashing = hashing
+        self.__names = helpers.parse_hashing(hashing)
+        self.reset()
+
+    def reset(self):
+        try:
+            self.__hashers = [hashlib.new(name) for name in self.__names]
+        except Exception as exception:
+            error = errors.HashingError(note=str(exception))
+            raise exceptions.FrictionlessException(error)
+
+    def update(self, chunk):
+        for hasher in self.__hashers:
+            hasher.update(chunk)
+
+    def write_stats(self, stats):
+        if self.__hashers:
+            hashes = [hasher.hexdigest() for hasher in self.__hashers]
+            stats["hash"] = hashes[0]
+            if not isinstance(self.__hashing, str):
+                stats["hashes"] = dict(zip(self.__names, hashes))
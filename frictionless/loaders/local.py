@@ -1,4 +1,5 @@
 import io
+import mmap
 from ..loader import Loader
 
 
@@ -11,6 +12,30 @@ class LocalLoader(Loader):
 
     """
 
+    def __init__(self, file):
+        super().__init__(file)
+        self.__buffer = None
+
+    @property
+    def buffer(self):
+        """File buffer
+
+        It's available if the file is memory-mapped (see `LocalControl`).
+
+        Returns:
+            mmap?: file buffer
+        """
+        return self.__buffer
+
+    # Open/Close
+
+    def close(self):
+        """Close the loader as "filelike.close" does"""
+        super().close()
+        if self.__buffer is not None:
+            self.__buffer.close()
+        self.__buffer = None
+
     # Read
 
     def read_byte_stream_create(self):
@@ -19,4 +44,51 @@ class LocalLoader(Loader):
         if source.startswith(scheme):
             source = source.replace(scheme, "", 1)
         byte_stream = io.open(source, "rb")
+        # An empty file can't be mapped so it's read as usual
+        if self.file.control.mmap and byte_stream.seek(0, io.SEEK_END):
+            with byte_stream:
+                self.__buffer = mmap.mmap(
+                    byte_stream.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            return io.BufferedReader(MappedByteStream(self.__buffer))
+        byte_stream.seek(0)
         return byte_stream
+
+
+# Internal
+
+
+class MappedByteStream(io.RawIOBase):
+    """Raw byte stream over a memory-mapped file
+
+    Reading is copying from the mapping (no system calls)
+    and it doesn't own the mapping so it can be closed independently.
+    """
+
+    def __init__(self, buffer):
+        self.__buffer = buffer
+        self.__position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, target):
+        start = self.__position
+        end = min(start + len(target), len(self.__buffer))
+        target[: end - start] = self.__buffer[start:end]
+        self.__position = end
+        return end - start
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence == io.SEEK_END:
+            offset += len(self.__buffer)
+        self.__position = max(offset, 0)
+        return self.__position
+
+    def tell(self):
+        return self.__position
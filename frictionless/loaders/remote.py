@@ -1,6 +1,11 @@
 import io
+import urllib3
+import tempfile
+import threading
 import requests.utils
+from concurrent.futures import ThreadPoolExecutor
 from ..loader import Loader
+from .. import config
 
 
 class RemoteLoader(Loader):
@@ -22,10 +27,7 @@ class RemoteLoader(Loader):
         timeout = self.file.control.http_timeout
         byte_stream = RemoteByteStream(source, session=session, timeout=timeout).open()
         if self.file.control.http_preload:
-            buffer = io.BufferedRandom(io.BytesIO())
-            buffer.write(byte_stream.read())
-            buffer.seek(0)
-            byte_stream = buffer
+            byte_stream.download()
         return byte_stream
 
 
@@ -33,10 +35,20 @@ class RemoteLoader(Loader):
 
 
 class RemoteByteStream:
+    """Remote byte stream
+
+    The downloaded bytes are kept in a spooled temporary file so seeking back
+    (e.g. rewinding after reading an encoding sample) doesn't download them again.
+    If the server supports HTTP Range requests seeking forward doesn't download
+    the bytes in between and an interrupted download is resumed. Downloading
+    the whole file (`download`) is done in parallel chunks in this case.
+    """
+
     def __init__(self, source, *, session, timeout):
         self.__source = source
         self.__session = session
         self.__timeout = timeout
+        self.__closed = True
 
     def readable(self):
         return True
@@ -53,29 +65,165 @@ class RemoteByteStream:
 
     def open(self):
         self.__closed = False
-        self.seek(0)
+        self.__buffer = tempfile.SpooledTemporaryFile(
+            max_size=config.DEFAULT_HTTP_SPOOL_SIZE
+        )
+        self.__length = 0
+        self.__position = 0
+        self.__response = None
+        self.__request(0)
+        headers = self.__response.headers
+        self.__ranges = headers.get("Accept-Ranges") == "bytes"
+        self.__ranges = self.__ranges and "Content-Length" in headers
+        self.__ranges = self.__ranges and not headers.get("Content-Encoding")
+        self.__size = int(headers["Content-Length"]) if self.__ranges else None
         return self
 
     def close(self):
+        if not self.__closed:
+            self.__response.close()
+            self.__buffer.close()
         self.__closed = True
 
     def tell(self):
-        return self.__response.raw.tell()
+        return self.__position
 
     def flush(self):
         pass
 
-    def read(self, size=None):
-        return self.__response.raw.read(size)
-
-    def read1(self, size=None):
-        return self.__response.raw.read(size)
-
-    def seek(self, offset, whence=0):
-        assert offset == 0
-        assert whence == 0
+    def read(self, size=-1):
+        if size is None or size < 0:
+            chunks = []
+            while True:
+                chunk = self.read1(io.DEFAULT_BUFFER_SIZE)
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+        chunks = []
+        while size > 0:
+            chunk = self.read1(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def read1(self, size=-1):
+        if size is None or size < 0:
+            return self.read()
+        if self.__position < self.__length:
+            self.__buffer.seek(self.__position)
+            chunk = self.__buffer.read(min(size, self.__length - self.__position))
+        else:
+            chunk = self.__read_response(size)
+        self.__position += len(chunk)
+        return chunk
+
+    def readinto(self, buffer):
+        chunk = self.read1(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence == io.SEEK_END:
+            if self.__size is None:
+                self.download()
+            offset += self.__size
+        # Without ranges the bytes before the offset have to be downloaded
+        if not self.__ranges and offset > self.__length:
+            self.__position = self.__length
+            self.read(offset - self.__length)
+        self.__position = offset
+        return self.__position
+
+    def download(self):
+        """Download the rest of the file to the buffer"""
+        if self.__size is None:
+            position = self.__position
+            self.seek(self.__length)
+            while self.read1(io.DEFAULT_BUFFER_SIZE):
+                pass
+            self.__size = self.__length
+            self.__position = position
+            return
+        self.__response.close()
+        lock = threading.Lock()
+        size = config.DEFAULT_HTTP_CHUNK_SIZE
+        starts = range(self.__length, self.__size, size)
+
+        # Download chunk
+        def download_chunk(start):
+            stop = min(start + size, self.__size)
+            attempts = config.DEFAULT_HTTP_RESUME_ATTEMPTS
+            while start < stop:
+                try:
+                    response = self.__session.get(
+                        self.__source,
+                        headers={"Range": f"bytes={start}-{stop - 1}"},
+                        timeout=self.__timeout,
+                    )
+                    response.raise_for_status()
+                    chunk = response.content
+                except requests.ConnectionError:
+                    if not attempts:
+                        raise
+                    attempts -= 1
+                    continue
+                if response.status_code != 206:
+                    chunk = chunk[start:]
+                chunk = chunk[: stop - start]
+                with lock:
+                    self.__buffer.seek(start)
+                    self.__buffer.write(chunk)
+                start += len(chunk)
+
+        with ThreadPoolExecutor(max_workers=config.DEFAULT_HTTP_WORKERS) as executor:
+            list(executor.map(download_chunk, starts))
+        self.__length = self.__size
+
+    # Private
+
+    def __request(self, position):
+        if self.__response:
+            self.__response.close()
+        headers = {"Range": f"bytes={position}-"} if position else {}
         self.__response = self.__session.get(
-            self.__source, stream=True, timeout=self.__timeout
+            self.__source, headers=headers, stream=True, timeout=self.__timeout
         )
         self.__response.raise_for_status()
         self.__response.raw.decode_content = True
+        self.__response_position = position
+        # The server has ignored the range so the bytes before are skipped
+        if position and self.__response.status_code != 206:
+            self.__ranges = False
+            self.__response_position = 0
+            while self.__response_position < position:
+                chunk = self.__response.raw.read(
+                    min(position - self.__response_position, io.DEFAULT_BUFFER_SIZE)
+                )
+                if not chunk:
+                    break
+                self.__response_position += len(chunk)
+
+    def __read_response(self, size):
+        position = self.__position
+        if self.__size is not None and position >= self.__size:
+            return b""
+        for attempt in range(config.DEFAULT_HTTP_RESUME_ATTEMPTS + 1):
+            try:
+                if self.__response_position != position:
+                    self.__request(position)
+                chunk = self.__response.raw.read(size)
+                break
+            except (urllib3.exceptions.HTTPError, requests.ConnectionError):
+                if not self.__ranges or attempt == config.DEFAULT_HTTP_RESUME_ATTEMPTS:
+                    raise
+                self.__response_position = None
+        self.__response_position += len(chunk)
+        if position == self.__length:
+            self.__buffer.seek(position)
+            self.__buffer.write(chunk)
+            self.__length += len(chunk)
+        return chunk
@@ -2,7 +2,6 @@ import io
 import json
 import yaml
 import tempfile
-import requests
 import jsonschema
 import stringcase
 from copy import deepcopy
@@ -12,6 +11,7 @@ from importlib import import_module
 from .helpers import cached_property
 from . import exceptions
 from . import helpers
+from . import config
 
 
 class Metadata(helpers.ControlledDict):
@@ -181,7 +181,11 @@ class Metadata(helpers.ControlledDict):
                 return deepcopy(descriptor) if self.metadata_duplicate else descriptor
             if isinstance(descriptor, str):
                 if helpers.is_remote_path(descriptor):
-                    response = requests.get(descriptor)
+                    system = import_module("frictionless.system").system
+                    session = system.get_http_session()
+                    response = session.get(
+                        descriptor, timeout=config.DEFAULT_HTTP_TIMEOUT
+                    )
                     response.raise_for_status()
                     content = response.text
                 else:
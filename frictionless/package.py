@@ -2,6 +2,8 @@ import os
 import json
 import glob
 import zipfile
+from multiprocessing import Pool, current_process
+from multiprocessing.pool import ThreadPool
 from copy import deepcopy
 from .metadata import Metadata
 from .resource import Resource
@@ -67,6 +69,7 @@ class Package(Metadata):
         self.setinitial("profile", profile)
         self.__basepath = basepath or helpers.detect_basepath(descriptor)
         self.__trusted = trusted
+        self.__lookup_indexes = {}
         super().__init__(descriptor)
 
     @Metadata.property
@@ -184,6 +187,29 @@ class Package(Metadata):
             self["resources"] = list(filter(predicat, self.resources))
         return resource
 
+    # Read
+
+    def read_lookup_index(self, name, key):
+        """Read an index of the resource's key cached for the package
+
+        An index is read once and shared by all the resources referencing
+        the key in their foreign keys (see `resource.read_lookup`).
+        The cache is reset on any package change.
+
+        Parameters:
+            name (str): resource name
+            key (str[]): key field names
+
+        Returns
+            set|Index: an index of the key cells tuples
+        """
+        key = tuple(key)
+        index = self.__lookup_indexes.get((name, key))
+        if index is None:
+            index = self.get_resource(name).read_lookup_index(key)
+            self.__lookup_indexes[(name, key)] = index
+        return index
+
     # Expand
 
     def expand(self):
@@ -198,12 +224,16 @@ class Package(Metadata):
 
     # Infer
 
-    def infer(self, source=None, *, only_sample=False):
+    def infer(self, source=None, *, only_sample=False, workers=None, infer_cache=None):
         """Infer package's attributes
 
         Parameters:
             source (str|str[]): path, list of paths or glob pattern
             only_sample? (bool): infer whatever possible but only from the sample
+            workers? (int): number of resources to infer concurrently;
+                remote and inline resources are inferred in threads
+                and local ones in processes
+            infer_cache? (str|Cache): directory to cache the inferred metadata in
         """
         self.setdefault("profile", config.DEFAULT_PACKAGE_PROFILE)
 
@@ -221,8 +251,53 @@ class Package(Metadata):
                     self.resources.append({"path": os.path.relpath(path, self.basepath)})
 
         # General
-        for resource in self.resources:
-            resource.infer(only_sample=only_sample)
+        if workers and workers > 1 and len(self.resources) > 1:
+            options = {"only_sample": only_sample, "infer_cache": infer_cache}
+            self.__infer_parallel(workers=workers, **options)
+        else:
+            for resource in self.resources:
+                resource.infer(only_sample=only_sample, infer_cache=infer_cache)
+
+    def __infer_parallel(self, *, only_sample, workers, infer_cache):
+
+        # Create tasks
+        # Remote sources are I/O-bound and local ones are CPU-bound
+        groups = {ThreadPool: [], Pool: []}
+        for index, resource in enumerate(self.resources):
+            Type = Pool
+            if resource.remote or resource.inline or current_process().daemon:
+                Type = ThreadPool
+            options = {"only_sample": only_sample, "infer_cache": infer_cache}
+            task = (resource.to_dict(), self.__basepath, self.__trusted, options)
+            groups[Type].append((index, task))
+
+        # Infer resources
+        descriptors = [None] * len(self.resources)
+        pools = []
+        try:
+            jobs = []
+            for Type, items in groups.items():
+                if items:
+                    pool = Type(min(workers, len(items)))
+                    pools.append(pool)
+                    tasks = [task for index, task in items]
+                    jobs.append((items, pool.map_async(infer_resource, tasks)))
+            for items, job in jobs:
+                for (index, task), descriptor in zip(items, job.get()):
+                    descriptors[index] = descriptor
+            for pool in pools:
+                pool.close()
+                pool.join()
+        finally:
+            for pool in pools:
+                pool.terminate()
+
+        # Update resources
+        # It's done in the resources' order to raise the first error
+        for resource, descriptor in zip(self.resources, descriptors):
+            if isinstance(descriptor, errors.Error):
+                raise exceptions.FrictionlessException(descriptor)
+            resource.update(descriptor)
 
     # Import/Export
 
@@ -350,6 +425,9 @@ class Package(Metadata):
 
     def metadata_process(self):
 
+        # Lookup
+        self.__lookup_indexes = {}
+
         # Resources
         resources = self.get("resources")
         if isinstance(resources, list):
@@ -379,3 +457,16 @@ class Package(Metadata):
         # Resources
         for resource in self.resources:
             yield from resource.metadata_errors
+
+
+# Internal
+
+
+def infer_resource(task):
+    descriptor, basepath, trusted, options = task
+    resource = Resource(descriptor, basepath=basepath, trusted=trusted)
+    try:
+        resource.infer(**options)
+    except exceptions.FrictionlessException as exception:
+        return exception.error
+    return resource.to_dict()
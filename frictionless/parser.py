@@ -131,7 +131,7 @@ class Parser:
         Returns:
             gen<any[][]>: data stream
         """
-        return DataStreamWithErrorHandling(data_stream)
+        return read_data_stream_with_error_handling(data_stream)
 
     # Write
 
@@ -148,26 +148,18 @@ class Parser:
 
 
 # NOTE: Try moving loader related errors to loader
-class DataStreamWithErrorHandling:
-    def __init__(self, data_stream):
-        self.data_stream = data_stream
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        try:
-            return self.data_stream.__next__()
-        except StopIteration:
-            raise
-        except exceptions.FrictionlessException:
-            raise
-        except config.COMPRESSION_EXCEPTIONS as exception:
-            error = errors.CompressionError(note=str(exception))
-            raise exceptions.FrictionlessException(error)
-        except UnicodeDecodeError as exception:
-            error = errors.EncodingError(note=str(exception))
-            raise exceptions.FrictionlessException(error) from exception
-        except Exception as exception:
-            error = errors.SourceError(note=str(exception))
-            raise exceptions.FrictionlessException(error) from exception
+def read_data_stream_with_error_handling(data_stream):
+    # It's a generator (not an iterator class) as it's much cheaper per row
+    try:
+        yield from data_stream
+    except exceptions.FrictionlessException:
+        raise
+    except config.COMPRESSION_EXCEPTIONS as exception:
+        error = errors.CompressionError(note=str(exception))
+        raise exceptions.FrictionlessException(error)
+    except UnicodeDecodeError as exception:
+        error = errors.EncodingError(note=str(exception))
+        raise exceptions.FrictionlessException(error) from exception
+    except Exception as exception:
+        error = errors.SourceError(note=str(exception))
+        raise exceptions.FrictionlessException(error) from exception
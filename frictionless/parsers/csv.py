@@ -21,14 +21,22 @@ class CsvParser(Parser):
         "string",
     ]
 
+    # It's disabled by the table for an already inferred dialect (e.g. cached)
+    infer_dialect = True
+
     # Read
 
     def read_data_stream_create(self):
-        sample = self.read_data_stream_infer_dialect()
-        source = chain(sample, self.loader.text_stream)
+        source = self.loader.text_stream
+        if self.infer_dialect and not self.read_data_stream_trust_dialect():
+            source = chain(self.read_data_stream_infer_dialect(), source)
         data = csv.reader(source, dialect=self.file.dialect.to_python())
         yield from data
 
+    def read_data_stream_trust_dialect(self):
+        # Sniffing can't change a dialect having all the names it detects
+        return all(name in self.file.dialect for name in TRUST_DIALECT_NAMES)
+
     def read_data_stream_infer_dialect(self):
         sample = extract_samle(self.loader.text_stream)
         delimiter = self.file.dialect.get("delimiter", ",\t;|")
@@ -79,6 +87,9 @@ INFER_DIALECT_NAMES = [
     "skipInitialSpace",
 ]
 
+# The sniffer always detects the default line terminator and no escape char
+TRUST_DIALECT_NAMES = ["delimiter", "quoteChar", "skipInitialSpace"]
+
 
 def extract_samle(text_stream):
     sample = []
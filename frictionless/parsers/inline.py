@@ -1,5 +1,6 @@
 from itertools import chain
 from collections import OrderedDict
+from collections.abc import Mapping
 from ..parser import Parser
 from .. import exceptions
 from .. import errors
@@ -51,14 +52,15 @@ class InlineParser(Parser):
             return
 
         # Keyed
-        if isinstance(cells, dict):
+        if isinstance(cells, Mapping):
             dialect["keyed"] = True
             headers = dialect.keys or list(cells.keys())
-            if not dialect.keys and not isinstance(cells, OrderedDict):
+            ordered = isinstance(cells, OrderedDict) or not isinstance(cells, dict)
+            if not dialect.keys and not ordered:
                 headers = sorted(headers)
             yield headers
             for cells in chain([cells], data):
-                if not isinstance(cells, dict):
+                if not isinstance(cells, Mapping):
                     error = errors.SourceError(note="all keyed data items must be dicts")
                     raise exceptions.FrictionlessException(error)
                 yield [cells.get(header) for header in headers]
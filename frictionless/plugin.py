@@ -22,6 +22,17 @@ class Plugin:
         """
         pass
 
+    def create_codec(self, file):
+        """Create codec
+
+        Parameters:
+            file (File): codec file
+
+        Returns:
+            Codec: codec
+        """
+        pass
+
     def create_control(self, file, *, descriptor):
         """Create control
 
@@ -1,5 +1,6 @@
 import os
 import io
+import threading
 import requests.utils
 from urllib.parse import urlparse
 from ..controls import Control
@@ -48,9 +49,21 @@ class S3Control(Control):
 
     """
 
-    def __init__(self, descriptor=None, endpoint_url=None, detect_encoding=None):
+    def __init__(
+        self,
+        descriptor=None,
+        endpoint_url=None,
+        detect_encoding=None,
+        hashing_thread=None,
+        decompression_thread=None,
+    ):
         self.setinitial("endpointUrl", endpoint_url)
-        super().__init__(descriptor, detect_encoding=detect_encoding)
+        super().__init__(
+            descriptor,
+            detect_encoding=detect_encoding,
+            hashing_thread=hashing_thread,
+            decompression_thread=decompression_thread,
+        )
 
     @property
     def endpoint_url(self):
@@ -65,13 +78,19 @@ class S3Control(Control):
 
     def expand(self):
         """Expand metadata"""
+        super().expand()
         self.setdefault("endpointUrl", self.endpoint_url)
 
     # Metadata
 
     metadata_profile = {  # type: ignore
         "type": "object",
-        "properties": {"endpointUrl": {"type": "string"}, "detectEncoding": {}},
+        "properties": {
+            "endpointUrl": {"type": "string"},
+            "detectEncoding": {},
+            "hashingThread": {"type": "boolean"},
+            "decompressionThread": {"type": "boolean"},
+        },
     }
 
 
@@ -92,9 +111,8 @@ class S3Loader(Loader):
     # Read
 
     def read_byte_stream_create(self):
-        boto3 = helpers.import_from_plugin("boto3", plugin="aws")
         control = self.file.control
-        client = boto3.client("s3", endpoint_url=control.endpoint_url)
+        client = get_s3_client(control.endpoint_url)
         source = requests.utils.requote_uri(self.file.source)
         parts = urlparse(source, allow_fragments=False)
         response = client.get_object(Bucket=parts.netloc, Key=parts.path[1:])
@@ -108,3 +126,20 @@ class S3Loader(Loader):
 # Internal
 
 DEFAULT_ENDPOINT_URL = "https://s3.amazonaws.com"
+
+
+# Internal
+
+
+S3_CLIENTS = {}
+S3_CLIENTS_LOCK = threading.Lock()
+
+
+def get_s3_client(endpoint_url):
+    """Get a process-wide S3 client (clients are thread-safe and pool connections)"""
+    boto3 = helpers.import_from_plugin("boto3", plugin="aws")
+    key = (endpoint_url, os.getpid())
+    with S3_CLIENTS_LOCK:
+        if key not in S3_CLIENTS:
+            S3_CLIENTS[key] = boto3.client("s3", endpoint_url=endpoint_url)
+        return S3_CLIENTS[key]
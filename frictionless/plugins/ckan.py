@@ -1,7 +1,7 @@
 import os
 import json
 import logging
-import requests
+from ..system import system
 from ..field import Field
 from ..schema import Schema
 from ..plugin import Plugin
@@ -238,7 +238,7 @@ class CkanStorage(Storage):
         records = []
         for r in row_stream:
             #  r = self.__mapper.convert_row(r, table.eschema)
-            records.append(r)
+            records.append(r.to_dict())
         params = {
             "resource_id": table.name,
             "method": method,
@@ -282,7 +282,7 @@ def make_ckan_request(url, method="GET", headers=None, api_key=None, **kwargs):
             api_key = os.environ.get(api_key[4:])
         headers.update({"Authorization": api_key})
 
-    response = requests.request(
+    response = system.get_http_session().request(
         method=method, url=url, headers=headers, allow_redirects=True, **kwargs
     )
 
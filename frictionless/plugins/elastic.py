@@ -200,7 +200,7 @@ class Storage(object):
                         "_index": bucket,
                         "_type": doc_type_,
                         "_id": self.generate_doc_id(row_, primary_key_),
-                        "_source": {"doc": row_, "doc_as_upsert": True},
+                        "_source": {"doc": row_.to_dict(), "doc_as_upsert": True},
                     }
             else:
                 for row_ in rows_:
@@ -209,7 +209,7 @@ class Storage(object):
                         "_index": bucket,
                         "_type": doc_type_,
                         "_id": self.generate_doc_id(row_, primary_key_),
-                        "_source": row_,
+                        "_source": row_.to_dict(),
                     }
 
         iterables = itertools.tee(rows)
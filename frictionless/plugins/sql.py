@@ -384,7 +384,7 @@ class SqlStorage(Storage):
         for row in resource.read_row_stream():
             for field in fallback_fields:
                 row[field.name], notes = field.write_cell(row[field.name])
-            buffer.append(row)
+            buffer.append(row.to_dict())
             if len(buffer) > buffer_size:
                 self.__connection.execute(sql_table.insert().values(buffer))
                 buffer = []
@@ -0,0 +1,98 @@
+import io
+from ..plugin import Plugin
+from ..codec import Codec
+from .. import exceptions
+from .. import helpers
+from .. import errors
+
+
+# Plugin
+
+
+class ZstdPlugin(Plugin):
+    """Plugin for Zstandard
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless.plugins.zstd import ZstdPlugin`
+
+    """
+
+    def create_codec(self, file):
+        if file.compression in ["zst", "zstd"]:
+            return ZstdCodec(file)
+
+
+# Codec
+
+
+class ZstdCodec(Codec):
+    """Zstandard codec implementation.
+
+    API      | Usage
+    -------- | --------
+    Public   | `from frictionless.plugins.zstd import ZstdCodec`
+
+    A multi-frame file is read as one stream. The decompression is
+    single-threaded in the zstd library so use the control's
+    `decompressionThread` to decompress in a background thread.
+
+    """
+
+    # Read
+
+    def read_byte_stream_decompress(self, byte_stream):
+        zstandard = helpers.import_from_plugin("zstandard", plugin="zstd")
+        return io.BufferedReader(ZstdByteStream(byte_stream, zstandard=zstandard))
+
+
+# Internal
+
+
+class ZstdByteStream(io.RawIOBase):
+    """Zstandard byte stream
+
+    The zstd reader can't seek backwards so it's recreated on rewinding.
+    """
+
+    def __init__(self, byte_stream, *, zstandard):
+        self.__byte_stream = byte_stream
+        self.__zstandard = zstandard
+        self.__reader = self.__create_reader()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        try:
+            return self.__reader.readinto(buffer)
+        except self.__zstandard.ZstdError as exception:
+            error = errors.CompressionError(note=str(exception))
+            raise exceptions.FrictionlessException(error)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if offset == 0 and whence == io.SEEK_SET:
+            self.__byte_stream.seek(0)
+            self.__reader = self.__create_reader()
+            return 0
+        return self.__reader.seek(offset, whence)
+
+    def tell(self):
+        return self.__reader.tell()
+
+    def close(self):
+        if not self.closed:
+            self.__reader.close()
+            self.__byte_stream.close()
+        super().close()
+
+    # Private
+
+    def __create_reader(self):
+        decompressor = self.__zstandard.ZstdDecompressor()
+        return decompressor.stream_reader(
+            self.__byte_stream, read_across_frames=True, closefd=False
+        )
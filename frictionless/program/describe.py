@@ -24,6 +24,8 @@ from .main import program
 @click.option("--infer-sample", type=int, help="Infer sample")
 @click.option("--infer-confidence", type=float, help="Infer confidence")
 @click.option("--infer-missing-values", type=str, multiple=True, help="Infer missing")
+@click.option("--infer-sampling", type=str, help="Infer sampling strategy")
+@click.option("--infer-cache", type=click.Path(), help="Infer cache directory")
 # Package/Resource
 @click.option("--basepath", type=str, help="Package basepath")
 @click.option("--trusted", is_flag=True, help="Allow unsafe paths")
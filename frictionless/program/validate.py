@@ -27,6 +27,8 @@ from .main import program
 @click.option("--infer-sample", type=int, help="Infer sample")
 @click.option("--infer-confidence", type=float, help="Infer confidence")
 @click.option("--infer-missing-values", type=str, multiple=True, help="Infer missing")
+@click.option("--infer-sampling", type=str, help="Infer sampling strategy")
+@click.option("--infer-cache", type=click.Path(), help="Infer cache directory")
 # Validation
 @click.option("--checksum-hash", type=str, help="Expected hash based on hashing option")
 @click.option("--checksum-bytes", type=int, help="Expected size in bytes")
@@ -35,6 +37,7 @@ from .main import program
 @click.option("--skip-errors", type=str, multiple=True, help="Skip errors")
 @click.option("--limit-errors", type=int, help="Limit errors")
 @click.option("--limit-memory", type=int, help="Limit memory")
+@click.option("--workers", type=int, help="Number of workers for CSV or inquiry validation")
 # Package/Resource
 @click.option("--basepath", type=str, help="Package basepath")
 @click.option("--trusted", is_flag=True, help="Allow unsafe paths")
@@ -257,7 +257,7 @@ class ReportTable(Metadata):
     def hashing(self):
         """
         Returns:
-            str: hashing
+            str|str[]: hashing
         """
         return self["hashing"]
 
@@ -3,13 +3,13 @@ import os
 import json
 import zipfile
 from copy import deepcopy
-from urllib.request import urlopen
 from .metadata import Metadata
 from .dialects import Dialect
 from .schema import Schema
 from .system import system
 from .table import Table
 from .file import File
+from .index import Index
 from . import exceptions
 from . import dialects
 from . import helpers
@@ -33,7 +33,7 @@ class Resource(Metadata):
         data? (any[][]): array or data arrays
         scheme? (str): file scheme
         format? (str): file format
-        hashing? (str): file hashing
+        hashing? (str|str[]): file hashing (the first algorithm is used for `hash`)
         encoding? (str): file encoding
         compression? (str): file compression
         compression_path? (str): file compression path
@@ -258,7 +258,7 @@ class Resource(Metadata):
     def hashing(self):
         """
         Returns
-            str?: resource hashing
+            str|str[]?: resource hashing
         """
         return self.get("hashing")
 
@@ -353,13 +353,13 @@ class Resource(Metadata):
 
     # Infer
 
-    # NOTE: optimize this logic/don't re-open
-    def infer(self, source=None, *, only_sample=False):
+    def infer(self, source=None, *, only_sample=False, infer_cache=None):
         """Infer metadata
 
         Parameters:
             source (str|str[]): path, list of paths or glob pattern
             only_sample? (bool): infer whatever possible but only from the sample
+            infer_cache? (str|Cache): directory to cache the inferred metadata in
         """
         patch = {}
 
@@ -370,9 +370,21 @@ class Resource(Metadata):
             if isinstance(source, list):
                 self.data = source
 
+        # Open table
+        # It's the same check as `resource.tabular` but the table is kept open
+        # so the whole source is read only once below (rows are not validated
+        # so the foreign keys lookup is not needed)
+        table = self.to_table(lookup=None, infer_cache=infer_cache)
+        try:
+            table.open()
+        except exceptions.FrictionlessException as exception:
+            if exception.error.code != "format-error":
+                raise
+            table = None
+
         # Tabular
-        if self.tabular:
-            with self.to_table() as table:
+        if table:
+            with table:
                 patch["profile"] = "tabular-data-resource"
                 patch["name"] = self.get("name", helpers.detect_name(table.path))
                 patch["scheme"] = table.scheme
@@ -383,6 +395,8 @@ class Resource(Metadata):
                 patch["compressionPath"] = table.compression_path
                 patch["dialect"] = table.dialect
                 patch["schema"] = table.schema
+                if not only_sample:
+                    patch.update(read_table_stats(table))
 
         # General
         else:
@@ -395,13 +409,15 @@ class Resource(Metadata):
                 patch["encoding"] = file.encoding
                 patch["compression"] = file.compression
                 patch["compressionPath"] = file.compression_path
+                if not only_sample:
+                    patch.update(read_file_stats(file))
 
         # Stats
+        # They are read in the same pass as the metadata above
         if not only_sample:
-            stats = self.read_stats()
-            patch.update(stats)
-            if patch["hashing"] != config.DEFAULT_HASHING:
-                patch["hash"] = ":".join([patch["hashing"], patch["hash"]])
+            hashing = helpers.parse_hashing(patch["hashing"])[0]
+            if hashing != config.DEFAULT_HASHING:
+                patch["hash"] = ":".join([hashing, patch["hash"]])
 
         # Apply/expand
         self.update(patch)
@@ -502,7 +518,6 @@ class Resource(Metadata):
         with self.to_table() as table:
             return table.sample
 
-    # NOTE: optimize this logic/don't re-open
     def read_stats(self):
         """
         Returns
@@ -512,19 +527,18 @@ class Resource(Metadata):
         # Tabular
         if self.tabular:
             with self.to_table() as table:
-                helpers.pass_through(table.data_stream)
-                return table.stats
+                return read_table_stats(table)
 
         # General
-        # NOTE: make loader.ByteStreamWithStatsHandling iterable / rebase on pass_through?
         with self.to_file() as file:
-            bytes = True
-            while bytes:
-                bytes = file.byte_stream.read1(io.DEFAULT_BUFFER_SIZE)
-            return file.stats
+            return read_file_stats(file)
 
     def read_lookup(self):
-        """
+        """Read lookup for the resource's foreign keys
+
+        Every referenced key is an `Index` of the key cells. For a resource
+        in a package the indexes are cached by the package (see `package.read_lookup_index`).
+
         Returns
             dict: resource lookup structure
         """
@@ -538,17 +552,46 @@ class Resource(Metadata):
             lookup.setdefault(source_name, {})
             if source_key in lookup[source_name]:
                 continue
-            lookup[source_name][source_key] = set()
             if not source_res:
+                lookup[source_name][source_key] = set()
                 continue
-            with source_res.to_table(lookup=None) as table:
-                for row in table.row_stream:
-                    cells = tuple(row.get(field_name) for field_name in source_key)
-                    if set(cells) == {None}:
-                        continue
-                    lookup[source_name][source_key].add(cells)
+            if self.__package and source_res.name:
+                index = self.__package.read_lookup_index(source_res.name, source_key)
+            else:
+                index = source_res.read_lookup_index(source_key)
+            lookup[source_name][source_key] = index
         return lookup
 
+    def read_lookup_index(self, key):
+        """Read an index of the resource's key
+
+        It's a set of the key cells tuples. If the resource has more than
+        `config.DEFAULT_INDEX_SIZE` keys, the set is converted to an `Index`
+        supporting the `in` operator that stores the keys compactly
+        and on disk (see the Index documentation).
+
+        Parameters:
+            key (str[]): key field names
+
+        Returns
+            set|Index: an index of the key cells tuples
+        """
+        index = set()
+        with self.to_table(lookup=None) as table:
+            for row in table.row_stream:
+                cells = tuple(row.get(field_name) for field_name in key)
+                if set(cells) == {None}:
+                    continue
+                if isinstance(index, set):
+                    if len(index) < config.DEFAULT_INDEX_SIZE:
+                        index.add(cells)
+                        continue
+                    index, keys = Index(hashed=True), index
+                    for item in keys:
+                        index[item] = True
+                index[cells] = True
+        return index
+
     # Import/Export
 
     @staticmethod
@@ -747,6 +790,26 @@ class Resource(Metadata):
 # Internal
 
 
+def read_table_stats(table):
+    helpers.pass_through(table.data_stream)
+    return table.stats
+
+
+def read_file_stats(file):
+    bytes = True
+    while bytes:
+        bytes = file.byte_stream.read1(io.DEFAULT_BUFFER_SIZE)
+    return file.stats
+
+
+def read_remote_stream(path):
+    session = system.get_http_session()
+    response = session.get(path, stream=True, timeout=config.DEFAULT_HTTP_TIMEOUT)
+    response.raise_for_status()
+    response.raw.decode_content = True
+    return io.BufferedReader(response.raw)
+
+
 class MultipartSource:
     def __init__(self, source, *, drop_header):
         self.__source = source
@@ -802,7 +865,7 @@ class MultipartSource:
     def read_line_stream(self):
         streams = []
         if helpers.is_remote_path(self.__source[0]):
-            streams = (urlopen(chunk) for chunk in self.__source)
+            streams = (read_remote_stream(chunk) for chunk in self.__source)
         else:
             streams = (io.open(chunk, "rb") for chunk in self.__source)
         for stream_number, stream in enumerate(streams, start=1):
@@ -1,11 +1,10 @@
 from itertools import zip_longest
-from collections import OrderedDict
-from .helpers import cached_property
+from collections.abc import Mapping
 from .parsers import JsonParser
 from . import errors
 
 
-class Row(OrderedDict):
+class Row(Mapping):
     """Row representation
 
     API      | Usage
@@ -13,6 +12,8 @@ class Row(OrderedDict):
     Public   | `from frictionless import Table`
 
     This object is returned by `extract`, `table.read_rows`, and other functions.
+    It's a mapping storing cells in a list and sharing one field index
+    per schema (see `schema.field_indexes`) to keep rows compact.
 
     ```python
     rows = extract("data/table.csv")
@@ -29,115 +30,80 @@ class Row(OrderedDict):
 
     """
 
+    __slots__ = (
+        "__cells",
+        "__indexes",
+        "__schema",
+        "__field_positions",
+        "__row_position",
+        "__row_number",
+        "__blank_cells",
+        "__error_cells",
+        "__error_specs",
+        "__errors",
+    )
+
     def __init__(self, cells, *, schema, field_positions, row_position, row_number):
         assert len(field_positions) in (len(cells), len(schema.fields))
 
         # Set attributes
         fields = schema.fields
+        self.__indexes = schema.field_indexes
         self.__schema = schema
         self.__field_positions = field_positions
         self.__row_position = row_position
         self.__row_number = row_number
-        self.__blank_cells = {}
-        self.__error_cells = {}
-        self.__errors = []
-
-        # Extra cells
-        if len(fields) < len(cells):
-            iterator = cells[len(fields) :]
-            start = max(field_positions[: len(fields)]) + 1
-            del cells[len(fields) :]
-            for field_position, cell in enumerate(iterator, start=start):
-                self.__errors.append(
-                    errors.ExtraCellError(
-                        note="",
-                        cells=list(map(str, cells)),
-                        row_number=row_number,
-                        row_position=row_position,
-                        cell=str(cell),
-                        field_name="",
-                        field_number=len(fields) + field_position - start,
-                        field_position=field_position,
-                    )
-                )
+        self.__blank_cells = None
+        self.__error_cells = None
+        self.__error_specs = None
+        self.__errors = None
 
-        # Missing cells
-        if len(fields) > len(cells):
-            start = len(cells) + 1
-            iterator = zip_longest(field_positions[len(cells) :], fields[len(cells) :])
-            for field_number, (field_position, field) in enumerate(iterator, start=start):
-                if field is not None:
-                    cells.append(None)
-                    self.__errors.append(
-                        errors.MissingCellError(
-                            note="",
-                            cells=list(map(str, cells)),
-                            row_number=row_number,
-                            row_position=row_position,
-                            cell="",
-                            field_name=field.name,
-                            field_number=field_number,
-                            field_position=field_position
-                            or max(field_positions) + field_number - start + 1,
-                        )
-                    )
+        # Error specs
+        # Errors are materialized on the first `row.errors` access sharing
+        # the stringified cells (see `create_errors`)
+        specs = normalize_cells(cells, fields=fields, field_positions=field_positions)
 
         # Iterate items
         field_number = 0
-        for field_position, field, source in zip(field_positions, fields, cells):
+        targets, target_notes = schema.read_data_compiled(cells)
+        self.__cells = targets
+        iterator = zip(field_positions, fields, cells, targets, target_notes)
+        for field_position, field, source, target, notes in iterator:
             field_number += 1
 
             # Read cell
-            target, notes = field.read_cell(source)
             type_note = notes.pop("type", None) if notes else None
             if target is None and not type_note:
+                if self.__blank_cells is None:
+                    self.__blank_cells = {}
                 self.__blank_cells[field.name] = source
-            self[field.name] = target
 
-            # Type error
+            # Cell errors
             if type_note:
+                if self.__error_cells is None:
+                    self.__error_cells = {}
                 self.__error_cells[field.name] = source
-                self.__errors.append(
-                    errors.TypeError(
-                        note=type_note,
-                        cells=list(map(str, cells)),
-                        row_number=row_number,
-                        row_position=row_position,
-                        cell=str(source),
-                        field_name=field.name,
+            if type_note or notes:
+                specs.extend(
+                    create_cell_error_specs(
+                        source,
+                        type_note=type_note,
+                        notes=notes,
+                        field=field,
                         field_number=field_number,
                         field_position=field_position,
                     )
                 )
 
-            # Constraint errors
-            if notes:
-                for note in notes.values():
-                    self.__errors.append(
-                        errors.ConstraintError(
-                            note=note,
-                            cells=list(map(str, cells)),
-                            row_number=row_number,
-                            row_position=row_position,
-                            cell=str(source),
-                            field_name=field.name,
-                            field_number=field_number,
-                            field_position=field_position,
-                        )
-                    )
-
         # Blank row
-        if len(self) == len(self.__blank_cells):
-            self.__errors = [
-                errors.BlankRowError(
-                    note="",
-                    cells=list(map(str, cells)),
-                    row_number=row_number,
-                    row_position=row_position,
-                )
-            ]
+        if len(self) == len(self.__blank_cells or ()):
+            specs = [BLANK_ROW_ERROR_SPEC]
+
+        # Save specs
+        if specs:
+            self.__error_specs = (cells, specs)
 
-    @cached_property
+    @property
     def schema(self):
         """
         Returns:
@@ -145,7 +111,7 @@ class Row(OrderedDict):
         """
         return self.__schema
 
-    @cached_property
+    @property
     def field_positions(self):
         """
         Returns:
@@ -153,7 +119,7 @@ class Row(OrderedDict):
         """
         return self.__field_positions
 
-    @cached_property
+    @property
     def row_position(self):
         """
         Returns:
@@ -161,7 +127,7 @@ class Row(OrderedDict):
         """
         return self.__row_position
 
-    @cached_property
+    @property
     def row_number(self):
         """
         Returns:
@@ -169,40 +135,104 @@ class Row(OrderedDict):
         """
         return self.__row_number
 
-    @cached_property
+    @property
     def blank_cells(self):
         """A mapping indexed by a field name with blank cells before parsing
 
         Returns:
             dict: row blank cells
         """
+        if self.__blank_cells is None:
+            self.__blank_cells = {}
         return self.__blank_cells
 
-    @cached_property
+    @property
     def error_cells(self):
         """A mapping indexed by a field name with error cells before parsing
 
         Returns:
             dict: row error cells
         """
+        if self.__error_cells is None:
+            self.__error_cells = {}
         return self.__error_cells
 
-    @cached_property
+    @property
     def errors(self):
         """
         Returns:
             Error[]: row errors
         """
+        if self.__errors is None:
+            self.__errors = []
+            if self.__error_specs:
+                cells, specs = self.__error_specs
+                self.__errors = create_errors(
+                    cells,
+                    specs,
+                    row_number=self.__row_number,
+                    row_position=self.__row_position,
+                )
+                self.__error_specs = None
         return self.__errors
 
-    @cached_property
+    def iter_errors(self, *, scope=None):
+        """Iterate row errors
+
+        Unlike `row.errors` it doesn't create errors having codes out of
+        the scope so it's cheap to skip most of the errors e.g. on validation.
+
+        Parameters:
+            scope? (str[]): error codes to be included (all if not set)
+
+        Yields:
+            Error: row errors
+        """
+        if scope is None or not self.__error_specs:
+            for error in self.errors:
+                if scope is None or error.code in scope:
+                    yield error
+            return
+        cells, specs = self.__error_specs
+        specs = [spec for spec in specs if spec[0].code in scope]
+        if specs:
+            yield from create_errors(
+                cells,
+                specs,
+                row_number=self.__row_number,
+                row_position=self.__row_position,
+            )
+
+    @property
     def valid(self):
         """
         Returns:
             bool: if row valid
         """
+        if self.__errors is None:
+            return not self.__error_specs
         return not self.__errors
 
+    # Mapping
+
+    def __getitem__(self, key):
+        return self.__cells[self.__indexes[key]]
+
+    def __setitem__(self, key, value):
+        self.__cells[self.__indexes[key]] = value
+
+    def __contains__(self, key):
+        return key in self.__indexes
+
+    def __iter__(self):
+        return iter(self.__indexes)
+
+    def __len__(self):
+        return len(self.__indexes)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
     # Import/Export
 
     def to_dict(self, *, json=False):
@@ -221,7 +251,7 @@ class Row(OrderedDict):
                     cell, notes = field.write_cell(cell)
                 result[field.name] = cell
             return result
-        return dict(self)
+        return {name: self.__cells[index] for name, index in self.__indexes.items()}
 
     def to_list(self, *, json=False):
         """
@@ -229,7 +259,7 @@ class Row(OrderedDict):
             json (bool): make data types compatible with JSON format
 
         Returns:
-            dict: a row as a list
+            list: a row as a list
         """
         if json:
             result = []
@@ -239,4 +269,101 @@ class Row(OrderedDict):
                     cell, notes = field.write_cell(cell)
                 result.append(cell)
             return result
-        return list(self.values())
+        return [self.__cells[index] for index in self.__indexes.values()]
+
+
+# Internal
+
+
+def normalize_cells(cells, *, fields, field_positions):
+    """Normalize cells in-place to the fields' length
+
+    An error spec is `(Error, size, options)` where `size` is a number of the
+    cells the error refers to (all if None). Errors are created from the specs
+    on demand by `create_errors` so the cells are stringified only once.
+
+    Returns:
+        tuple[]: extra and missing cell error specs
+    """
+    specs = []
+
+    # Extra cells
+    if len(fields) < len(cells):
+        iterator = cells[len(fields) :]
+        start = max(field_positions[: len(fields)]) + 1
+        del cells[len(fields) :]
+        for field_position, cell in enumerate(iterator, start=start):
+            options = {
+                "note": "",
+                "cell": cell,
+                "field_name": "",
+                "field_number": len(fields) + field_position - start,
+                "field_position": field_position,
+            }
+            specs.append((errors.ExtraCellError, len(cells), options))
+
+    # Missing cells
+    if len(fields) > len(cells):
+        start = len(cells) + 1
+        iterator = zip_longest(field_positions[len(cells) :], fields[len(cells) :])
+        for field_number, (field_position, field) in enumerate(iterator, start=start):
+            if field is not None:
+                cells.append(None)
+                options = {
+                    "note": "",
+                    "cell": "",
+                    "field_name": field.name,
+                    "field_number": field_number,
+                    "field_position": field_position
+                    or max(field_positions) + field_number - start + 1,
+                }
+                specs.append((errors.MissingCellError, len(cells), options))
+
+    return specs
+
+
+def create_cell_error_specs(
+    source, *, type_note, notes, field, field_number, field_position
+):
+    """Create type and constraint error specs for a cell
+
+    Returns:
+        tuple[]: cell error specs
+    """
+    specs = []
+    options = {
+        "cell": source,
+        "field_name": field.name,
+        "field_number": field_number,
+        "field_position": field_position,
+    }
+    if type_note:
+        specs.append((errors.TypeError, None, dict(options, note=type_note)))
+    if notes:
+        for note in notes.values():
+            specs.append((errors.ConstraintError, None, dict(options, note=note)))
+    return specs
+
+
+def create_errors(cells, specs, *, row_number, row_position):
+    """Create errors from error specs
+
+    Returns:
+        Error[]: row errors sharing the stringified cells
+    """
+    result = []
+    cells = list(map(str, cells))
+    for Error, size, options in specs:
+        if "cell" in options:
+            options = dict(options, cell=str(options["cell"]))
+        error = Error(
+            cells=cells if size is None else cells[:size],
+            row_number=row_number,
+            row_position=row_position,
+            **options,
+        )
+        result.append(error)
+    return result
+
+
+BLANK_ROW_ERROR_SPEC = (errors.BlankRowError, None, {"note": ""})
@@ -1,4 +1,5 @@
 from copy import copy, deepcopy
+from functools import partial, lru_cache
 from .metadata import Metadata
 from .field import Field
 from . import helpers
@@ -99,6 +100,20 @@ class Schema(Metadata):
         """
         return [field.name for field in self.fields]
 
+    @Metadata.property(write=False)
+    def field_indexes(self):
+        """A mapping indexed by a field name with field indexes
+
+        It's shared by all the rows of the table to access cells by name.
+
+        Returns:
+            dict: field indexes by field names
+        """
+        indexes = {}
+        for index, field in enumerate(self.fields):
+            indexes[field.name] = index
+        return indexes
+
     def add_field(self, descriptor):
         """Add new field to schema.
 
@@ -220,32 +235,31 @@ class Schema(Metadata):
 
         # Prepare fields
         fields = []
-        candidates = []
-        max_score = [len(sample)] * len(names)
+        columns = []
         for index, name in enumerate(names):
-            candidates.append([])
+            candidates = []
             for type in INFER_TYPES:
-                field = Field(name=name, type=type, schema=self)
-                candidates[index].append({"field": field, "score": 0})
+                candidates.append(Field(name=name, type=type, schema=self))
             fields.append(Field(name=name, type="any", schema=self))
+            columns.append(SchemaInferColumn(candidates, len(sample), confidence))
 
         # Infer fields
+        # The sample is left as soon as every field is inferred
+        pending = len(names)
         for cells in sample:
-            for index, name in enumerate(names):
+            for index, column in enumerate(columns):
                 if fields[index].type != "any":
                     continue
                 source = cells[index] if len(cells) > index else None
                 if source in missing_values:
-                    max_score[index] -= 1
+                    column.skip()
                     continue
-                for candidate in candidates[index]:
-                    if candidate["score"] < len(sample) * (confidence - 1):
-                        continue
-                    target, notes = candidate["field"].read_cell(source)
-                    candidate["score"] += 1 if not notes else -1
-                    if candidate["score"] >= max_score[index] * confidence:
-                        fields[index] = candidate["field"]
-                        break
+                field = column.read(source)
+                if field:
+                    fields[index] = field
+                    pending -= 1
+            if not pending:
+                break
 
         # Apply fields
         self.fields = fields
@@ -261,14 +275,20 @@ class Schema(Metadata):
         Returns:
             any[]: list of processed cells
         """
-        result_cells = []
-        result_notes = []
-        for index, field in enumerate(self.fields):
-            cell = cells[index] if len(cells) > index else None
-            cell, notes = field.read_cell(cell)
-            result_cells.append(cell)
-            result_notes.append(notes)
-        return result_cells, result_notes
+        return self.read_data_compiled(cells)
+
+    @Metadata.property(write=False)
+    def read_data_compiled(self):
+        """Read a list of cells compiled (normalize/cast)
+
+        The reader is created once for the current schema's state
+        using the fields' compiled readers. It's used by `schema.read_data`
+        and by the Row class to process the cells in a tight loop.
+
+        Returns:
+            func: a function `(cells) -> (cells, notes)` as `schema.read_data`
+        """
+        return SchemaReader([field.read_cell_compiled for field in self.fields])
 
     # Write
 
@@ -359,6 +379,8 @@ class Schema(Metadata):
                         field = {"name": f"field{index+1}", "type": "any"}
                     field = Field(field, schema=self)
                     list.__setitem__(fields, index, field)
+                # Changing a field is changing the schema (e.g. compiled readers)
+                field.__onchange__(partial(self.__onchange__, None))
             if not isinstance(fields, helpers.ControlledList):
                 fields = helpers.ControlledList(fields)
                 fields.__onchange__(self.metadata_process)
@@ -409,3 +431,131 @@ INFER_TYPES = [
     "year",
     "string",
 ]
+INFER_BITS = [1 << position for position in range(len(INFER_TYPES))]
+INFER_MASKS = dict(zip(INFER_TYPES, INFER_BITS))
+INFER_MASK_ALL = sum(INFER_BITS)
+INFER_DIGITS = frozenset("0123456789")
+
+
+def create_infer_mask(cell):
+    """Create a bitmask of the infer types a cell can be cast to (a superset of)
+
+    It's based on the cell's characters so it's much cheaper than casting
+    e.g. a cell without digits can't be an integer and without `:` a time.
+    """
+    if not isinstance(cell, str) or not cell.isascii():
+        return INFER_MASK_ALL
+    chars = set(cell)
+    mask = INFER_MASKS["boolean"] | INFER_MASKS["string"]
+    if not chars.isdisjoint(INFER_DIGITS):
+        mask |= INFER_MASKS["integer"] | INFER_MASKS["number"]
+        if "-" in chars:
+            mask |= INFER_MASKS["yearmonth"] | INFER_MASKS["date"]
+        if ":" in chars:
+            mask |= INFER_MASKS["time"] | INFER_MASKS["datetime"]
+        if len(cell) == 4:
+            mask |= INFER_MASKS["year"]
+    elif not chars.isdisjoint("nNiI"):
+        # Decimal accepts "NaN" and "Infinity"
+        mask |= INFER_MASKS["number"]
+    if "," in chars:
+        mask |= INFER_MASKS["geopoint"]
+    if "P" in chars:
+        mask |= INFER_MASKS["duration"]
+    if "{" in chars:
+        mask |= INFER_MASKS["geojson"] | INFER_MASKS["object"]
+    if "[" in chars:
+        mask |= INFER_MASKS["array"]
+    return mask
+
+
+@lru_cache(maxsize=None)
+def read_infer_positions(mask):
+    return [position for position, bit in enumerate(INFER_BITS) if mask & bit]
+
+
+class SchemaReader:
+    """Schema compiled reader
+
+    It's a callable class (not a closure) so a schema having
+    its compiled reader cached can be pickled e.g. for a process pool.
+    """
+
+    __slots__ = ["readers", "width"]
+
+    def __init__(self, readers):
+        self.readers = readers
+        self.width = len(readers)
+
+    def __call__(self, cells):
+        if len(cells) < self.width:
+            cells = list(cells) + [None] * (self.width - len(cells))
+        result_cells = []
+        result_notes = []
+        for reader, cell in zip(self.readers, cells):
+            cell, notes = reader(cell)
+            result_cells.append(cell)
+            result_notes.append(notes)
+        return result_cells, result_notes
+
+
+class SchemaInferColumn:
+    """Schema infer column state
+
+    Every candidate (in the `INFER_TYPES` order) gets +1 for a cell cast to its
+    type and -1 otherwise; the first one scoring `confidence` of the non-missing
+    cells is the column's field and a candidate scoring too low to ever get there
+    is dead. As every alive candidate is scored for every cell its score is
+    `2 * valid - count` so only the candidates the cell can be cast to (see
+    `create_infer_mask`) are read. The others can't be inferred by a failure
+    unless a missing cell has lowered the target so it's checked on the next cell.
+    """
+
+    __slots__ = [
+        "candidates",
+        "readers",
+        "min_score",
+        "max_score",
+        "confidence",
+        "count",
+        "valid",
+        "dead",
+        "lowered",
+    ]
+
+    def __init__(self, candidates, size, confidence):
+        self.candidates = candidates
+        self.readers = [candidate.read_cell_compiled for candidate in candidates]
+        self.min_score = size * (confidence - 1)
+        self.max_score = size
+        self.confidence = confidence
+        self.count = 0
+        self.valid = [0] * len(candidates)
+        self.dead = 0
+        self.lowered = True
+
+    def skip(self):
+        self.max_score -= 1
+        self.lowered = True
+
+    def read(self, source):
+        mask = create_infer_mask(source)
+        target = self.max_score * self.confidence
+        positions = read_infer_positions(INFER_MASK_ALL if self.lowered else mask)
+        self.lowered = False
+        self.count += 1
+        for position in positions:
+            bit = INFER_BITS[position]
+            if self.dead & bit:
+                continue
+            valid = self.valid[position]
+            if 2 * valid - self.count + 1 < self.min_score:
+                self.dead |= bit
+                continue
+            if mask & bit:
+                target_cell, notes = self.readers[position](source)
+                if not notes:
+                    valid += 1
+                    self.valid[position] = valid
+            if 2 * valid - self.count >= target:
+                return self.candidates[position]
@@ -1,8 +1,12 @@
 import os
 import pkgutil
+import requests
+import threading
+from urllib3.util.retry import Retry
 from collections import OrderedDict
 from importlib import import_module
 from .helpers import cached_property
+from .cache import HttpCacheAdapter
 from . import exceptions
 from . import errors
 from . import config
@@ -26,6 +30,7 @@ class System:
 
     actions = [
         "create_check",
+        "create_codec",
         "create_control",
         "create_dialect",
         "create_loader",
@@ -69,6 +74,33 @@ class System:
         note = f'cannot create check "{name}". Try installing "frictionless-{name}"'
         raise exceptions.FrictionlessException(errors.CheckError(note=note))
 
+    def create_codec(self, file):
+        """Create codec
+
+        Parameters:
+            file (File): codec file
+
+        Returns:
+            Codec: codec
+        """
+        codec = None
+        name = file.compression
+        codecs = import_module("frictionless.codecs")
+        for func in self.methods["create_codec"].values():
+            codec = func(file)
+            if codec is not None:
+                return codec
+        if name == "zip":
+            return codecs.ZipCodec(file)
+        elif name == "gz":
+            return codecs.GzipCodec(file)
+        elif name == "bz2":
+            return codecs.Bz2Codec(file)
+        elif name in ["xz", "lzma"]:
+            return codecs.XzCodec(file)
+        note = f'compression "{name}" is not supported'
+        raise exceptions.FrictionlessException(errors.CompressionError(note=note))
+
     def create_control(self, file, *, descriptor):
         """Create control
 
@@ -221,6 +253,53 @@ class System:
             raise exceptions.FrictionlessException(errors.Error(note=note))
         return storage
 
+    # Http
+
+    def get_http_session(self):
+        """Get the shared HTTP session
+
+        It's a process-wide session (a forked process creates its own) so
+        connections are kept alive and reused by all the remote resources.
+        Its pool and retries are configured by `config.DEFAULT_HTTP_*`.
+
+        Returns:
+            requests.Session: HTTP session
+        """
+        with self.__http_lock:
+            if self.__http_session_pid != os.getpid():
+                self.__http_session = create_http_session(cache=self.__http_cache)
+                self.__http_session_pid = os.getpid()
+            return self.__http_session
+
+    def set_http_session(self, session=None):
+        """Set the shared HTTP session
+
+        Parameters:
+            session? (requests.Session): HTTP session (reset to default if not set)
+        """
+        with self.__http_lock:
+            self.__http_session = session
+            self.__http_session_pid = os.getpid() if session else None
+
+    def set_http_cache(self, cache=None):
+        """Set the HTTP cache
+
+        The shared HTTP session is recreated to use the cache (a session
+        set by `set_http_session` is reset).
+
+        Parameters:
+            cache? (HttpCache): HTTP cache (disabled if not set)
+        """
+        with self.__http_lock:
+            self.__http_cache = cache
+            self.__http_session = None
+            self.__http_session_pid = None
+
+    __http_lock = threading.Lock()
+    __http_cache = None
+    __http_session = None
+    __http_session_pid = None
+
     # Methods
 
     @cached_property
@@ -257,3 +336,30 @@ class System:
 
 
 system = System()
+
+
+# Internal
+
+
+def create_http_session(*, cache=None):
+    retries = Retry(
+        total=config.DEFAULT_HTTP_RETRIES,
+        backoff_factor=config.DEFAULT_HTTP_BACKOFF,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    options = dict(
+        pool_connections=config.DEFAULT_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=config.DEFAULT_HTTP_POOL_MAXSIZE,
+        max_retries=retries,
+    )
+    adapter = (
+        HttpCacheAdapter(cache, **options)
+        if cache
+        else requests.adapters.HTTPAdapter(**options)
+    )
+    session = requests.Session()
+    session.headers.update(config.DEFAULT_HTTP_HEADERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
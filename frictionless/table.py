@@ -1,3 +1,7 @@
+import os
+import csv
+import mmap
+import random
 import typing
 from pathlib import Path
 from copy import deepcopy
@@ -7,6 +11,9 @@ from .schema import Schema
 from .system import system
 from .file import File
 from .row import Row
+from .batch import Batch
+from .index import Index
+from .cache import Cache, read_file_fingerprint
 from . import exceptions
 from . import errors
 from . import helpers
@@ -44,7 +51,8 @@ class Table:
         format? (str): File source's format (csv, xls, ...).
             If not set, it'll be inferred from `source`.
 
-        encoding? (str): An algorithm to hash data.
+        hashing? (str|str[]): An algorithm to hash data.
+            If it's a list all the algorithms are computed in one pass.
             It defaults to 'md5'.
 
         encoding? (str): Source encoding.
@@ -105,9 +113,29 @@ class Table:
             For more information, please check "Describing  Data" guide.
             It defaults to `['']`
 
+        infer_sampling? (str): A strategy to get the sample to infer the schema from.
+            It's `head` (the first `infer_volume` rows), `scan` (`infer_volume` rows
+            picked at random from a bounded scan of the first rows) or `seek`
+            (the first rows and `infer_volume` rows read at random byte offsets
+            of a local CSV file; it falls back to `scan` for other files).
+            It defaults to `head`
+
         lookup? (dict): The lookup is a special object providing relational information.
             For more information, please check "Extracting  Data" guide.
 
+        index_size? (int): The number of unique and primary keys kept in memory.
+            The rest of the keys are spilled to disk (see the Index documentation).
+            It defaults to 1000000
+
+        index_hashed? (bool): Whether to keep only digests of the keys in memory.
+            The keys are verified on disk only on a digest match.
+            By default the keys are hashed once there are more than `index_size` of them
+
+        infer_cache? (str|Cache): A directory to cache the inferred metadata in.
+            The encoding, dialect and schema of a local file are cached by its path
+            and the table options and reused while the file is not changed
+            (detected by its size, modification time and first bytes' hash)
+
     """
 
     # Public
@@ -136,7 +164,11 @@ class Table:
         infer_volume=config.DEFAULT_INFER_VOLUME,
         infer_confidence=config.DEFAULT_INFER_CONFIDENCE,
         infer_missing_values=config.DEFAULT_MISSING_VALUES,
+        infer_sampling=config.DEFAULT_INFER_SAMPLING,
         lookup=None,
+        index_size=config.DEFAULT_INDEX_SIZE,
+        index_hashed=None,
+        infer_cache=None,
     ):
 
         # Update source
@@ -166,7 +198,11 @@ class Table:
         self.__row_number = None
         self.__row_position = None
         self.__field_positions = None
-        self.__sample_positions = None
+        self.__scan = None
+        self.__scan_positions = None
+        self.__memory = None
+        self.__infer_cache_entry = None
+        self.__infer_cache_fingerprint = None
 
         # Store params
         self.__init_schema = schema
@@ -177,7 +213,13 @@ class Table:
         self.__infer_volume = infer_volume
         self.__infer_confidence = infer_confidence
         self.__infer_missing_values = infer_missing_values
+        self.__infer_sampling = infer_sampling
         self.__lookup = lookup
+        self.__index_size = index_size
+        self.__index_hashed = index_hashed
+        self.__infer_cache = infer_cache
+        if isinstance(infer_cache, (str, Path)):
+            self.__infer_cache = Cache(infer_cache)
 
         # Create file
         self.__file = File(
@@ -193,6 +235,25 @@ class Table:
             query=query,
         )
 
+        # Create cache key
+        # The file's metadata is updated on opening so it's created beforehand
+        self.__infer_cache_key = None
+        if self.__infer_cache is not None and isinstance(source, str):
+            descriptor = self.__file.to_dict()
+            descriptor["source"] = os.path.abspath(source)
+            self.__infer_cache_key = {
+                "file": descriptor,
+                "schema": schema,
+                "syncSchema": sync_schema,
+                "patchSchema": patch_schema,
+                "inferType": infer_type,
+                "inferNames": infer_names,
+                "inferVolume": infer_volume,
+                "inferConfidence": infer_confidence,
+                "inferMissingValues": infer_missing_values,
+                "inferSampling": infer_sampling,
+            }
+
     def __enter__(self):
         if self.closed:
             self.open()
@@ -241,7 +302,7 @@ class Table:
     def hashing(self):
         """
         Returns:
-            str?: file hashing
+            str|str[]?: file hashing
         """
         return self.__file.hashing
 
@@ -301,6 +362,30 @@ class Table:
         """
         return self.__schema
 
+    @property
+    def index_size(self):
+        """
+        Returns:
+            int: number of unique and primary keys kept in memory
+        """
+        return self.__index_size
+
+    @property
+    def index_hashed(self):
+        """
+        Returns:
+            bool?: whether only digests of unique and primary keys are kept in memory
+        """
+        return self.__index_hashed
+
+    @property
+    def infer_cache(self):
+        """
+        Returns:
+            Cache?: cache of the inferred metadata
+        """
+        return self.__infer_cache
+
     @property
     def header(self):
         """
@@ -322,12 +407,36 @@ class Table:
         """
         return self.__sample
 
+    @property
+    def sample_confidence(self):
+        """Tables's sample confidence
+
+        For every field it's the share of the sample's non-missing cells
+        that can be read as the field's type (e.g. 1 if the sample is valid).
+        It tells how well the inferred schema fits the sample.
+
+        Returns:
+            dict?: mapping of field names to confidences from 0 to 1
+        """
+        if self.__sample is None:
+            return None
+        result = {}
+        for index, field in enumerate(self.__schema.fields):
+            cells = [cells[index] for cells in self.__sample if len(cells) > index]
+            cells = [cell for cell in cells if cell is not None]
+            targets, notes = field.read_column(cells)
+            count = len([target for target in targets if target is not None])
+            invalid = len([note for note in notes if note])
+            result[field.name] = count / (count + invalid) if count + invalid else 1
+        return result
+
     @property
     def stats(self):
         """Table stats
 
         The stats object has:
             - hash: str - hashing sum
+            - hashes?: dict - hashing sums by algorithm (if hashing is a list)
             - bytes: int - number of bytes
             - rows: int - number of rows
 
@@ -335,6 +444,8 @@ class Table:
             dict?: table stats
 
         """
+        if self.__parser and self.__parser.loader:
+            self.__parser.loader.flush()
         return self.__file.stats
 
     @property
@@ -370,8 +481,10 @@ class Table:
         try:
             self.__file.stats = {"hash": "", "bytes": 0, "rows": 0}
             self.__parser = system.create_parser(self.__file)
+            self.__read_infer_cache()
             self.__parser.open()
             self.__data_stream = self.__read_data_stream()
+            self.__write_infer_cache()
             self.__row_stream = self.__read_row_stream()
             self.__row_number = 0
             self.__row_position = 0
@@ -393,6 +506,11 @@ class Table:
         if self.__parser:
             self.__parser.close()
             self.__parser = None
+        if self.__memory:
+            memory_unique, memory_primary, memory_first, memory_match = self.__memory
+            for index in [*memory_unique.values(), memory_primary]:
+                index.close()
+            self.__memory = None
 
     @property
     def closed(self):
@@ -422,9 +540,9 @@ class Table:
         stats = self.__file.stats
         limit = self.__file.query.limit_rows
         offset = self.__file.query.offset_rows or 0
-        sample_iterator = self.__read_data_stream_create_sample_iterator()
+        scan_iterator = self.__read_data_stream_create_scan_iterator()
         parser_iterator = self.__read_data_stream_create_parser_iterator()
-        for row_position, cells in chain(sample_iterator, parser_iterator):
+        for row_position, cells in chain(scan_iterator, parser_iterator):
             self.__row_position = row_position
             if offset:
                 offset -= 1
@@ -435,12 +553,16 @@ class Table:
             if limit and limit <= stats["rows"]:
                 break
 
-    def __read_data_stream_create_sample_iterator(self):
-        return zip(self.__sample_positions, self.__sample)
+    def __read_data_stream_create_scan_iterator(self):
+        return zip(self.__scan_positions, self.__scan)
 
     def __read_data_stream_create_parser_iterator(self):
-        start = max(self.__sample_positions or [0]) + 1
+        start = max(self.__scan_positions or [0]) + 1
         iterator = enumerate(self.__parser.data_stream, start=start)
+        query = self.__file.query
+        if not query.pick_rows and not query.skip_rows and not query.is_field_filtering:
+            yield from iterator
+            return
         for row_position, cells in iterator:
             if self.__read_data_stream_pick_skip_row(row_position, cells):
                 cells = self.__read_data_stream_filter_data(cells, self.__field_positions)
@@ -449,11 +571,18 @@ class Table:
     def __read_data_stream_infer(self):
 
         # Create state
-        sample = []
+        # The scanned rows are yielded first by the data stream
+        scan = []
         header = []
         field_positions = []
-        sample_positions = []
+        scan_positions = []
+        scan_volume = self.__infer_volume
+        sampling = self.__read_data_stream_infer_sampling()
+        if sampling == "scan":
+            scan_volume = max(scan_volume, config.DEFAULT_INFER_SCAN_VOLUME)
         schema = Schema(self.__init_schema)
+        if self.__infer_cache_entry and self.__infer_cache_entry["schema"]:
+            schema = Schema(self.__infer_cache_entry["schema"])
 
         # Prepare header
         buffer = []
@@ -506,12 +635,23 @@ class Table:
                     if not header_ready or dialect.header:
                         continue
 
-                # Sample
-                sample.append(self.__read_data_stream_filter_data(cells, field_positions))
-                sample_positions.append(row_position)
-                if len(sample) >= self.__infer_volume:
+                # Scan
+                scan.append(self.__read_data_stream_filter_data(cells, field_positions))
+                scan_positions.append(row_position)
+                if len(scan) >= scan_volume:
                     break
 
+        # Sample table
+        # It's deterministic so the same table is always inferred the same way
+        sample = scan
+        generator = random.Random(0)
+        if sampling == "scan" and len(scan) > self.__infer_volume:
+            indexes = generator.sample(range(len(scan)), self.__infer_volume)
+            sample = [scan[index] for index in sorted(indexes)]
+        elif sampling == "seek":
+            width = len(header) or max(map(len, scan), default=0)
+            sample = scan + self.__read_data_stream_infer_seek(generator, width)
+
         # Infer schema
         if not schema.fields:
             schema.infer(
@@ -547,9 +687,62 @@ class Table:
         self.__sample = sample
         self.__schema = schema
         self.__field_positions = field_positions
-        self.__sample_positions = sample_positions
+        self.__scan = scan
+        self.__scan_positions = scan_positions
         self.__header = Header(header, schema=schema, field_positions=field_positions)
 
+    def __read_data_stream_infer_sampling(self):
+        sampling = self.__infer_sampling
+        if sampling == "seek":
+            if self.__file.scheme != "file" or self.__file.format != "csv":
+                sampling = "scan"
+            elif self.__file.compression != config.DEFAULT_COMPRESSION:
+                sampling = "scan"
+            elif self.__file.query or "\n".encode(self.__file.encoding) != b"\n":
+                sampling = "scan"
+        if sampling not in INFER_SAMPLINGS:
+            note = f'infer sampling "{sampling}" is not supported'
+            raise exceptions.FrictionlessException(errors.SchemaError(note=note))
+        return sampling
+
+    def __read_data_stream_infer_seek(self, generator, width):
+        buffer = self.__parser.loader.buffer
+        if buffer is not None:
+            return self.__read_data_stream_infer_seek_buffer(buffer, generator, width)
+        with open(self.__file.path, "rb") as file:
+            if not os.fstat(file.fileno()).st_size:
+                return []
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return self.__read_data_stream_infer_seek_buffer(buffer, generator, width)
+
+    def __read_data_stream_infer_seek_buffer(self, buffer, generator, width):
+        sample = []
+        starts = set()
+        size = len(buffer)
+        dialect = self.__file.dialect.to_python()
+        for _ in range(self.__infer_volume):
+
+            # Read line
+            # The line at the offset can be partial so the next one is read
+            start = buffer.find(b"\n", generator.randrange(size)) + 1
+            if not start or start == size or start in starts:
+                continue
+            starts.add(start)
+            end = buffer.find(b"\n", start) + 1 or size
+            line = buffer[start:end]
+
+            # Read cells
+            # A line within a multiline cell is likely to have a wrong width
+            line = line.decode(self.__file.encoding, errors="replace")
+            try:
+                cells = next(csv.reader([line], dialect=dialect), [])
+            except csv.Error:
+                continue
+            if len(cells) == width:
+                sample.append(cells)
+
+        return sample
+
     def __read_data_stream_infer_header(self, header_data):
         dialect = self.__file.dialect
 
@@ -642,6 +835,41 @@ class Table:
             return result
         return cells
 
+    def __read_infer_cache(self):
+        self.__infer_cache_entry = None
+        self.__infer_cache_fingerprint = None
+        if self.__infer_cache_key is None or self.__file.scheme != "file":
+            return
+        if not os.path.isfile(self.__file.path):
+            return
+
+        # Read entry
+        # The fingerprint is read before the file so a change while reading is a miss
+        volume = config.DEFAULT_INFER_CACHE_VOLUME
+        fingerprint = read_file_fingerprint(self.__file.path, volume=volume)
+        entry = self.__infer_cache.get(self.__infer_cache_key)
+        self.__infer_cache_fingerprint = fingerprint
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return
+
+        # Apply entry
+        # The encoding, dialect and schema are not detected for a cached file
+        self.__infer_cache_entry = entry
+        if entry["encoding"]:
+            self.__file["encoding"] = entry["encoding"]
+        self.__file["dialect"] = entry["dialect"]
+        self.__parser.infer_dialect = False
+
+    def __write_infer_cache(self):
+        if self.__infer_cache_fingerprint is None or self.__infer_cache_entry:
+            return
+        entry = {}
+        entry["fingerprint"] = self.__infer_cache_fingerprint
+        entry["encoding"] = self.__file.get("encoding")
+        entry["dialect"] = self.__file.dialect.to_dict()
+        entry["schema"] = None if self.__init_schema else self.__schema.to_dict()
+        self.__infer_cache.set(self.__infer_cache_key, entry)
+
     def __read_data_stream_raise_closed(self):
         if not self.__data_stream:
             note = 'the table has not been opened by "table.open()"'
@@ -664,11 +892,18 @@ class Table:
 
         # Create state
         memory_unique = {}
-        memory_primary = {}
+        memory_primary = Index(size=self.__index_size, hashed=self.__index_hashed)
+        memory_first = {"unique": {}, "primary": {}}
+        memory_match = {"unique": {}, "primary": {}}
         foreign_groups = []
         for field in self.schema.fields:
             if field.constraints.get("unique"):
-                memory_unique[field.name] = {}
+                memory_unique[field.name] = Index(
+                    size=self.__index_size, hashed=self.__index_hashed
+                )
+                memory_first["unique"][field.name] = {}
+                memory_match["unique"][field.name] = {}
+        self.__memory = (memory_unique, memory_primary, memory_first, memory_match)
         if self.__lookup:
             for fk in self.schema.foreign_keys:
                 group = {}
@@ -701,6 +936,8 @@ class Table:
                             note = "the same as in the row at position %s" % match
                             error = Error.from_row(row, note=note, field_name=field_name)
                             row.errors.append(error)
+                            memory_first["unique"][field_name].setdefault(cell, match)
+                            memory_match["unique"][field_name][row.row_position] = match
 
             # Primary Key Error
             if schema.primary_key:
@@ -717,6 +954,8 @@ class Table:
                             note = "the same as in the row at position %s" % match
                             error = errors.PrimaryKeyError.from_row(row, note=note)
                             row.errors.append(error)
+                            memory_first["primary"].setdefault(cells, match)
+                            memory_match["primary"][row.row_position] = match
 
             # Foreign Key Error
             if foreign_groups:
@@ -735,6 +974,74 @@ class Table:
             # Stream row
             yield row
 
+    def partial_state(self):
+        """Unique and primary key state of the rows read so far
+
+        It's used to merge the shards of a table validated in parallel
+        (see `Check.merge`). Every key is mapped to a pair of its first
+        and last row positions. The `matches` key maps the positions of
+        the rows having unique and primary key errors to the matched rows.
+
+        Returns:
+            dict: a state with `unique`, `primary`, and `matches` keys
+        """
+        state = {"unique": {}, "primary": {}, "matches": {"unique": {}, "primary": {}}}
+        if self.__memory:
+            memory_unique, memory_primary, memory_first, memory_match = self.__memory
+            state["matches"] = memory_match
+            for field_name, memory in memory_unique.items():
+                first = memory_first["unique"][field_name]
+                items = memory.items()
+                state["unique"][field_name] = {k: (first.get(k, v), v) for k, v in items}
+            first = memory_first["primary"]
+            items = memory_primary.items()
+            state["primary"] = {k: (first.get(k, v), v) for k, v in items}
+        return state
+
+    def read_batches(self, *, size=config.DEFAULT_BATCH_SIZE):
+        """Read data stream in column-oriented batches
+
+        It's an alternative to the row stream for processing big tables
+        as columns (e.g. using pandas or numpy) without creating Row objects.
+        Note that the batches are not checked for unique, primary key,
+        and foreign key constraints as it happens for the row stream.
+
+        Parameters:
+            size? (int): maximum number of rows in a batch
+
+        Returns:
+            gen<Batch>: batch stream
+        """
+        self.__read_data_stream_raise_closed()
+        return self.__read_batch_stream_create(size)
+
+    def __read_batch_stream_create(self, size):
+        data = []
+        row_positions = []
+        row_numbers = []
+        for cells in self.__data_stream:
+            data.append(cells)
+            row_positions.append(self.__row_position)
+            row_numbers.append(self.__file.stats["rows"])
+            if len(data) >= size:
+                yield self.__read_batch_stream_create_batch(
+                    data, row_positions, row_numbers
+                )
+                data = []
+                row_positions = []
+                row_numbers = []
+        if data:
+            yield self.__read_batch_stream_create_batch(data, row_positions, row_numbers)
+
+    def __read_batch_stream_create_batch(self, data, row_positions, row_numbers):
+        return Batch(
+            data,
+            schema=self.__schema,
+            field_positions=self.__field_positions,
+            row_positions=row_positions,
+            row_numbers=row_numbers,
+        )
+
     def __read_row_stream_raise_closed(self):
         if not self.__row_stream:
             note = 'the table has not been opened by "table.open()"'
@@ -785,3 +1092,9 @@ class Table:
     def __write_row_stream_create(self):
         self.__read_data_stream_raise_closed()
         yield from self.row_stream
+
+
+# Internal
+
+
+INFER_SAMPLINGS = ["head", "scan", "seek"]
@@ -44,6 +44,21 @@ class Type:
         """
         raise NotImplementedError()
 
+    def read_column(self, cells):
+        """Convert column (read direction)
+
+        Subclasses can override this method to convert many cells at once
+        using faster techniques than converting them one by one.
+
+        Parameters:
+            cells (any[]): non-missing cells to covert
+
+        Returns:
+            (any[], bool[]): converted cells and a mask of failed positions
+        """
+        cells = list(map(self.read_cell, cells))
+        return cells, [cell is None for cell in cells]
+
     # Write
 
     def write_cell(self, cell):
@@ -40,6 +40,21 @@ class IntegerType(Type):
             return int(cell)
         return None
 
+    def read_column(self, cells):
+        # Cast a column of bare number strings without the per-cell dispatch
+        if not self.read_cell_pattern and set(map(type, cells)) == {str}:
+            targets = []
+            mask = []
+            for cell in cells:
+                try:
+                    targets.append(int(cell))
+                    mask.append(False)
+                except Exception:
+                    targets.append(None)
+                    mask.append(True)
+            return targets, mask
+        return super().read_column(cells)
+
     @Metadata.property(write=False)
     def read_cell_pattern(self):
         if not self.field.bare_number:
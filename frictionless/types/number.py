@@ -40,6 +40,21 @@ class NumberType(Type):
             return Decimal(str(cell))
         return None
 
+    def read_column(self, cells):
+        # Cast a column of plain number strings without the per-cell dispatch
+        if not self.read_cell_processor and set(map(type, cells)) == {str}:
+            targets = []
+            mask = []
+            for cell in cells:
+                try:
+                    targets.append(Decimal(cell))
+                    mask.append(False)
+                except Exception:
+                    targets.append(None)
+                    mask.append(True)
+            return targets, mask
+        return super().read_column(cells)
+
     @Metadata.property(write=False)
     def read_cell_processor(self):
         if set(["groupChar", "decimalChar", "bareNumber"]).intersection(
@@ -1,15 +1,17 @@
 from functools import partial
-from multiprocessing import Pool
+from multiprocessing import Pool, cpu_count, current_process
+from multiprocessing.pool import ThreadPool
 from ..inquiry import Inquiry
 from ..report import Report
 from ..errors import Error
 from .main import validate
 from .. import helpers
 from .. import exceptions
+from .. import config
 
 
 @Report.from_validate
-def validate_inquiry(source):
+def validate_inquiry(source, *, workers=None):
     """Validate inquiry
 
     API      | Usage
@@ -18,6 +20,9 @@ def validate_inquiry(source):
 
     Parameters:
         source (dict|str): an inquiry descriptor
+        workers? (int): number of tasks to validate concurrently;
+            remote tasks are validated in threads (sharing the HTTP session)
+            and local ones in processes
 
     Returns:
         Report: validation report
@@ -51,8 +56,7 @@ def validate_inquiry(source):
 
     # Validate tasks
     if len(tasks) > 1:
-        with Pool() as pool:
-            reports.extend(pool.map(partial(helpers.apply_function, validate), tasks))
+        reports.extend(validate_tasks_parallel(tasks, workers=workers))
 
     # Return report
     errors = []
@@ -61,3 +65,54 @@ def validate_inquiry(source):
         errors.extend(report["errors"])
         tables.extend(report["tables"])
     return Report(time=timer.time, errors=errors, tables=tables)
+
+
+# Internal
+
+
+def validate_tasks_parallel(tasks, *, workers):
+
+    # Create groups
+    # Remote tasks are I/O-bound and local ones are CPU-bound
+    groups = {ThreadPool: [], Pool: []}
+    for index, task in enumerate(tasks):
+        Type = Pool
+        if is_remote_task(task) or current_process().daemon:
+            Type = ThreadPool
+        groups[Type].append((index, task))
+
+    # Validate tasks
+    reports = [None] * len(tasks)
+    pools = []
+    try:
+        jobs = []
+        for Type, items in groups.items():
+            if items:
+                size = config.DEFAULT_HTTP_POOL_MAXSIZE
+                if Type is Pool:
+                    size = cpu_count()
+                pool = Type(min(workers or size, len(items)))
+                pools.append(pool)
+                function = partial(helpers.apply_function, validate)
+                tasks = [task for index, task in items]
+                jobs.append((items, pool.map_async(function, tasks)))
+        for items, job in jobs:
+            for (index, task), report in zip(items, job.get()):
+                reports[index] = report
+        for pool in pools:
+            pool.close()
+            pool.join()
+    finally:
+        for pool in pools:
+            pool.terminate()
+
+    return reports
+
+
+def is_remote_task(task):
+    source = task.get("source")
+    if isinstance(source, dict):
+        source = source.get("path")
+    if isinstance(source, list):
+        source = source[0] if source else None
+    return isinstance(source, str) and helpers.is_remote_path(source)
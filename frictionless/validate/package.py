@@ -37,7 +37,7 @@ def validate_package(source, basepath=None, trusted=False, noinfer=False, **opti
 
     # Prepare package
     if not noinfer:
-        package.infer(only_sample=True)
+        package.infer(only_sample=True, infer_cache=options.get("infer_cache"))
 
     if package.metadata_errors:
         return Report(time=timer.time, errors=package.metadata_errors, tables=[])
@@ -36,7 +36,7 @@ def validate_resource(source, basepath=None, noinfer=False, lookup=None, **optio
 
     # Prepare resource
     if not noinfer:
-        resource.infer(only_sample=True)
+        resource.infer(only_sample=True, infer_cache=options.get("infer_cache"))
     if resource.metadata_errors:
         return Report(time=timer.time, errors=resource.metadata_errors, tables=[])
 
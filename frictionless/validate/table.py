@@ -1,8 +1,16 @@
+import io
+import os
+import csv
+import mmap
+import codecs
+from itertools import chain
+from multiprocessing import Pool, current_process
 from .. import config
 from .. import errors
 from .. import helpers
 from .. import exceptions
 from ..table import Table
+from ..loader import StatsHasher
 from ..system import system
 from ..report import Report, ReportTable
 
@@ -31,7 +39,11 @@ def validate_table(
     infer_volume=config.DEFAULT_INFER_VOLUME,
     infer_confidence=config.DEFAULT_INFER_CONFIDENCE,
     infer_missing_values=config.DEFAULT_MISSING_VALUES,
+    infer_sampling=config.DEFAULT_INFER_SAMPLING,
     lookup=None,
+    index_size=config.DEFAULT_INDEX_SIZE,
+    index_hashed=None,
+    infer_cache=None,
     # Validation
     checksum=None,
     extra_checks=None,
@@ -39,6 +51,7 @@ def validate_table(
     skip_errors=None,
     limit_errors=None,
     limit_memory=config.DEFAULT_LIMIT_MEMORY,
+    workers=None,
 ):
     """Validate table
 
@@ -58,7 +71,8 @@ def validate_table(
         format? (str): File source's format (csv, xls, ...).
             If not set, it'll be inferred from `source`.
 
-        encoding? (str): An algorithm to hash data.
+        hashing? (str|str[]): An algorithm to hash data.
+            If it's a list all the algorithms are computed in one pass.
             It defaults to 'md5'.
 
         encoding? (str): Source encoding.
@@ -119,15 +133,34 @@ def validate_table(
             For more information, please check "Describing  Data" guide.
             It defaults to `['']`
 
+        infer_sampling? (str): A strategy to get the sample to infer the schema from.
+            It's `head`, `scan` or `seek` (see the Table documentation).
+            It defaults to `head`
+
         lookup? (dict): The lookup is a special object providing relational information.
             For more information, please check "Extracting  Data" guide.
 
+        index_size? (int): The number of unique and primary keys kept in memory.
+            The rest of the keys are spilled to disk (see the Index documentation).
+            It defaults to 1000000
+
+        index_hashed? (bool): Whether to keep only digests of the keys in memory.
+            The keys are verified on disk only on a digest match.
+            By default the keys are hashed once there are more than `index_size` of them
+
+        infer_cache? (str|Cache): A directory to cache the inferred metadata in.
+            The encoding, dialect and schema of an unchanged local file are
+            not detected again (see the Cache documentation).
+
         checksum? (dict): a checksum dictionary
         extra_checks? (list): a list of extra checks
         pick_errors? ((str|int)[]): pick errors
         skip_errors? ((str|int)[]): skip errors
         limit_errors? (int): limit errors
         limit_memory? (int): limit memory
+        workers? (int): number of processes to validate a local CSV file in parallel.
+            It falls back to sequential validation if the table or checks don't support it.
+            The memory limit is applied to the main process holding the merged state
 
     Returns:
         Report: validation report
@@ -146,11 +179,9 @@ def validate_table(
     items.append("baseline")
     items.append(("checksum", checksum))
     items.extend(extra_checks or [])
-    create = system.create_check
     for item in items:
-        p1, p2 = item if isinstance(item, (tuple, list)) else (item, None)
-        check = p1(p2) if isinstance(p1, type) else create(p1, descriptor=p2)
-        checks.append(check)
+        checks.append(create_check(item))
+    created = list(zip(items, checks))
 
     # Create table
     table = Table(
@@ -175,7 +206,11 @@ def validate_table(
         infer_volume=infer_volume,
         infer_confidence=infer_confidence,
         infer_missing_values=infer_missing_values,
+        infer_sampling=infer_sampling,
         lookup=lookup,
+        index_size=index_size,
+        index_hashed=index_hashed,
+        infer_cache=infer_cache,
     )
 
     # Open table
@@ -191,7 +226,7 @@ def validate_table(
             # Prepare checks
             for check in checks:
                 table_errors.register(check)
-                check.connect(table)
+                check.connect(table, scope=table_errors.scope)
                 check.prepare()
 
             # Validate task
@@ -213,27 +248,59 @@ def validate_table(
                         table_errors.append(error)
 
             # Validate rows
-            for row in table.row_stream:
-
-                # Validate row
-                for check in checks:
-                    for error in check.validate_row(row):
+            if workers and workers > 1 and is_parallel_table(table, checks):
+                options = {}
+                ids = set(map(id, checks))
+                options["items"] = [item for item, check in created if id(check) in ids]
+                options["lookup"] = lookup
+                options["pick_errors"] = pick_errors
+                options["skip_errors"] = skip_errors
+                options["limit_errors"] = limit_errors
+                stream = validate_table_parallel(
+                    table, checks, workers=workers, **options
+                )
+                for shard_errors in stream:
+
+                    # Validate shard
+                    for error in shard_errors:
                         table_errors.append(error)
 
-                # Limit errors
-                if limit_errors and len(table_errors) >= limit_errors:
-                    partial = True
-                    break
-
-                # Limit memory
-                if limit_memory and not table.stats["rows"] % 100000:
-                    memory = helpers.get_current_memory_usage()
-                    if memory and memory > limit_memory:
-                        note = f'exceeded memory limit "{limit_memory}MB"'
-                        task_errors.append(errors.TaskError(note=note))
+                    # Limit errors
+                    if limit_errors and len(table_errors) >= limit_errors:
                         partial = True
                         break
 
+                    # Limit memory
+                    # Only the merged state is checked as workers hold one shard
+                    if limit_memory:
+                        memory = helpers.get_current_memory_usage()
+                        if memory and memory > limit_memory:
+                            note = f'exceeded memory limit "{limit_memory}MB"'
+                            task_errors.append(errors.TaskError(note=note))
+                            partial = True
+                            break
+            else:
+                for row in table.row_stream:
+
+                    # Validate row
+                    for check in checks:
+                        for error in check.validate_row(row):
+                            table_errors.append(error)
+
+                    # Limit errors
+                    if limit_errors and len(table_errors) >= limit_errors:
+                        partial = True
+                        break
+
+                    # Limit memory
+                    if limit_memory and not table.stats["rows"] % 100000:
+                        memory = helpers.get_current_memory_usage()
+                        if memory and memory > limit_memory:
+                            note = f'exceeded memory limit "{limit_memory}MB"'
+                            task_errors.append(errors.TaskError(note=note))
+                            partial = True
+                            break
+
             # Validate table
             if not partial:
                 for check in checks:
@@ -302,3 +369,269 @@ class TableErrors(list):
             if error.code in self.__scope:
                 continue
             self.__scope.append(error.code)
+
+
+def create_check(item):
+    p1, p2 = item if isinstance(item, (tuple, list)) else (item, None)
+    return p1(p2) if isinstance(p1, type) else system.create_check(p1, descriptor=p2)
+
+
+# Internal (parallel)
+
+
+def is_parallel_table(table, checks):
+    dialect = table.dialect
+    if current_process().daemon:
+        return False
+    if table.scheme != "file" or table.format != "csv" or table.query:
+        return False
+    if table.compression != config.DEFAULT_COMPRESSION:
+        return False
+    if dialect.header and dialect.header_rows != config.DEFAULT_HEADER_ROWS:
+        return False
+    if not is_ascii_compatible(table.encoding):
+        return False
+    return all(check.mergeable for check in checks)
+
+
+def is_ascii_compatible(encoding):
+    text = "\r\n\"',;|\t"
+    try:
+        return codecs.decode(text.encode("ascii"), encoding) == text
+    except Exception:
+        return False
+
+
+def validate_table_parallel(table, checks, *, workers, lookup, **options):
+    """Validate a table in parallel yielding errors shard by shard
+
+    The lookup is sent to every worker only once on the pool's creation
+    and every worker memory-maps the file once to read its chunks.
+    """
+    task_options = options.copy()
+    task_options["encoding"] = table.encoding
+    task_options["dialect"] = table.dialect.to_dict(expand=True)
+    task_options["schema"] = table.schema.to_dict()
+    task_options["index_size"] = table.index_size
+    task_options["index_hashed"] = table.index_hashed
+    chunks = read_table_chunks(table, workers=workers)
+    tasks = ((chunk, task_options) for chunk in chunks)
+
+    # Create pool
+    # It's only terminated on early exit as limit errors (otherwise it's joined)
+    initargs = (lookup, table.path)
+    pool = Pool(workers, initializer=prepare_table_worker, initargs=initargs)
+    try:
+        rows = 0
+        last = 0
+        for result in pool.imap(validate_table_chunk, tasks):
+            if isinstance(result, errors.Error):
+                raise exceptions.FrictionlessException(result)
+            [start, end, prefix], positions, chunk_rows, results = result
+            offset = last - 1 if prefix else last
+            last = offset + positions
+
+            # Merge shard
+            shard_errors = []
+            for check, [state, row_errors] in zip(checks, results):
+                for error in row_errors:
+                    shift_error(error, row_position=offset, row_number=rows)
+                merge_options = {}
+                merge_options["row_errors"] = row_errors
+                merge_options["row_position"] = offset
+                merge_options["row_number"] = rows
+                shard_errors.extend(check.merge(state, **merge_options))
+            shard_errors.sort(key=lambda error: error.get("rowPosition", 0))
+            rows += chunk_rows
+            table.stats["rows"] = rows
+            yield shard_errors
+
+        pool.close()
+        pool.join()
+
+        # Finalize checks
+        yield [error for check in checks for error in check.finalize()]
+    finally:
+        pool.terminate()
+
+
+def shift_error(error, *, row_position, row_number):
+    if row_position and "rowPosition" in error:
+        error["rowPosition"] += row_position
+    if row_number and "rowNumber" in error:
+        error["rowNumber"] += row_number
+    if row_position or row_number:
+        error["message"] = error.template.format(**error)
+
+
+def read_table_chunks(table, *, workers):
+    """Split a CSV file into chunks on record boundaries
+
+    It yields `(start, end, prefix)` tuples where `prefix` is the first record's
+    bytes to be prepended to every chunk except the first one (so it can be parsed
+    as a standalone table). The chunks are yielded with one chunk lag so the table's
+    hash and bytes stats are updated before the last chunk is sent to a worker.
+
+    A chunk is cut on the first newline after its target size. If the chunk's bytes
+    don't have quote or escape chars it's a record boundary as there are no quoted
+    newlines. Otherwise, the chunk is parsed with `csv.reader` to find the boundary
+    so for a file having quoted values on every chunk it's a serial parsing
+    (much cheaper than validation but it's what limits the speedup in this case).
+    """
+    dialect = table.dialect
+    chars = [dialect.quote_char, dialect.escape_char]
+    chars = [char.encode(table.encoding) for char in chars if char]
+    size = os.path.getsize(table.path) // (workers * PARALLEL_CHUNKS_PER_WORKER)
+    size = min(max(size, 1), PARALLEL_CHUNK_SIZE)
+    with open(table.path, "rb") as file:
+        hash = StatsHasher(table.hashing)
+
+        # Read lines
+        def read_lines():
+            for line in iter(file.readline, b""):
+                hash.update(line)
+                yield line
+
+        # Read prefix
+        prefix = read_table_records(read_lines(), size=1, table=table)
+
+        # Read chunks
+        start = 0
+        position = len(prefix)
+        pending = None
+        while True:
+            data = file.read(max(start + size - position, 0)) + file.readline()
+            if not data:
+                break
+            hash.update(data)
+            if any(char in data for char in chars):
+                lines = chain(io.BytesIO(data), read_lines())
+                data = read_table_records(lines, size=len(data), table=table)
+            position += len(data)
+            if pending:
+                yield pending
+            pending = (start, position, prefix if start else b"")
+            start = position
+
+        # Update stats
+        hash.write_stats(table.stats)
+        table.stats["bytes"] = position
+        if pending:
+            yield pending
+        else:
+            yield (0, position, b"")
+
+
+def read_table_records(lines, *, size, table):
+    """Read lines up to the first record boundary after the given size
+
+    If the data can't be parsed the rest of the lines are read.
+    """
+    result = []
+    count = 0
+
+    # Decode lines
+    def decode_lines():
+        nonlocal count
+        for line in lines:
+            result.append(line)
+            count += len(line)
+            yield line.decode(table.encoding, errors="replace")
+
+    # Read records
+    try:
+        for cells in csv.reader(decode_lines(), dialect=table.dialect.to_python()):
+            if count >= size:
+                break
+    except csv.Error:
+        result.extend(lines)
+    return b"".join(result)
+
+
+def prepare_table_worker(lookup, path):
+    # Every worker maps the file once and reads the chunks from the mapping
+    PARALLEL_STATE["lookup"] = lookup
+    PARALLEL_STATE["buffer"] = b""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            PARALLEL_STATE["buffer"] = buffer
+
+
+def validate_table_chunk(task):
+    chunk, options = task
+    try:
+        return validate_table_chunk_create(chunk, options)
+    except exceptions.FrictionlessException as exception:
+        return exception.error
+
+
+def validate_table_chunk_create(chunk, options):
+
+    # Validate chunk
+    checks = []
+    check_errors = []
+    table_errors = TableErrors(
+        options["pick_errors"], options["skip_errors"], options["limit_errors"]
+    )
+    with create_chunk_table(chunk, options) as table:
+        for item in options["items"]:
+            check = create_check(item)
+            table_errors.register(check)
+            check.connect(table, partial=True, scope=table_errors.scope)
+            check.prepare()
+            checks.append(check)
+            check_errors.append([])
+        for row in table.row_stream:
+            # Rows after the limit are still read to count positions
+            if options["limit_errors"]:
+                if len(table_errors) >= options["limit_errors"]:
+                    continue
+            for check, errors in zip(checks, check_errors):
+                for error in check.validate_row(row):
+                    if table_errors.match(error):
+                        table_errors.append(error, force=True)
+                        errors.append(error)
+        rows = table.stats["rows"]
+        positions = rows + (1 if table.dialect.header else 0)
+
+        # Collect states
+        # The table's key indexes are released on closing
+        results = []
+        for check, errors in zip(checks, check_errors):
+            results.append([check.partial_state(), errors])
+
+    # Return result
+    return chunk, positions, rows, results
+
+
+def create_chunk_table(chunk, options):
+    start, end, prefix = chunk
+
+    # Read chunk
+    data = prefix + PARALLEL_STATE["buffer"][start:end]
+
+    # Prepare dialect
+    # The prefix (the first record) is always parsed as a header
+    dialect = options["dialect"].copy()
+    if prefix:
+        dialect["header"] = True
+        dialect["headerRows"] = [1]
+
+    # Create table
+    return Table(
+        io.BytesIO(data),
+        scheme="stream",
+        format="csv",
+        encoding=options["encoding"],
+        dialect=dialect,
+        schema=options["schema"],
+        lookup=PARALLEL_STATE["lookup"],
+        index_size=options["index_size"],
+        index_hashed=options["index_hashed"],
+    )
+
+
+PARALLEL_CHUNK_SIZE = 64 * 1024 * 1024
+PARALLEL_CHUNKS_PER_WORKER = 4
+PARALLEL_STATE = {}
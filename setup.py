@@ -52,6 +52,7 @@ EXTRAS_REQUIRE = {
     "spss": ["savReaderWriter>=3.0"],
     "sql": ["sqlalchemy>=1.3"],
     "tsv": ["linear-tsv>=1.0"],
+    "zstd": ["zstandard>=0.15"],
     "dev": TESTS_REQUIRE,
 }
 INSTALL_REQUIRES = [
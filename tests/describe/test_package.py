@@ -56,6 +56,11 @@ def test_describe_package():
     }
 
 
+def test_describe_package_workers():
+    package = describe("data/chunk*.csv", workers=2)
+    assert package == describe("data/chunk*.csv")
+
+
 def test_describe_package_expand():
     package = describe("data/chunk*.csv", expand=True)
     assert package.get_resource("chunk1").dialect.header is True
@@ -103,6 +103,23 @@ def test_describe_resource_schema_check_type_boolean_string_tie():
     assert resource.schema.get_field("field").type == "string"
 
 
+def test_describe_resource_infer_cache(tmpdir):
+    cache = str(tmpdir.join("cache"))
+    resource = describe("data/table.csv", infer_cache=cache)
+    assert describe("data/table.csv", infer_cache=cache) == resource
+    assert len(tmpdir.join("cache").listdir()) == 1
+
+
+def test_describe_resource_hashing_multiple():
+    resource = describe("data/table.csv", hashing=["sha1", "md5"])
+    assert resource.metadata_valid
+    assert resource["hash"] == "sha1:db6ea2f8ff72a9e13e1d70c28ed1c6b42af3bb0e"
+    assert resource["hashes"] == {
+        "sha1": "db6ea2f8ff72a9e13e1d70c28ed1c6b42af3bb0e",
+        "md5": "6c2c61dd9b0e9c6876139a449ed87933",
+    }
+
+
 # Issues
 
 
@@ -1,4 +1,4 @@
-from frictionless import Table
+from frictionless import Table, File, controls, system
 from importlib import import_module
 
 
@@ -16,3 +16,39 @@ def test_table_file_pathlib_path():
     with Table(pathlib.Path("data/table.csv")) as table:
         assert table.header == ["id", "name"]
         assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+
+
+def test_table_file_mmap():
+    control = controls.LocalControl(mmap=True)
+    with Table("data/table.csv", control=control) as table:
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+        assert table.stats["hash"] == "6c2c61dd9b0e9c6876139a449ed87933"
+        assert table.stats["bytes"] == 30
+
+
+def test_table_file_mmap_compressed():
+    control = controls.LocalControl(mmap=True)
+    with Table("data/table.csv.zip", control=control) as table:
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+
+
+def test_loader_file_mmap_buffer():
+    file = File("data/table.csv", control={"mmap": True})
+    with system.create_loader(file) as loader:
+        assert loader.buffer[:7] == b"id,name"
+        assert loader.buffer.find(b"english") == 10
+        assert loader.byte_stream.read() == loader.buffer[:]
+        buffer = loader.buffer
+    assert buffer.closed
+    assert loader.buffer is None
+
+
+def test_loader_file_mmap_empty(tmpdir):
+    source = str(tmpdir.join("empty.csv"))
+    open(source, "w").close()
+    file = File(source, control={"mmap": True})
+    with system.create_loader(file) as loader:
+        assert loader.buffer is None
+        assert loader.byte_stream.read() == b""
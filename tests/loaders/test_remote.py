@@ -1,5 +1,8 @@
+import re
 import pytest
-from frictionless import Table
+import requests
+import responses
+from frictionless import Table, File, controls, config, system
 
 BASE_URL = "https://raw.githubusercontent.com/frictionlessdata/tabulator-py/master/%s"
 
@@ -19,3 +22,101 @@ def test_table_https_latin1():
     # Github returns wrong encoding `utf-8`
     with Table(BASE_URL % "data/special/latin1.csv") as table:
         assert table.read_data()
+
+
+# Ranges
+
+
+def register_remote_table(url, *, ranges=True, failures=0):
+    with open("data/table.csv", "rb") as file:
+        body = file.read()
+    state = {"failures": failures}
+
+    def callback(request):
+        headers = {"Accept-Ranges": "bytes"} if ranges else {}
+        match = re.match(r"bytes=(\d+)-(\d*)", request.headers.get("Range", ""))
+        if not ranges or not match:
+            return (200, {**headers, "Content-Length": str(len(body))}, body)
+        if state["failures"]:
+            state["failures"] -= 1
+            raise requests.ConnectionError("connection reset")
+        stop = int(match.group(2)) + 1 if match.group(2) else len(body)
+        chunk = body[int(match.group(1)) : stop]
+        return (206, {**headers, "Content-Length": str(len(chunk))}, chunk)
+
+    responses.add_callback(responses.GET, url, callback=callback)
+
+
+@responses.activate
+def test_remote_loader_rewinding_is_not_downloaded_twice():
+    register_remote_table("https://example.com/table.csv", ranges=False)
+    with Table("https://example.com/table.csv") as table:
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_remote_loader_seek_range():
+    register_remote_table("https://example.com/table.csv")
+    with File("https://example.com/table.csv") as file:
+        file.byte_stream.seek(8)
+        assert file.byte_stream.read(10) == b"1,english\n"
+    assert responses.calls[-1].request.headers["Range"] == "bytes=8-"
+
+
+@responses.activate
+def test_remote_loader_seek_range_resumed():
+    register_remote_table("https://example.com/table.csv", failures=1)
+    with File("https://example.com/table.csv") as file:
+        file.byte_stream.seek(8)
+        assert file.byte_stream.read(10) == b"1,english\n"
+
+
+@responses.activate
+def test_remote_loader_http_preload_parallel_chunks(monkeypatch):
+    monkeypatch.setattr(config, "DEFAULT_HTTP_CHUNK_SIZE", 8)
+    register_remote_table("https://example.com/table.csv", failures=1)
+    control = controls.RemoteControl(http_preload=True)
+    with Table("https://example.com/table.csv", control=control) as table:
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+        assert table.stats["hash"] == "6c2c61dd9b0e9c6876139a449ed87933"
+    assert len(responses.calls) == 1 + 4 + 1
+
+
+# Session
+
+
+def test_remote_control_http_session_is_shared():
+    session = controls.RemoteControl().http_session
+    assert session is system.get_http_session()
+    assert session is controls.RemoteControl().http_session
+    assert session.adapters["https://"].max_retries.total == config.DEFAULT_HTTP_RETRIES
+
+
+def test_remote_control_http_session_set_by_user():
+    session = requests.Session()
+    assert controls.RemoteControl(http_session=session).http_session is session
+    system.set_http_session(session)
+    try:
+        assert controls.RemoteControl().http_session is session
+    finally:
+        system.set_http_session()
+    assert system.get_http_session() is not session
+
+
+@responses.activate
+def test_remote_loader_uses_shared_http_session(monkeypatch):
+    register_remote_table("https://example.com/table.csv")
+    sessions = []
+    send = requests.Session.send
+    monkeypatch.setattr(
+        requests.Session,
+        "send",
+        lambda self, *args, **kwargs: sessions.append(self) or send(self, *args, **kwargs),
+    )
+    for _ in range(2):
+        with Table("https://example.com/table.csv") as table:
+            assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+    assert set(sessions) == {system.get_http_session()}
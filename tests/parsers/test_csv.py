@@ -1,3 +1,4 @@
+import csv
 import pytest
 from frictionless import Table, dialects
 
@@ -174,6 +175,15 @@ def test_table_csv_quotechar_is_empty_string():
         table.read_data() == [["value1", 'value2"', "value3"]]
 
 
+def test_table_csv_dialect_trusted_is_not_sniffed(monkeypatch):
+    monkeypatch.setattr(csv.Sniffer, "sniff", None)
+    source = "a1;b1\na2;b2\n"
+    dialect = dialects.CsvDialect(delimiter=";", quote_char='"', skip_initial_space=False)
+    with Table(source, scheme="text", format="csv", dialect=dialect) as table:
+        assert table.header == ["a1", "b1"]
+        assert table.read_data() == [["a2", "b2"]]
+
+
 # Write
 
 
@@ -69,6 +69,15 @@ def test_table_inline_from_ordered_dict():
         assert table.read_data() == [["english", "1"], ["中国人", "2"]]
 
 
+def test_table_inline_from_rows():
+    with Table("data/table.csv") as table:
+        source = table.read_rows()
+    with Table(source) as table:
+        assert table.dialect.keyed is True
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [[1, "english"], [2, "中国人"]]
+
+
 # Write
 
 
@@ -0,0 +1,32 @@
+from frictionless import Table, controls
+
+
+# Codec
+
+
+def test_table_compression_local_csv_zst():
+    with Table("data/table.csv.zst") as table:
+        assert table.compression == "zst"
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+
+
+def test_table_compression_local_csv_zst_multiple_frames():
+    with Table("data/table-multiframe.csv.zst") as table:
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+
+
+def test_table_compression_local_csv_zst_decompression_thread():
+    control = controls.LocalControl(decompression_thread=True)
+    with Table("data/table.csv.zst", control=control) as table:
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+        assert table.stats["bytes"] == 39
+
+
+def test_table_compression_filelike_csv_zst():
+    with open("data/table.csv.zst", "rb") as file:
+        with Table(file, format="csv", compression="zst") as table:
+            assert table.header == ["id", "name"]
+            assert table.read_data() == [["1", "english"], ["2", "中国人"]]
@@ -0,0 +1,97 @@
+import io
+import os
+import json
+import pytest
+import responses
+from frictionless import Cache, HttpCache, Table, Resource, system
+
+
+# General
+
+
+def test_cache(tmpdir):
+    cache = Cache(str(tmpdir.join("cache")))
+    cache.set({"path": "table.csv"}, {"encoding": "utf-8"})
+    assert cache.get({"path": "table.csv"}) == {"encoding": "utf-8"}
+    assert cache.get({"path": "table.xlsx"}) is None
+    assert cache.get({"path": "table.xlsx"}, {}) == {}
+
+
+def test_cache_broken_value(tmpdir):
+    cache = Cache(str(tmpdir))
+    cache.set("key", "value")
+    for path in tmpdir.listdir():
+        path.write("{")
+    assert cache.get("key") is None
+
+
+# Http
+
+
+@pytest.fixture
+def http_cache(tmpdir):
+    cache = HttpCache(str(tmpdir.join("http")))
+    system.set_http_cache(cache)
+    yield cache
+    system.set_http_cache()
+
+
+def register_remote_file(url, body, *, headers):
+    def callback(request):
+        validators = [("If-None-Match", "ETag"), ("If-Modified-Since", "Last-Modified")]
+        for condition, validator in validators:
+            if condition in request.headers:
+                if request.headers[condition] == headers.get(validator):
+                    return (304, {}, b"")
+        return (200, headers, body)
+
+    responses.add_callback(responses.GET, url, callback=callback)
+
+
+@responses.activate
+def test_http_cache_etag(http_cache):
+    with open("data/table.csv", "rb") as file:
+        body = file.read()
+    register_remote_file("https://example.com/table.csv", body, headers={"ETag": '"1"'})
+    for _ in range(2):
+        with Table("https://example.com/table.csv") as table:
+            assert table.header == ["id", "name"]
+            assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+    assert len(responses.calls) == 2
+    assert "If-None-Match" not in responses.calls[0].request.headers
+    assert responses.calls[1].request.headers["If-None-Match"] == '"1"'
+    assert responses.calls[1].response.status_code == 304
+
+
+@responses.activate
+def test_http_cache_last_modified_descriptor(http_cache):
+    body = json.dumps({"path": "data/table.csv"}).encode("utf-8")
+    headers = {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    register_remote_file("https://example.com/resource.json", body, headers=headers)
+    for _ in range(2):
+        resource = Resource("https://example.com/resource.json")
+        assert resource.path == "data/table.csv"
+    assert len(responses.calls) == 2
+    assert responses.calls[1].response.status_code == 304
+
+
+@responses.activate
+def test_http_cache_without_validators(http_cache):
+    responses.add(responses.GET, "https://example.com/table.csv", body="id\n1\n")
+    for _ in range(2):
+        with Table("https://example.com/table.csv") as table:
+            assert table.read_data() == [["1"]]
+    assert http_cache.get("https://example.com/table.csv") is None
+
+
+def test_http_cache_eviction(tmpdir):
+    cache = HttpCache(str(tmpdir), size=10)
+    for number, url in enumerate(["https://a.com", "https://b.com", "https://c.com"]):
+        cache.set(url, {"ETag": '"1"'}, io.BytesIO(b"12345"))
+        for path in tmpdir.listdir(lambda path: path.ext == ".data"):
+            os.utime(str(path), ns=(number, number))
+        if number == 1:
+            assert cache.get("https://a.com")
+    assert cache.get("https://a.com")
+    assert cache.get("https://b.com") is None
+    assert cache.get("https://c.com")
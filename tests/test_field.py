@@ -43,6 +43,18 @@ def test_field_read_cell():
     assert field.read_cell("-") == (None, {"required": 'constraint "required" is "True"'})
 
 
+def test_field_read_column():
+    field = Field(DESCRIPTOR)
+    assert field.read_column(["1", "string", "-"]) == (
+        [1, None, None],
+        [
+            None,
+            {"type": 'type is "integer/default"'},
+            {"required": 'constraint "required" is "True"'},
+        ],
+    )
+
+
 def test_field_read_cell_string_missing_values():
     field = Field({"name": "name", "type": "string", "missingValues": ["", "NA", "N/A"]})
     assert field.read_cell("") == (None, None)
@@ -1,3 +1,4 @@
+import zipfile
 from frictionless import File
 
 
@@ -22,3 +23,30 @@ def test_file():
             "bytes": 30,
             "rows": 0,
         }
+
+
+def test_file_byte_stream_iterable():
+    with File("data/table.csv") as file:
+        assert list(file.byte_stream) == [
+            b"id,name\n",
+            b"1,english\n",
+            "2,中国人\n".encode("utf-8"),
+        ]
+        assert file.stats["hash"] == "6c2c61dd9b0e9c6876139a449ed87933"
+        assert file.stats["bytes"] == 30
+
+
+def test_file_byte_stream_readinto():
+    with File("data/table.csv", hashing="sha1") as file:
+        buffer = bytearray(16)
+        while file.byte_stream.readinto(buffer):
+            pass
+        assert file.stats["hash"] == "db6ea2f8ff72a9e13e1d70c28ed1c6b42af3bb0e"
+        assert file.stats["bytes"] == 30
+
+
+def test_file_compression_zip_streamed():
+    with File("data/table.csv.zip") as file:
+        assert isinstance(file.byte_stream, zipfile.ZipExtFile)
+        assert file.read_text() == "id,name\n1,english\n2,中国人\n"
+        assert file.stats["hash"] == "bc62cb1a2ac84cc70c8971a5c027d6d3"
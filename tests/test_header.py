@@ -11,6 +11,16 @@ def test_basic():
     assert header == ["field1", "field2", "field3"]
 
 
+def test_header_errors():
+    header = create_header(["field1", "", "field1"])
+    assert header.valid is False
+    assert [error.code for error in header.errors] == [
+        "blank-header",
+        "duplicate-header",
+    ]
+    assert header.errors[1]["cells"] == ["field1", "", "field1"]
+
+
 # Helpers
 
 
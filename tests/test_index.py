@@ -0,0 +1,116 @@
+import importlib
+import pickle
+from decimal import Decimal
+from frictionless import Index
+
+
+# General
+
+
+def test_index():
+    index = Index()
+    index["a"] = 1
+    index[("a", 1)] = 2
+    assert index.get("a") == 1
+    assert index.get(("a", 1)) == 2
+    assert index.get("b") is None
+    assert "a" in index
+    assert len(index) == 2
+    assert index.spilled is False
+
+
+def test_index_spill():
+    index = Index(size=2)
+    for position in range(1, 11):
+        index[str(position)] = position
+    index["1"] = 11
+    assert index.spilled is True
+    assert index.get("1") == 11
+    assert index.get("5") == 5
+    assert index.get("11") is None
+    assert len(index) == 10
+    assert dict(index.items()) == {"1": 11, **{str(key): key for key in range(2, 11)}}
+
+
+def test_index_spill_numbers():
+    index = Index(size=1)
+    index[(1, "a")] = 1
+    index[(Decimal("1.5"), "b")] = 2
+    index[(3, "c")] = 3
+    assert index.get((Decimal("1.00"), "a")) == 1
+    assert index.get((1.5, "b")) == 2
+    assert index.get((Decimal("1.5000"), "b")) == 2
+
+
+def test_index_close():
+    index = Index(size=1)
+    index["a"] = 1
+    index["b"] = 2
+    index.close()
+    assert index.spilled is False
+    assert index.get("a") is None
+
+
+def test_index_hashed():
+    index = Index(hashed=True)
+    index[("a", 1)] = 1
+    index[("b", 2)] = 2
+    assert index.hashed is True
+    assert index.get(("a", 1)) == 1
+    assert index.get(("b", 2)) == 2
+    assert index.get(("c", 3)) is None
+    assert dict(index.items()) == {("a", 1): 1, ("b", 2): 2}
+
+
+def test_index_hashed_collision(monkeypatch):
+    module = importlib.import_module("frictionless.index")
+    monkeypatch.setattr(module, "digest_key", lambda source: 1)
+    index = Index(size=1, hashed=True)
+    index["a"] = 1
+    index["b"] = 2
+    assert index.get("a") == 1
+    assert index.get("b") == 2
+    assert index.get("c") is None
+
+
+def test_index_hashed_on_spill():
+    index = Index(size=2)
+    index["a"] = 1
+    index["b"] = 2
+    assert index.hashed is False
+    index["c"] = 3
+    assert index.hashed is True
+    assert index.get("a") == 1
+    assert index.get("c") == 3
+    assert index.get("d") is None
+
+
+def test_index_not_hashed():
+    index = Index(size=2, hashed=False)
+    for position in range(1, 11):
+        index[str(position)] = position
+    assert index.hashed is False
+    assert index.spilled is True
+    assert index.get("1") == 1
+    assert index.get("10") == 10
+
+
+def test_index_pickle():
+    index = Index(size=1)
+    index["a"] = 1
+    index["b"] = 2
+    index["c"] = 3
+    shared = pickle.loads(pickle.dumps(index))
+    assert shared.get("a") == 1
+    assert shared.get("c") == 3
+    assert shared.get("d") is None
+    shared.close()
+    assert index.get("a") == 1
+
+
+def test_index_pickle_not_spilled():
+    index = Index()
+    index["a"] = 1
+    shared = pickle.loads(pickle.dumps(index))
+    assert shared.get("a") == 1
+    assert shared.spilled is False
@@ -2,7 +2,7 @@ import os
 import json
 import zipfile
 import pytest
-from frictionless import Package, exceptions
+from frictionless import Package, Index, config, exceptions
 
 
 # General
@@ -368,6 +368,28 @@ def test_package_infer_multiple_paths():
     assert package.resources[1].path == "data2.csv"
 
 
+def test_package_infer_workers():
+    package = Package()
+    package.infer("data/infer/*.csv")
+    package.add_resource({"name": "inline", "data": [["id"], [1], [2]]})
+    package.resources[-1].infer()
+    expect = package.to_dict()
+    package = Package()
+    package.infer("data/infer/*.csv")
+    package.add_resource({"name": "inline", "data": [["id"], [1], [2]]})
+    package.infer(workers=3)
+    assert package.metadata_valid
+    assert package == expect
+
+
+def test_package_infer_workers_error():
+    package = Package({"resources": [{"path": "data/table.csv"}, {"path": "bad.csv"}]})
+    with pytest.raises(exceptions.FrictionlessException) as excinfo:
+        package.infer(workers=2)
+    error = excinfo.value.error
+    assert error.code == "scheme-error"
+
+
 def test_package_infer_non_utf8_file():
     package = Package()
     package.infer("data/table-with-accents.csv")
@@ -630,6 +652,28 @@ def test_package_integrity_read_lookup():
     assert lookup == {"people": {("firstname",): {("Walter",), ("Alex",), ("John",)}}}
 
 
+def test_package_integrity_read_lookup_cached():
+    package = Package(INTEGRITY_DESCRIPTOR)
+    resource = package.get_resource("main")
+    lookup1 = resource.read_lookup()
+    lookup2 = resource.read_lookup()
+    assert lookup1["people"][("firstname",)] is lookup2["people"][("firstname",)]
+    package.add_resource({"name": "other", "data": [["id"], [1]]})
+    lookup3 = resource.read_lookup()
+    assert lookup1["people"][("firstname",)] is not lookup3["people"][("firstname",)]
+
+
+def test_package_integrity_read_lookup_big(monkeypatch):
+    monkeypatch.setattr(config, "DEFAULT_INDEX_SIZE", 2)
+    package = Package(INTEGRITY_DESCRIPTOR)
+    resource = package.get_resource("main")
+    index = resource.read_lookup()["people"][("firstname",)]
+    assert isinstance(index, Index)
+    assert ("Walter",) in index
+    assert ("Alex",) in index
+    assert ("Jesse",) not in index
+
+
 # Issues
 
 
@@ -1,7 +1,7 @@
 import os
 import json
 import pytest
-from frictionless import Resource, exceptions
+from frictionless import Resource, Table, exceptions
 
 
 # General
@@ -543,6 +543,20 @@ def test_resource_infer():
     }
 
 
+def test_resource_infer_opens_source_once(monkeypatch):
+    opened = []
+    open = Table.open
+    monkeypatch.setattr(Table, "open", lambda self: opened.append(self) or open(self))
+    resource = Resource(path="data/table.csv")
+    resource.infer()
+    assert len(opened) == 1
+    assert resource.stats == {
+        "hash": "6c2c61dd9b0e9c6876139a449ed87933",
+        "bytes": 30,
+        "rows": 2,
+    }
+
+
 def test_resource_infer_source_non_tabular():
     resource = Resource(path="data/text.txt")
     resource.infer()
@@ -15,6 +15,59 @@ def test_basic():
     assert row == {"field1": 1, "field2": 2, "field3": 3}
 
 
+def test_row_mapping():
+    row = create_row([1, 2, 3])
+    assert row["field2"] == 2
+    assert row.get("field4") is None
+    assert "field1" in row
+    assert list(row) == ["field1", "field2", "field3"]
+    assert list(row.items()) == [("field1", 1), ("field2", 2), ("field3", 3)]
+    assert row.to_dict() == {"field1": 1, "field2": 2, "field3": 3}
+    assert row.to_list() == [1, 2, 3]
+
+
+def test_row_set_item():
+    row = create_row([1, 2, 3])
+    row["field2"] = 4
+    assert row.to_list() == [1, 4, 3]
+
+
+def test_row_is_slotted():
+    row = create_row([1, 2, 3])
+    assert not hasattr(row, "__dict__")
+
+
+def test_row_errors():
+    schema = Schema({"fields": [{"name": "id", "type": "integer"}]})
+    row = create_row(["bad", "extra"], schema=schema, field_positions=[1])
+    assert row.valid is False
+    assert row.error_cells == {"id": "bad"}
+    assert [error.code for error in row.errors] == ["extra-cell", "type-error"]
+    assert row.errors[0]["cells"] == ["bad"]
+    assert row.errors[0]["cell"] == "extra"
+    assert row.errors[1]["rowPosition"] == 1
+    assert row.errors is row.errors
+
+
+def test_row_errors_missing_cells():
+    schema = Schema({"fields": [{"name": "id"}, {"name": "name"}, {"name": "age"}]})
+    row = create_row(["1"], schema=schema, field_positions=[1, 2, 3])
+    assert [error["cells"] for error in row.errors] == [
+        ["1", "None"],
+        ["1", "None", "None"],
+    ]
+
+
+def test_row_iter_errors_scope():
+    schema = Schema({"fields": [{"name": "id", "type": "integer"}]})
+    row = create_row(["bad", "extra"], schema=schema, field_positions=[1])
+    errors = list(row.iter_errors(scope=["type-error"]))
+    assert [error.code for error in errors] == ["type-error"]
+    assert errors[0]["cells"] == ["bad"]
+    assert list(row.iter_errors(scope=[])) == []
+    assert [error.code for error in row.errors] == ["extra-cell", "type-error"]
+
+
 # Helpers
 
 
@@ -1,9 +1,11 @@
 import io
 import json
+import pickle
 import pytest
 import requests
 from decimal import Decimal
-from frictionless import Schema, exceptions
+from frictionless import Schema, Field, exceptions
+from frictionless.schema import INFER_TYPES, INFER_MASKS, create_infer_mask
 
 
 # General
@@ -109,6 +111,27 @@ def test_schema_read_data_wrong_type():
     assert notes[2] == {"type": 'type is "integer/default"'}
 
 
+def test_schema_read_data_pickle():
+    schema = Schema(DESCRIPTOR_MAX)
+    schema.read_data(["string", "10.0", "1", "string", "string"])
+    schema = pickle.loads(pickle.dumps(schema))
+    source = ["string", "notdecimal", "1", "string", "string"]
+    target = ["string", None, 1, "string", "string"]
+    cells, notes = schema.read_data(source)
+    assert cells == target
+    assert notes[1] == {"type": 'type is "number/default"'}
+
+
+def test_schema_read_data_after_field_update():
+    schema = Schema(DESCRIPTOR_MIN)
+    assert schema.read_data(["1", "2"]) == (["1", 2], [None, None])
+    schema.get_field("height").type = "string"
+    schema.get_field("height").constraints["maxLength"] = 0
+    cells, notes = schema.read_data(["1", "2"])
+    assert cells == ["1", "2"]
+    assert notes == [None, {"maxLength": 'constraint "maxLength" is "0"'}]
+
+
 def test_schema_missing_values():
     assert Schema(DESCRIPTOR_MIN).missing_values == [""]
     assert Schema(DESCRIPTOR_MAX).missing_values == ["", "-", "null"]
@@ -319,6 +342,44 @@ def test_schema_infer_no_names():
     }
 
 
+def test_schema_infer_missing_values():
+    sample = [["1", "a"], ["-", "b"], ["-", "c"], ["2", "d"], ["3", "e"]]
+    schema = Schema()
+    schema.infer(sample, names=["id", "name"], missing_values=["-"])
+    assert schema == {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "name", "type": "string"},
+        ],
+        "missingValues": ["-"],
+    }
+
+
+def test_schema_infer_sample_left_early():
+    class Cell:
+        def __eq__(self, other):
+            raise AssertionError("the cell is read")
+
+    sample = [["1"]] * 9 + [[Cell()]]
+    schema = Schema()
+    schema.infer(sample, names=["id"])
+    assert schema == {"fields": [{"name": "id", "type": "integer"}]}
+
+
+@pytest.mark.parametrize(
+    "cell",
+    ["1", "-1", "1.5", "NaN", "inf", "true", "0", "2020", "2020-01", "2020-01-01"]
+    + ["10:00:00", "2020-01-01T10:00:00Z", "P1Y", "PT1H", "90,45", "[1]", '{"a": 1}']
+    + ["text", " 1 "],
+)
+def test_schema_infer_create_infer_mask(cell):
+    mask = create_infer_mask(cell)
+    for type in INFER_TYPES:
+        target, notes = Field(name="name", type=type).read_cell(cell)
+        if not notes:
+            assert mask & INFER_MASKS[type]
+
+
 # Import/export
 
 
@@ -1,7 +1,10 @@
 import io
+import csv
 import sys
 import pytest
-from frictionless import Table, Query, controls, dialects, exceptions
+import chardet
+from frictionless import Table, Query, Schema, controls, dialects, exceptions
+from frictionless import helpers
 
 
 # General
@@ -121,6 +124,63 @@ def test_table_row_stream_blank_cells():
         assert row2.valid is True
 
 
+def test_table_read_batches():
+    with Table("data/table.csv") as table:
+        batch = next(table.read_batches())
+        assert table.header == ["id", "name"]
+        assert batch == {"id": [1, 2], "name": ["english", "中国人"]}
+        assert batch.row_positions == [2, 3]
+        assert batch.row_numbers == [1, 2]
+        assert batch.errors == []
+        assert batch.valid is True
+        assert list(table.read_batches()) == []
+
+
+def test_table_read_batches_size():
+    with Table("data/table.csv") as table:
+        batch1, batch2 = table.read_batches(size=1)
+        assert batch1 == {"id": [1], "name": ["english"]}
+        assert batch1.row_numbers == [1]
+        assert batch2 == {"id": [2], "name": ["中国人"]}
+        assert batch2.row_numbers == [2]
+
+
+def test_table_read_batches_errors():
+    with Table("data/invalid.csv") as table:
+        batch = next(table.read_batches())
+        assert batch.valid is False
+        assert batch.to_list() == [
+            [1, 1, None, 2],
+            ["english", "english", None, "german"],
+            [None, None, None, 1],
+            [None, None, None, 2],
+        ]
+        assert [[err["rowPosition"], err.code] for err in batch.errors] == [
+            [2, "missing-cell"],
+            [2, "missing-cell"],
+            [3, "missing-cell"],
+            [3, "missing-cell"],
+            [4, "blank-row"],
+            [5, "extra-cell"],
+        ]
+
+
+def test_table_read_batches_errors_same_as_rows():
+    with Table("data/invalid.csv") as table:
+        batch = next(table.read_batches())
+    with Table("data/invalid.csv") as table:
+        errors = [error for row in table.read_rows() for error in row.errors]
+    assert batch.errors == errors
+
+
+def test_table_read_batches_error_read_closed():
+    table = Table("data/table.csv")
+    with pytest.raises(exceptions.FrictionlessException) as excinfo:
+        table.read_batches()
+    error = excinfo.value.error
+    assert error.code == "error"
+
+
 def test_table_empty():
     with Table("data/empty.csv") as table:
         assert table.header == []
@@ -444,6 +504,20 @@ def test_table_encoding_utf_16():
         assert table.read_data() == [[u"en", u"English"], [u"ja", u"日本語"]]
 
 
+def test_table_encoding_utf_32():
+    bio = io.BytesIO("en,English\nja,日本語".encode("utf-32"))
+    with Table(bio, format="csv", headers=False) as table:
+        assert table.encoding == "utf-32"
+        assert table.read_data() == [["en", "English"], ["ja", "日本語"]]
+
+
+def test_table_encoding_utf_8_is_not_detected_by_chardet(monkeypatch):
+    monkeypatch.setattr(chardet, "detect", None)
+    with Table("data/table.csv") as table:
+        assert table.encoding == "utf-8"
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+
+
 def test_table_encoding_error_bad_encoding():
     table = Table("data/table.csv", encoding="bad")
     with pytest.raises(exceptions.FrictionlessException) as excinfo:
@@ -510,6 +584,35 @@ def test_table_compression_local_csv_gz():
         assert table.read_data() == [["1", "english"], ["2", "中国人"]]
 
 
+def test_table_compression_local_csv_gz_multiple_members():
+    with Table("data/table-multimember.csv.gz") as table:
+        assert table.compression == "gz"
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+
+
+def test_table_compression_local_csv_bz2():
+    with Table("data/table.csv.bz2") as table:
+        assert table.compression == "bz2"
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+
+
+def test_table_compression_local_csv_xz():
+    with Table("data/table.csv.xz") as table:
+        assert table.compression == "xz"
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+
+
+def test_table_compression_decompression_thread():
+    control = controls.LocalControl(decompression_thread=True)
+    with Table("data/table.csv.bz2", control=control) as table:
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+        assert table.stats["bytes"] == 79
+
+
 def test_table_compression_filelike_csv_zip():
     with open("data/table.csv.zip", "rb") as file:
         with Table(file, format="csv", compression="zip") as table:
@@ -1110,6 +1213,38 @@ def test_table_stats_hash_compressed():
         assert table.stats["hash"] == "2a72c90bd48c1fa48aec632db23ce8f7"
 
 
+def test_table_stats_hash_multiple():
+    with Table("data/doublequote.csv", hashing=["md5", "sha1"]) as table:
+        table.read_data()
+        assert table.hashing == ["md5", "sha1"]
+        assert table.stats["hash"] == "d82306001266c4343a2af4830321ead8"
+        assert table.stats["hashes"] == {
+            "md5": "d82306001266c4343a2af4830321ead8",
+            "sha1": "2842768834a6804d8644dd689da61c7ab71cbb33",
+        }
+
+
+def test_table_stats_hash_thread():
+    control = controls.LocalControl(hashing_thread=True)
+    with Table("data/doublequote.csv", hashing="sha1", control=control) as table:
+        table.read_data()
+        assert table.stats["hash"] == "2842768834a6804d8644dd689da61c7ab71cbb33"
+        assert table.stats["bytes"] == 7346
+
+
+def test_table_stats_hash_compressed_gz():
+    with Table("data/table.csv.gz") as table:
+        table.read_data()
+        assert table.stats["hash"] == "edf56ce48e402d83eb08d5dac6aa2ad9"
+        assert table.stats["bytes"] == 61
+
+
+def test_table_stats_hash_partially_read():
+    with Table("data/table.csv", hashing="sha1") as table:
+        assert next(table.row_stream).to_dict() == {"id": 1, "name": "english"}
+        assert table.stats["hash"] == "db6ea2f8ff72a9e13e1d70c28ed1c6b42af3bb0e"
+
+
 @pytest.mark.ci
 def test_table_stats_hash_remote():
     with Table(BASE_URL % "data/special/doublequote.csv") as table:
@@ -1159,6 +1294,138 @@ def test_table_stats_rows_significant():
         assert table.stats["rows"] == 10000
 
 
+# Infer sampling
+
+
+def write_deep_table(path):
+    with open(path, "w") as file:
+        file.write("id,value\n")
+        for number in range(1, 1001):
+            value = number if number <= 500 else f"v{number}"
+            file.write(f"{number},{value}\n")
+
+
+def test_table_infer_sampling_head(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    write_deep_table(source)
+    with Table(source) as table:
+        assert table.schema.get_field("value").type == "integer"
+        assert table.sample == [[str(number)] * 2 for number in range(1, 101)]
+        assert table.sample_confidence == {"id": 1, "value": 1}
+
+
+def test_table_infer_sampling_scan(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    write_deep_table(source)
+    with Table(source, infer_sampling="scan") as table:
+        assert table.schema.get_field("value").type == "string"
+        assert len(table.sample) == 100
+        assert table.sample == sorted(table.sample, key=lambda cells: int(cells[0]))
+        assert table.sample_confidence == {"id": 1, "value": 1}
+        rows = table.read_rows()
+        assert len(rows) == 1000
+        assert rows[999].row_position == 1001
+        assert rows[999]["value"] == "v1000"
+
+
+def test_table_infer_sampling_seek(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    write_deep_table(source)
+    with Table(source, infer_sampling="seek") as table:
+        assert table.schema.get_field("value").type == "string"
+        assert table.sample[:100] == [[str(number)] * 2 for number in range(1, 101)]
+        assert len(table.sample) > 100
+        assert len(table.read_rows()) == 1000
+
+
+def test_table_infer_sampling_seek_mmap(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    write_deep_table(source)
+    control = controls.LocalControl(mmap=True)
+    with Table(source, infer_sampling="seek") as table:
+        sample = table.sample
+    with Table(source, control=control, infer_sampling="seek") as table:
+        assert table.sample == sample
+
+
+def test_table_infer_sampling_seek_fallback_to_scan():
+    source = io.open("data/table.csv", mode="rb")
+    with Table(source, format="csv", infer_sampling="seek") as table:
+        assert table.header == ["id", "name"]
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+
+
+def test_table_infer_sampling_confidence():
+    source = [["id"]] + [[str(number)] for number in range(1, 10)] + [["a"]]
+    with Table(source) as table:
+        assert table.schema.get_field("id").type == "integer"
+        assert table.sample_confidence == {"id": 0.9}
+
+
+def test_table_infer_sampling_not_supported():
+    table = Table("data/table.csv", infer_sampling="bad")
+    with pytest.raises(exceptions.FrictionlessException) as excinfo:
+        table.open()
+    error = excinfo.value.error
+    assert error.code == "schema-error"
+    assert error.note == 'infer sampling "bad" is not supported'
+
+
+# Infer cache
+
+
+def test_table_infer_cache(tmpdir, monkeypatch):
+    cache = str(tmpdir.join("cache"))
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "w") as file:
+        file.write("id;name\n1;english\n2;中国人\n")
+    with Table(source, infer_cache=cache) as table:
+        encoding = table.encoding
+        dialect = table.dialect.to_dict()
+        schema = table.schema.to_dict()
+    monkeypatch.setattr(helpers, "detect_encoding", None)
+    monkeypatch.setattr(csv.Sniffer, "sniff", None)
+    monkeypatch.setattr(Schema, "infer", None)
+    with Table(source, infer_cache=cache) as table:
+        assert table.encoding == encoding
+        assert table.dialect == dialect == {"delimiter": ";"}
+        assert table.schema == schema
+        assert table.read_data() == [["1", "english"], ["2", "中国人"]]
+
+
+def test_table_infer_cache_file_changed(tmpdir):
+    cache = str(tmpdir.join("cache"))
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "w") as file:
+        file.write("id,name\n1,english\n")
+    with Table(source, infer_cache=cache) as table:
+        assert table.schema.field_names == ["id", "name"]
+    with open(source, "w") as file:
+        file.write("id;name;code\n1;english;en\n")
+    with Table(source, infer_cache=cache) as table:
+        assert table.dialect == {"delimiter": ";"}
+        assert table.schema.field_names == ["id", "name", "code"]
+
+
+def test_table_infer_cache_options_changed(tmpdir):
+    cache = str(tmpdir.join("cache"))
+    with Table("data/table.csv", infer_cache=cache) as table:
+        assert table.schema.get_field("id").type == "integer"
+    with Table("data/table.csv", infer_type="string", infer_cache=cache) as table:
+        assert table.schema.get_field("id").type == "string"
+
+
+def test_table_infer_cache_provided_schema(tmpdir):
+    cache = str(tmpdir.join("cache"))
+    schema = {"fields": [{"name": "id", "type": "string"}, {"name": "name"}]}
+    with Table("data/table.csv", schema=schema, infer_cache=cache) as table:
+        assert table.schema.get_field("id").type == "string"
+    with Table("data/table.csv", schema=schema, infer_cache=cache) as table:
+        assert table.schema.get_field("id").type == "string"
+    with Table("data/table.csv", infer_cache=cache) as table:
+        assert table.schema.get_field("id").type == "integer"
+
+
 # Open/Close
 
 
@@ -1286,6 +1553,26 @@ def test_table_integrity_primary_key_error():
             assert row.valid
 
 
+def test_table_integrity_partial_state():
+    source = [["id", "name"], [1, "a"], [2, "b"], [1, "b"], [1, "c"]]
+    patch_schema = {
+        "primaryKey": ["id", "name"],
+        "fields": {"id": {"constraints": {"unique": True}}},
+    }
+    with Table(source, patch_schema=patch_schema) as table:
+        table.read_rows()
+        assert table.partial_state() == {
+            "unique": {"id": {1: (2, 5), 2: (3, 3)}},
+            "primary": {
+                (1, "a"): (2, 2),
+                (2, "b"): (3, 3),
+                (1, "b"): (4, 4),
+                (1, "c"): (5, 5),
+            },
+            "matches": {"unique": {"id": {4: 2, 5: 4}}, "primary": {}},
+        }
+
+
 def test_table_integrity_foreign_keys():
     source = [["name"], [1], [2], [3]]
     lookup = {"other": {("name",): {(1,), (2,), (3,)}}}
@@ -1332,8 +1619,8 @@ def test_table_skip_blank_at_the_end_issue_bco_dmo_33():
 
 def test_table_wrong_encoding_detection_issue_265():
     with Table("data/accent.csv") as table:
-        #  Underlaying "chardet" can't detect correct utf-8 here
-        assert table.encoding == "iso8859-1"
+        # The sample is valid utf-8 so "chardet" isn't used (it detects iso8859-1)
+        assert table.encoding == "utf-8"
 
 
 def test_table_not_existent_local_file_with_no_format_issue_287():
@@ -47,3 +47,10 @@ def test_date_read_cell(format, source, target):
         assert cell == target
     if not format.startswith("fmt:"):
         assert recorded.list == []
+
+
+def test_date_read_column():
+    field = Field({"name": "name", "type": "date"})
+    cells, notes = field.read_column(["2019-01-01", "2019-1-1", "", "20190101"])
+    assert cells == [date(2019, 1, 1), date(2019, 1, 1), None, None]
+    assert notes == [None, None, None, {"type": 'type is "date/default"'}]
@@ -51,3 +51,10 @@ def test_datetime_read_cell(format, source, target):
         assert cell == target
     if not format.startswith("fmt:"):
         assert recorded.list == []
+
+
+def test_datetime_read_column():
+    field = Field({"name": "name", "type": "datetime"})
+    cells, notes = field.read_column(["2014-01-01T06:00:00Z", "", "2014-01-01T06:00:00"])
+    assert cells == [datetime(2014, 1, 1, 6), None, None]
+    assert notes == [None, None, {"type": 'type is "datetime/default"'}]
@@ -30,3 +30,10 @@ def test_integer_read_cell(format, source, target, options):
     field = Field(descriptor)
     cell, notes = field.read_cell(source)
     assert cell == target
+
+
+def test_integer_read_column():
+    field = Field({"name": "name", "type": "integer"})
+    cells, notes = field.read_column(["1", "", "3.14", "-2"])
+    assert cells == [1, None, None, -2]
+    assert notes == [None, None, {"type": 'type is "integer/default"'}, None]
@@ -90,3 +90,10 @@ def test_number_read_cell(format, source, target, options):
     field = Field(descriptor)
     cell, notes = field.read_cell(source)
     assert cell == target
+
+
+def test_number_read_column():
+    field = Field({"name": "name", "type": "number"})
+    cells, notes = field.read_column(["1", "", "10.50", "bad"])
+    assert cells == [Decimal(1), None, Decimal("10.50"), None]
+    assert notes == [None, None, None, {"type": 'type is "number/default"'}]
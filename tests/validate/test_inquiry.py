@@ -1,4 +1,6 @@
 import pytest
+import responses
+from importlib import import_module
 from frictionless import validate
 
 
@@ -18,6 +20,13 @@ def test_validate_multiple():
     assert report.valid
 
 
+@pytest.mark.ci
+def test_validate_multiple_with_workers():
+    task = {"source": "data/table.csv", "workers": 2}
+    report = validate({"tasks": [task, task]})
+    assert report.valid
+
+
 @pytest.mark.ci
 def test_validate_multiple_invalid():
     report = validate(
@@ -101,3 +110,38 @@ def test_validate_with_multiple_packages():
         [3, 3, None, "primary-key-error"],
         [4, 4, None, "blank-row"],
     ]
+
+
+# Parallel
+
+
+@responses.activate
+def test_validate_remote_tasks_in_threads(monkeypatch):
+    with open("data/table.csv", "rb") as file:
+        body = file.read()
+    urls = [f"https://example.com/table{number}.csv" for number in range(4)]
+    for url in urls:
+        responses.add(responses.GET, url, body=body)
+    module = import_module("frictionless.validate.inquiry")
+    monkeypatch.setattr(module, "Pool", None)
+    report = validate({"tasks": [{"source": url} for url in urls]}, workers=2)
+    assert report.valid
+    assert [table.path for table in report.tables] == urls
+
+
+@pytest.mark.ci
+@responses.activate
+def test_validate_remote_and_local_tasks_keep_order():
+    with open("data/invalid.csv", "rb") as file:
+        body = file.read()
+    responses.add(responses.GET, "https://example.com/invalid.csv", body=body)
+    tasks = [
+        {"source": "https://example.com/invalid.csv", "limitErrors": 1},
+        {"source": "data/table.csv"},
+        {"source": "data/invalid.csv", "limitErrors": 1},
+    ]
+    report = validate({"tasks": tasks}, workers=2)
+    assert report.flatten(["tablePosition", "code"]) == [
+        [1, "blank-header"],
+        [3, "blank-header"],
+    ]
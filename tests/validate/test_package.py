@@ -2,7 +2,7 @@ import json
 import pytest
 import pathlib
 from copy import deepcopy
-from frictionless import validate
+from frictionless import validate, config
 
 
 # General
@@ -290,6 +290,17 @@ def test_validate_foreign_key_internal_resource_violation():
     ]
 
 
+@pytest.mark.ci
+def test_validate_foreign_key_internal_resource_violation_big_lookup(monkeypatch):
+    monkeypatch.setattr(config, "DEFAULT_INDEX_SIZE", 2)
+    descriptor = deepcopy(DESCRIPTOR_FK)
+    del descriptor["resources"][1]["data"][4]
+    report = validate(descriptor)
+    assert report.flatten(["rowPosition", "fieldPosition", "code"]) == [
+        [5, None, "foreign-key-error"],
+    ]
+
+
 @pytest.mark.ci
 def test_validate_foreign_key_internal_resource_violation_non_existent():
     descriptor = deepcopy(DESCRIPTOR_FK)
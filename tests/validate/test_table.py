@@ -1,3 +1,4 @@
+import importlib
 import pytest
 import pathlib
 from frictionless import validate, Check, Query, errors
@@ -922,6 +923,209 @@ def test_validate_foreign_key_error_invalid():
     ]
 
 
+# Parallel
+
+
+def test_validate_parallel():
+    report = validate("data/invalid.csv", workers=2)
+    assert report.flatten(["rowPosition", "fieldPosition", "code"]) == [
+        [None, 3, "blank-header"],
+        [None, 4, "duplicate-header"],
+        [2, 3, "missing-cell"],
+        [2, 4, "missing-cell"],
+        [3, 3, "missing-cell"],
+        [3, 4, "missing-cell"],
+        [4, None, "blank-row"],
+        [5, 5, "extra-cell"],
+    ]
+
+
+def test_validate_parallel_multiline_records(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "w") as file:
+        file.write("id,name\n")
+        for number in range(1, 101):
+            name = '"multi\nline"' if number % 10 else "bad,extra"
+            file.write("%s,%s\n" % (number if number % 7 else "bad", name))
+    report = validate(source, checksum={"rows": 100}, workers=4)
+    assert report.flatten(["rowPosition", "rowNumber", "code"]) == (
+        validate(source, checksum={"rows": 100}).flatten(
+            ["rowPosition", "rowNumber", "code"]
+        )
+    )
+    assert report.table.stats["rows"] == 100
+
+
+def test_validate_parallel_with_limit_errors():
+    report = validate("data/invalid.csv", limit_errors=3, workers=2)
+    assert report.table.partial
+    assert report.flatten(["rowPosition", "fieldPosition", "code"]) == [
+        [None, 3, "blank-header"],
+        [None, 4, "duplicate-header"],
+        [2, 3, "missing-cell"],
+    ]
+
+
+def test_validate_parallel_checksum():
+    checksum = {"hash": "6c2c61dd9b0e9c6876139a449ed87933", "bytes": 30, "rows": 2}
+    report = validate("data/table.csv", checksum=checksum, workers=2)
+    assert report.valid
+
+
+def test_validate_parallel_stateful_checks(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "w") as file:
+        file.write("id,name,temperature\n")
+        for number in range(1, 201):
+            temperature = 1000 if number == 120 else number % 10
+            line = "%s,name%s,%s\n" % (number, number, temperature)
+            file.write(line if number % 40 else "1,name1,1\n")
+    extra_checks = [
+        "duplicate-row",
+        ("sequential-value", {"fieldName": "id"}),
+        ("deviated-value", {"fieldName": "temperature"}),
+    ]
+    report = validate(source, extra_checks=extra_checks, workers=4)
+    assert report.flatten(["rowPosition", "rowNumber", "code", "message", "cells"]) == (
+        validate(source, extra_checks=extra_checks).flatten(
+            ["rowPosition", "rowNumber", "code", "message", "cells"]
+        )
+    )
+    assert report.flatten(["code"]).count(["duplicate-row"]) == 5
+
+
+def test_validate_parallel_primary_key_and_unique(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "w") as file:
+        file.write("id,name\n")
+        for number in range(1, 201):
+            file.write("%s,name%s\n" % (number % 150, number % 170))
+    schema = {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "name", "type": "string", "constraints": {"unique": True}},
+        ],
+        "primaryKey": "id",
+    }
+    report = validate(source, schema=schema, workers=4)
+    assert report.flatten(["rowPosition", "rowNumber", "code", "message", "cells"]) == (
+        validate(source, schema=schema).flatten(
+            ["rowPosition", "rowNumber", "code", "message", "cells"]
+        )
+    )
+    assert report.flatten(["code"]).count(["primary-key-error"]) == 50
+    assert report.flatten(["code"]).count(["unique-error"]) == 30
+
+
+def test_validate_primary_key_and_unique_spilled_index(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "w") as file:
+        file.write("id,name\n")
+        for number in range(1, 201):
+            file.write("%s,name%s\n" % (number % 150, number % 170))
+    schema = {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "name", "type": "string", "constraints": {"unique": True}},
+        ],
+        "primaryKey": "id",
+    }
+    fields = ["rowPosition", "rowNumber", "code", "message", "cells"]
+    expect = validate(source, schema=schema).flatten(fields)
+    report = validate(source, schema=schema, index_size=10)
+    assert report.flatten(fields) == expect
+    report = validate(source, schema=schema, index_size=10, workers=4)
+    assert report.flatten(fields) == expect
+    report = validate(source, schema=schema, index_size=10, index_hashed=False)
+    assert report.flatten(fields) == expect
+    report = validate(source, schema=schema, index_hashed=True)
+    assert report.flatten(fields) == expect
+
+
+def test_validate_parallel_more_chunks_than_workers(tmpdir, monkeypatch):
+    module = importlib.import_module("frictionless.validate.table")
+    monkeypatch.setattr(module, "PARALLEL_CHUNKS_PER_WORKER", 100)
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "w") as file:
+        file.write("id,name\n")
+        for number in range(1, 2001):
+            file.write("%s,%s\n" % (number, "name" if number % 500 else ""))
+    schema = {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "name", "type": "string", "constraints": {"required": True}},
+        ]
+    }
+    report = validate(source, schema=schema, workers=2)
+    assert report.table.stats["rows"] == 2000
+    assert report.flatten(["rowPosition", "rowNumber", "code"]) == [
+        [501, 500, "constraint-error"],
+        [1001, 1000, "constraint-error"],
+        [1501, 1500, "constraint-error"],
+        [2001, 2000, "constraint-error"],
+    ]
+
+
+def test_validate_parallel_headers_false(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "w") as file:
+        for number in range(1, 30):
+            file.write("%s,%s\n" % (number, number * 2))
+    report = validate(source, headers=False, checksum={"rows": 29}, workers=3)
+    assert report.valid
+    assert report.table.stats["rows"] == 29
+
+
+def test_validate_parallel_numeric_header(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "w") as file:
+        file.write("2019,2020\n")
+        for number in range(1, 30):
+            file.write("%s,%s\n" % (number, "bad" if number == 20 else number))
+    report = validate(source, workers=3)
+    assert report.table.stats["rows"] == validate(source).table.stats["rows"]
+    assert report.flatten(["rowPosition", "rowNumber", "code"]) == (
+        validate(source).flatten(["rowPosition", "rowNumber", "code"])
+    )
+
+
+def test_validate_parallel_foreign_keys(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "w") as file:
+        file.write("id,name\n")
+        for number in range(1, 101):
+            file.write("%s,name%s\n" % (number % 40, number))
+    schema = {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "name", "type": "string"},
+        ],
+        "foreignKeys": [
+            {"fields": "id", "reference": {"resource": "ids", "fields": "id"}}
+        ],
+    }
+    lookup = {"ids": {("id",): set((number,) for number in range(1, 40))}}
+    report = validate(source, schema=schema, lookup=lookup, workers=4)
+    assert report.flatten(["rowPosition", "rowNumber", "code"]) == [
+        [41, 40, "foreign-key-error"],
+        [81, 80, "foreign-key-error"],
+    ]
+
+
+def test_validate_parallel_encoding_error(tmpdir):
+    source = str(tmpdir.join("table.csv"))
+    with open(source, "wb") as file:
+        file.write(b"id,name\n")
+        for number in range(1, 2000):
+            file.write(b"%d,name\n" % number)
+        file.write(b"2000,\xff\xfe\n")
+    report = validate(source, encoding="utf-8", workers=2)
+    assert report.flatten(["code"]) == [["encoding-error"]]
+    assert report.flatten(["code"]) == validate(source, encoding="utf-8").flatten(
+        ["code"]
+    )
+
+
 # Issues
 
 